@@ -1,104 +1,39 @@
 #include <pyrbd_core/availability/mcs.hpp>
 #include <algorithm>
-#include <chrono>
 #include <omp.h>
 
 namespace pyrbd_core::mcs
 {
 
-    ProbaSets toProbaSet(NodeID src, NodeID dst, MinCutSets minCutSets)
-    {
-        // Remove {src} and {dst}
-        minCutSets.erase(
-            std::remove(minCutSets.begin(), minCutSets.end(), std::vector<int>{src}),
-            minCutSets.end());
-        minCutSets.erase(
-            std::remove(minCutSets.begin(), minCutSets.end(), std::vector<int>{dst}),
-            minCutSets.end());
-
-        if (minCutSets.empty())
-            return {};
+    namespace {
 
-        // Inverse the minimal cut sets
-        for (auto& set : minCutSets)
-            std::transform(set.begin(), set.end(), set.begin(), [](int x) { return -x; });
-
-        ProbaSets probaSets;
-        probaSets.reserve(minCutSets.size() * 3);
-
-        while (minCutSets.size() > 0)
+        // Drop {src} and {dst} and negate the remaining cut sets (a term
+        // of the unavailability is the failure of every node in a cut)
+        std::vector<Set> failureSets(NodeID src, NodeID dst, MinCutSets minCutSets)
         {
-            if (minCutSets.size() == 1)
-            {
-                probaSets.push_back(minCutSets[0]);
-                break;
-            }
-
-            Set selectedSet = minCutSets.front();
-            probaSets.push_back(selectedSet);
-
-            std::vector<std::vector<int>> remainingSets(minCutSets.begin() + 1, minCutSets.end());
-            minCutSets.clear();
-
-            for (const auto& set : remainingSets)
-            {
-                DisjointSets disjointSets = makeDisjointSet(selectedSet, set);
-                minCutSets.insert(minCutSets.end(), disjointSets.begin(), disjointSets.end());
-            }
+            minCutSets.erase(
+                std::remove(minCutSets.begin(), minCutSets.end(), std::vector<int>{src}),
+                minCutSets.end());
+            minCutSets.erase(
+                std::remove(minCutSets.begin(), minCutSets.end(), std::vector<int>{dst}),
+                minCutSets.end());
+
+            for (auto& set : minCutSets)
+                std::transform(set.begin(), set.end(), set.begin(), [](int x) { return -x; });
+            return minCutSets;
         }
 
-        return probaSets;
+    } // anonymous namespace
+
+    ProbaSets toProbaSet(NodeID src, NodeID dst, MinCutSets minCutSets)
+    {
+        return disjointProducts(failureSets(src, dst, std::move(minCutSets)));
     }
 
     DebugInfo toProbaSetDebug(NodeID src, NodeID dst, MinCutSets minCutSets)
     {
         DebugInfo debugInfo;
-
-        minCutSets.erase(
-            std::remove(minCutSets.begin(), minCutSets.end(), std::vector<int>{src}),
-            minCutSets.end());
-        minCutSets.erase(
-            std::remove(minCutSets.begin(), minCutSets.end(), std::vector<int>{dst}),
-            minCutSets.end());
-
-        if (minCutSets.empty())
-            return debugInfo;
-
-        for (auto& set : minCutSets)
-            std::transform(set.begin(), set.end(), set.begin(), [](int x) { return -x; });
-
-        ProbaSets probaSets;
-        probaSets.reserve(minCutSets.size() * 3);
-        int iteration = 0;
-
-        while (minCutSets.size() > 0)
-        {
-            auto start = std::chrono::high_resolution_clock::now();
-
-            if (minCutSets.size() == 1)
-            {
-                probaSets.push_back(minCutSets[0]);
-                break;
-            }
-
-            const Set& selectedSet = minCutSets.front();
-            probaSets.push_back(selectedSet);
-
-            std::vector<std::vector<int>> remainingSets(minCutSets.begin() + 1, minCutSets.end());
-            minCutSets.clear();
-
-            for (const auto& set : remainingSets)
-            {
-                DisjointSets disjoint_sets = makeDisjointSet(selectedSet, set);
-                minCutSets.insert(minCutSets.end(), disjoint_sets.begin(), disjoint_sets.end());
-            }
-
-            auto end = std::chrono::high_resolution_clock::now();
-            std::chrono::duration<double> duration = end - start;
-            debugInfo[iteration] = {static_cast<int>(probaSets.size()), duration.count()};
-            iteration++;
-        }
-
+        disjointProducts(failureSets(src, dst, std::move(minCutSets)), &debugInfo);
         return debugInfo;
     }
 
@@ -1,6 +1,5 @@
 #include <pyrbd_core/availability/pathset.hpp>
 #include <algorithm>
-#include <chrono>
 #include <omp.h>
 
 namespace pyrbd_core::pathset
@@ -8,71 +7,13 @@ namespace pyrbd_core::pathset
 
     ProbaSets toProbaSet(NodeID src, NodeID dst, PathSets pathSets)
     {
-        if (pathSets.empty())
-            return {};
-
-        ProbaSets probaSets;
-        probaSets.reserve(pathSets.size() * 3);
-
-        while (pathSets.size() > 0)
-        {
-            if (pathSets.size() == 1)
-            {
-                probaSets.push_back(pathSets[0]);
-                break;
-            }
-
-            Set selectedSet = pathSets.front();
-            probaSets.push_back(selectedSet);
-
-            std::vector<std::vector<int>> remainingSets(pathSets.begin() + 1, pathSets.end());
-            pathSets.clear();
-
-            for (const auto& set : remainingSets)
-            {
-                DisjointSets disjointSets = makeDisjointSet(selectedSet, set);
-                pathSets.insert(pathSets.end(), disjointSets.begin(), disjointSets.end());
-            }
-        }
-
-        return probaSets;
+        return disjointProducts(std::move(pathSets));
     }
 
     DebugInfo toProbaSetDebug(NodeID src, NodeID dst, PathSets pathSets)
     {
         DebugInfo debugInfo;
-        ProbaSets probaSets;
-        probaSets.reserve(pathSets.size() * 3);
-        int iteration = 0;
-
-        while (pathSets.size() > 0)
-        {
-            auto start = std::chrono::high_resolution_clock::now();
-
-            if (pathSets.size() == 1)
-            {
-                probaSets.push_back(pathSets[0]);
-                break;
-            }
-
-            Set selectedSet = pathSets.front();
-            probaSets.push_back(selectedSet);
-
-            std::vector<std::vector<int>> remainingSets(pathSets.begin() + 1, pathSets.end());
-            pathSets.clear();
-
-            for (const auto& set : remainingSets)
-            {
-                DisjointSets disjointSets = makeDisjointSet(selectedSet, set);
-                pathSets.insert(pathSets.end(), disjointSets.begin(), disjointSets.end());
-            }
-
-            auto end = std::chrono::high_resolution_clock::now();
-            std::chrono::duration<double> duration = end - start;
-            debugInfo[iteration] = {static_cast<int>(probaSets.size()), duration.count()};
-            iteration++;
-        }
-
+        disjointProducts(std::move(pathSets), &debugInfo);
         return debugInfo;
     }
 
@@ -1,5 +1,6 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
 #include <pyrbd_core/common.hpp>
 #include <pyrbd_core/sets.hpp>
 #include <pyrbd_core/availability/mcs.hpp>
@@ -58,6 +59,99 @@ namespace {
         return result;
     }
 
+    // Apply -1 offset to a set family in place (no copy)
+    SetFamily offsetFamilyOut(SetFamily family)
+    {
+        for (auto& v : family.elements) v -= 1;
+        return family;
+    }
+
+    // Apply -1 offsets to set families in place (no copy)
+    std::vector<SetFamily> offsetFamiliesOut(std::vector<SetFamily> families)
+    {
+        for (auto& family : families)
+            for (auto& v : family.elements) v -= 1;
+        return families;
+    }
+
+    // Apply -1 offset to a set family, returned as a list of sets
+    std::vector<Set> offsetFamilySetsOut(const SetFamily& family)
+    {
+        std::vector<Set> result;
+        result.reserve(family.size());
+        for (size_t i = 0; i < family.size(); ++i)
+        {
+            Set& s = result.emplace_back(family.begin(i), family.end(i));
+            for (auto& v : s) v -= 1;
+        }
+        return result;
+    }
+
+    // Apply -1 offset to set families, returned as lists of sets
+    std::vector<std::vector<Set>> offsetFamiliesSetsOut(const std::vector<SetFamily>& families)
+    {
+        std::vector<std::vector<Set>> result;
+        result.reserve(families.size());
+        for (const auto& family : families)
+            result.push_back(offsetFamilySetsOut(family));
+        return result;
+    }
+
+    // Apply +1 offset to a set family, returned as a list of sets
+    std::vector<Set> offsetFamilyIn(const SetFamily& family)
+    {
+        std::vector<Set> result;
+        result.reserve(family.size());
+        for (size_t i = 0; i < family.size(); ++i)
+        {
+            Set& s = result.emplace_back(family.begin(i), family.end(i));
+            for (auto& v : s) v += 1;
+        }
+        return result;
+    }
+
+    // Apply +1 offset to a list of set families
+    std::vector<std::vector<Set>> offsetFamiliesIn(const std::vector<SetFamily>& families)
+    {
+        std::vector<std::vector<Set>> result;
+        result.reserve(families.size());
+        for (const auto& family : families)
+            result.push_back(offsetFamilyIn(family));
+        return result;
+    }
+
+    // Minimal cut sets from internal (1-based) minimal paths; num_nodes <= 0
+    // takes the largest node on a path
+    py::object minimalcutsFromPaths(const sets::PathSets& paths, NodeID src, NodeID dst,
+                                    const std::string& method, int num_nodes, bool as_family,
+                                    bool parallel, sets::TransversalCache* cache, int max_order)
+    {
+        if (num_nodes <= 0)
+        {
+            num_nodes = std::max(toInternal(src), toInternal(dst));
+            for (const auto& path : paths)
+                for (NodeID node : path) num_nodes = std::max(num_nodes, node);
+        }
+        sets::MinCutSets result;
+        {
+            py::gil_scoped_release release;
+            result = sets::minimalcutsFromPaths(paths, toInternal(src), toInternal(dst), num_nodes,
+                                                method, parallel, cache, max_order);
+        }
+        if (as_family)
+            return py::cast(offsetFamilyOut(SetFamily::fromSets(result)));
+        return py::cast(offsetSetsOut(result));
+    }
+
+    // Read-only NumPy view of data owned by owner (no copy)
+    template <typename T>
+    py::array_t<T> arrayView(const std::vector<T>& data, py::handle owner)
+    {
+        py::array_t<T> view({data.size()}, {sizeof(T)}, data.data(), owner);
+        view.attr("setflags")(py::arg("write") = false);
+        return view;
+    }
+
     // Apply +1 offset to a probability map (keys only)
     std::map<int, double> offsetProbMapIn(const std::map<int, double>& m)
     {
@@ -100,6 +194,16 @@ namespace {
         return result;
     }
 
+    // Shift per-edge weights to line up with offsetAdjIn(adj)
+    sets::EdgeWeights offsetWeightsIn(const sets::EdgeWeights& weights)
+    {
+        sets::EdgeWeights result;
+        result.reserve(weights.size() + 1);
+        result.emplace_back();
+        result.insert(result.end(), weights.begin(), weights.end());
+        return result;
+    }
+
     // Apply +1 offset to a list of list of sets (e.g. pathsets_list for topo)
     std::vector<std::vector<Set>> offsetSetsListIn(const std::vector<std::vector<Set>>& sl)
     {
@@ -136,30 +240,174 @@ PYBIND11_MODULE(pyrbd_core_cpp, m)
         .def("isComplementary", &SDP::isComplementary)
         .def("getSet", &SDP::getSet, py::return_value_policy::reference_internal);
 
+    // ================================================================
+    // SetFamily binding (CSR set list, 0-based node IDs)
+    // ================================================================
+    py::class_<SetFamily>(m, "SetFamily")
+        .def(py::init(&SetFamily::fromSets), py::arg("sets"))
+        .def("__len__", &SetFamily::size)
+        .def_property_readonly("elements",
+            [](py::object self) { return arrayView(self.cast<const SetFamily&>().elements, self); },
+            "Flat int32 array of all set elements (read-only view)")
+        .def_property_readonly("offsets",
+            [](py::object self) { return arrayView(self.cast<const SetFamily&>().offsets, self); },
+            "int64 array; set i is elements[offsets[i]:offsets[i + 1]] (read-only view)")
+        .def("to_list", &SetFamily::toSets, "Convert to a list of lists");
+
     // ================================================================
     // Sets module (minimalpaths, minimalcuts)
     // ================================================================
     auto sets_mod = m.def_submodule("sets", "Sets discovery algorithms");
 
     sets_mod.def("minimalpaths",
-        [](const AdjList& adj, NodeID src, NodeID dst) {
-            AdjList adj_int = offsetAdjIn(adj);
-            auto result = sets::minimalpaths(adj_int, toInternal(src), toInternal(dst));
-            return offsetSetsOut(result);
+        [](const AdjList& adj, NodeID src, NodeID dst, bool parallel, bool as_family) -> py::object {
+            SetFamily result;
+            {
+                py::gil_scoped_release release;
+                result = sets::minimalpathsFamily(offsetAdjIn(adj), toInternal(src),
+                                                  toInternal(dst), parallel);
+            }
+            if (as_family)
+                return py::cast(offsetFamilyOut(std::move(result)));
+            return py::cast(offsetFamilySetsOut(result));
+        },
+        "Find all minimal paths between src and dst (DFS)",
+        py::arg("adj"), py::arg("src"), py::arg("dst"),
+        py::arg("parallel") = false, py::arg("as_family") = false);
+
+    sets_mod.def("minimalpaths_all_pairs",
+        [](const AdjList& adj, const NodePairs& node_pairs, bool as_family) -> py::object {
+            std::vector<SetFamily> result;
+            {
+                py::gil_scoped_release release;
+                result = sets::minimalpathsAllPairs(offsetAdjIn(adj), offsetPairsIn(node_pairs));
+            }
+            if (as_family)
+                return py::cast(offsetFamiliesOut(std::move(result)));
+            return py::cast(offsetFamiliesSetsOut(result));
+        },
+        "Find minimal paths for all given (src, dst) pairs (parallel)",
+        py::arg("adj"), py::arg("node_pairs"), py::arg("as_family") = false);
+
+    sets_mod.def("minimalpaths_from_source",
+        [](const AdjList& adj, NodeID src, bool as_family) -> py::object {
+            std::vector<SetFamily> result;
+            {
+                py::gil_scoped_release release;
+                result = sets::minimalpathsFromSource(offsetAdjIn(adj), toInternal(src));
+                // Internal index i holds the paths to external node i - 1
+                result.erase(result.begin());
+                result.resize(adj.size());
+            }
+            if (as_family)
+                return py::cast(offsetFamiliesOut(std::move(result)));
+            return py::cast(offsetFamiliesSetsOut(result));
+        },
+        "Find minimal paths from src to every node (indexed by destination)",
+        py::arg("adj"), py::arg("src"), py::arg("as_family") = false);
+
+    py::class_<sets::PathEnumerator>(sets_mod, "PathEnumerator")
+        .def(py::init([](const AdjList& adj, NodeID src, NodeID dst,
+                         size_t max_paths, size_t max_length, double time_budget,
+                         const sets::EdgeWeights& latency, double max_latency) {
+            return sets::PathEnumerator(offsetAdjIn(adj), toInternal(src), toInternal(dst),
+                                        max_paths, max_length, time_budget,
+                                        offsetWeightsIn(latency), max_latency);
+        }),
+        py::arg("adj"), py::arg("src"), py::arg("dst"),
+        py::arg("max_paths") = 0, py::arg("max_length") = 0, py::arg("time_budget") = 0.0,
+        py::arg("latency") = sets::EdgeWeights{}, py::arg("max_latency") = 0.0)
+        .def("next",
+            [](sets::PathEnumerator& self, size_t chunk_size) {
+                return offsetSetsOut(self.next(chunk_size));
+            },
+            "Produce up to chunk_size further paths (empty once finished)",
+            py::arg("chunk_size"),
+            py::call_guard<py::gil_scoped_release>())
+        .def("skip_remaining", &sets::PathEnumerator::skipRemaining,
+            "Run to the end without storing paths; returns the number skipped",
+            py::call_guard<py::gil_scoped_release>())
+        .def_property_readonly("finished", &sets::PathEnumerator::finished)
+        .def_property_readonly("exhausted", &sets::PathEnumerator::exhausted)
+        .def_property_readonly("produced", &sets::PathEnumerator::produced);
+
+    sets_mod.def("estimate_path_count",
+        [](const AdjList& adj, NodeID src, NodeID dst, size_t probes, std::uint64_t seed) {
+            auto est = sets::estimatePathCount(offsetAdjIn(adj), toInternal(src), toInternal(dst),
+                                               probes, seed);
+            return std::make_tuple(est.count, est.stdError, est.meanLength);
+        },
+        "Estimate the number of minimal paths: (count, std_error, mean_length)",
+        py::arg("adj"), py::arg("src"), py::arg("dst"),
+        py::arg("probes") = 64, py::arg("seed") = 0,
+        py::call_guard<py::gil_scoped_release>());
+
+    sets_mod.def("estimate_cut_count",
+        [](const SetFamily& path_sets, size_t probes, std::uint64_t seed) {
+            auto est = sets::estimateCutCount(offsetFamilyIn(path_sets), probes, seed);
+            return std::make_pair(est.count, est.stdError);
         },
-        "Find all minimal (simple) paths between src and dst",
-        py::arg("adj"), py::arg("src"), py::arg("dst"));
+        "Estimate the number of minimal cut sets of a path family: (count, std_error)",
+        py::arg("path_sets"), py::arg("probes") = 64, py::arg("seed") = 0,
+        py::call_guard<py::gil_scoped_release>());
+
+    sets_mod.def("estimate_cut_count",
+        [](const std::vector<Set>& path_sets, size_t probes, std::uint64_t seed) {
+            auto est = sets::estimateCutCount(offsetSetsIn(path_sets), probes, seed);
+            return std::make_pair(est.count, est.stdError);
+        },
+        py::arg("path_sets"), py::arg("probes") = 64, py::arg("seed") = 0,
+        py::call_guard<py::gil_scoped_release>());
+
+    py::class_<sets::TransversalCache>(sets_mod, "TransversalCache",
+        "Memo of subproblem cut families, shareable by minimalcuts calls on one graph")
+        .def(py::init<size_t>(), py::arg("max_bytes") = sets::TransversalCache::kDefaultMaxBytes)
+        .def("__len__", &sets::TransversalCache::size)
+        .def("clear", &sets::TransversalCache::clear)
+        .def_property_readonly("bytes", &sets::TransversalCache::bytes)
+        .def_property_readonly("max_bytes", &sets::TransversalCache::maxBytes)
+        .def_property_readonly("hits", &sets::TransversalCache::hits)
+        .def_property_readonly("misses", &sets::TransversalCache::misses);
 
     sets_mod.def("minimalcuts",
-        [](const AdjList& adj, NodeID src, NodeID dst, int num_nodes, const std::string& method) {
+        [](const AdjList& adj, NodeID src, NodeID dst, int num_nodes, const std::string& method,
+           bool as_family, bool parallel, sets::TransversalCache* cache, int max_order) -> py::object {
             AdjList adj_int = offsetAdjIn(adj);
-            auto result = sets::minimalcuts(adj_int, toInternal(src), toInternal(dst),
-                                            num_nodes, method);
-            return offsetSetsOut(result);
+            sets::MinCutSets result;
+            {
+                py::gil_scoped_release release;
+                result = sets::minimalcuts(adj_int, toInternal(src), toInternal(dst),
+                                           num_nodes, method, parallel, cache, max_order);
+            }
+            if (as_family)
+                return py::cast(offsetFamilyOut(SetFamily::fromSets(result)));
+            return py::cast(offsetSetsOut(result));
         },
         "Find minimal cut sets between src and dst",
         py::arg("adj"), py::arg("src"), py::arg("dst"),
-        py::arg("num_nodes"), py::arg("method") = "cnf_tree");
+        py::arg("num_nodes"), py::arg("method") = "cnf_tree", py::arg("as_family") = false,
+        py::arg("parallel") = false, py::arg("cache") = nullptr, py::arg("max_order") = 0);
+
+    sets_mod.def("minimalcuts_from_paths",
+        [](const SetFamily& path_sets, NodeID src, NodeID dst, const std::string& method, int num_nodes,
+           bool as_family, bool parallel, sets::TransversalCache* cache, int max_order) -> py::object {
+            return minimalcutsFromPaths(offsetFamilyIn(path_sets), src, dst, method, num_nodes,
+                                        as_family, parallel, cache, max_order);
+        },
+        "Find minimal cut sets between src and dst from their minimal paths",
+        py::arg("path_sets"), py::arg("src"), py::arg("dst"), py::arg("method") = "cnf_tree",
+        py::arg("num_nodes") = 0, py::arg("as_family") = false, py::arg("parallel") = false,
+        py::arg("cache") = nullptr, py::arg("max_order") = 0);
+
+    sets_mod.def("minimalcuts_from_paths",
+        [](const std::vector<Set>& path_sets, NodeID src, NodeID dst, const std::string& method, int num_nodes,
+           bool as_family, bool parallel, sets::TransversalCache* cache, int max_order) -> py::object {
+            return minimalcutsFromPaths(offsetSetsIn(path_sets), src, dst, method, num_nodes,
+                                        as_family, parallel, cache, max_order);
+        },
+        py::arg("path_sets"), py::arg("src"), py::arg("dst"), py::arg("method") = "cnf_tree",
+        py::arg("num_nodes") = 0, py::arg("as_family") = false, py::arg("parallel") = false,
+        py::arg("cache") = nullptr, py::arg("max_order") = 0);
 
     // ================================================================
     // MCS module
@@ -218,6 +466,39 @@ PYBIND11_MODULE(pyrbd_core_cpp, m)
         py::arg("node_pairs"), py::arg("probabilities"), py::arg("min_cut_sets_list"),
         py::call_guard<py::gil_scoped_release>());
 
+    // SetFamily overloads
+    mcs_mod.def("eval_avail",
+        [](NodeID src, NodeID dst, const std::map<int, double>& probabilities,
+           const SetFamily& min_cut_sets) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto sets_int = offsetFamilyIn(min_cut_sets);
+            return mcs::evalAvail(toInternal(src), toInternal(dst), probMap, sets_int);
+        },
+        py::arg("src"), py::arg("dst"), py::arg("probabilities"), py::arg("min_cut_sets"));
+
+    mcs_mod.def("eval_avail_topo",
+        [](const NodePairs& node_pairs, const std::map<int, double>& probabilities,
+           const std::vector<SetFamily>& min_cut_sets_list) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto pairs_int = offsetPairsIn(node_pairs);
+            auto sets_int = offsetFamiliesIn(min_cut_sets_list);
+            auto result = mcs::evalAvailTopo(pairs_int, probMap, sets_int);
+            return offsetTriplesOut(result);
+        },
+        py::arg("node_pairs"), py::arg("probabilities"), py::arg("min_cut_sets_list"));
+
+    mcs_mod.def("eval_avail_topo_parallel",
+        [](const NodePairs& node_pairs, const std::map<int, double>& probabilities,
+           const std::vector<SetFamily>& min_cut_sets_list) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto pairs_int = offsetPairsIn(node_pairs);
+            auto sets_int = offsetFamiliesIn(min_cut_sets_list);
+            auto result = mcs::evalAvailTopoParallel(pairs_int, probMap, sets_int);
+            return offsetTriplesOut(result);
+        },
+        py::arg("node_pairs"), py::arg("probabilities"), py::arg("min_cut_sets_list"),
+        py::call_guard<py::gil_scoped_release>());
+
     // ================================================================
     // Pathset module
     // ================================================================
@@ -275,6 +556,39 @@ PYBIND11_MODULE(pyrbd_core_cpp, m)
         py::arg("node_pairs"), py::arg("probabilities"), py::arg("pathsets_list"),
         py::call_guard<py::gil_scoped_release>());
 
+    // SetFamily overloads
+    pathset_mod.def("eval_avail",
+        [](NodeID src, NodeID dst, const std::map<int, double>& probabilities,
+           const SetFamily& path_sets) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto sets_int = offsetFamilyIn(path_sets);
+            return pathset::evalAvail(toInternal(src), toInternal(dst), probMap, sets_int);
+        },
+        py::arg("src"), py::arg("dst"), py::arg("probabilities"), py::arg("path_sets"));
+
+    pathset_mod.def("eval_avail_topo",
+        [](const NodePairs& node_pairs, const std::map<int, double>& probabilities,
+           const std::vector<SetFamily>& pathsets_list) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto pairs_int = offsetPairsIn(node_pairs);
+            auto sets_int = offsetFamiliesIn(pathsets_list);
+            auto result = pathset::evalAvailTopo(pairs_int, probMap, sets_int);
+            return offsetTriplesOut(result);
+        },
+        py::arg("node_pairs"), py::arg("probabilities"), py::arg("pathsets_list"));
+
+    pathset_mod.def("eval_avail_topo_parallel",
+        [](const NodePairs& node_pairs, const std::map<int, double>& probabilities,
+           const std::vector<SetFamily>& pathsets_list) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto pairs_int = offsetPairsIn(node_pairs);
+            auto sets_int = offsetFamiliesIn(pathsets_list);
+            auto result = pathset::evalAvailTopoParallel(pairs_int, probMap, sets_int);
+            return offsetTriplesOut(result);
+        },
+        py::arg("node_pairs"), py::arg("probabilities"), py::arg("pathsets_list"),
+        py::call_guard<py::gil_scoped_release>());
+
     // ================================================================
     // SDP module
     // ================================================================
@@ -342,4 +656,47 @@ PYBIND11_MODULE(pyrbd_core_cpp, m)
         "Evaluate availability for all node pairs using SDP (parallel)",
         py::arg("node_pairs"), py::arg("probabilities"), py::arg("pathsets_list"),
         py::call_guard<py::gil_scoped_release>());
+
+    // SetFamily overloads
+    sdp_mod.def("eval_avail",
+        [](NodeID src, NodeID dst, const std::map<int, double>& probabilities,
+           const SetFamily& path_sets) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto sets_int = offsetFamilyIn(path_sets);
+            return sdp::evalAvail(toInternal(src), toInternal(dst), probMap, sets_int);
+        },
+        py::arg("src"), py::arg("dst"), py::arg("probabilities"), py::arg("path_sets"));
+
+    sdp_mod.def("eval_avail_parallel",
+        [](NodeID src, NodeID dst, const std::map<int, double>& probabilities,
+           const SetFamily& path_sets) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto sets_int = offsetFamilyIn(path_sets);
+            return sdp::evalAvailParallel(toInternal(src), toInternal(dst), probMap, sets_int);
+        },
+        py::arg("src"), py::arg("dst"), py::arg("probabilities"), py::arg("path_sets"),
+        py::call_guard<py::gil_scoped_release>());
+
+    sdp_mod.def("eval_avail_topo",
+        [](const NodePairs& node_pairs, const std::map<int, double>& probabilities,
+           const std::vector<SetFamily>& pathsets_list) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto pairs_int = offsetPairsIn(node_pairs);
+            auto sets_int = offsetFamiliesIn(pathsets_list);
+            auto result = sdp::evalAvailTopo(pairs_int, probMap, sets_int);
+            return offsetTriplesOut(result);
+        },
+        py::arg("node_pairs"), py::arg("probabilities"), py::arg("pathsets_list"));
+
+    sdp_mod.def("eval_avail_topo_parallel",
+        [](const NodePairs& node_pairs, const std::map<int, double>& probabilities,
+           const std::vector<SetFamily>& pathsets_list) {
+            ProbabilityMap probMap(offsetProbMapIn(probabilities));
+            auto pairs_int = offsetPairsIn(node_pairs);
+            auto sets_int = offsetFamiliesIn(pathsets_list);
+            auto result = sdp::evalAvailTopoParallel(pairs_int, probMap, sets_int);
+            return offsetTriplesOut(result);
+        },
+        py::arg("node_pairs"), py::arg("probabilities"), py::arg("pathsets_list"),
+        py::call_guard<py::gil_scoped_release>());
 }
@@ -1,40 +1,113 @@
 #include <pyrbd_core/common.hpp>
 #include <algorithm>
+#include <chrono>
 
 namespace pyrbd_core
 {
     DisjointSets makeDisjointSet(const Set& set1, Set set2)
     {
-        // RC set: elements in set1 but not in set2
-        Set RC;
+        DisjointSets result;
+        appendDisjointSets(set1, std::move(set2), result);
+        return result;
+    }
 
-        // Check if set1 and set2 are disjoint: if x in set1 and -x in set2
-        for (const int& elem : set1)
+    void appendDisjointSets(const Set& set1, Set&& set2, DisjointSets& out)
+    {
+        // RC: elements in set1 but not in set2. set1 and set2 are already
+        // disjoint if x in set1 and -x in set2.
+        const auto begin = set2.begin(), end = set2.end();
+        size_t rc = 0;
+        for (int elem : set1)
         {
-            if (std::find(set2.begin(), set2.end(), -elem) != set2.end())
+            if (std::find(begin, end, -elem) != end)
             {
-                return {set2};
-            }
-            if (std::find(set2.begin(), set2.end(), elem) == set2.end())
-            {
-                RC.push_back(elem);
+                out.push_back(std::move(set2));
+                return;
             }
+            if (std::find(begin, end, elem) == end)
+                ++rc;
         }
+        if (rc == 0)
+            return;
 
-        if (RC.empty())
+        // Progressively append -RC[i]; the last product takes set2 itself
+        const size_t size = set2.size();
+        set2.reserve(size + rc);
+        for (int elem : set1)
         {
-            return DisjointSets{};
+            if (std::find(set2.begin(), set2.begin() + size, elem) != set2.begin() + size)
+                continue;
+            set2.push_back(-elem);
+            if (--rc == 0)
+            {
+                out.push_back(std::move(set2));
+                return;
+            }
+            out.push_back(set2);
+            set2.back() = elem;
         }
+    }
 
-        DisjointSets result;
+    ProbaSets disjointProducts(std::vector<Set> sets, DebugInfo* debug)
+    {
+        ProbaSets probaSets;
+        probaSets.reserve(sets.size() * 3);
 
-        for (size_t i = 0; i < RC.size(); i++)
+        std::vector<Set> next;
+        next.reserve(sets.size());
+        int iteration = 0;
+        while (!sets.empty())
         {
-            set2.push_back(-RC[i]);
-            result.push_back(set2);
-            set2.back() = -set2.back();
+            auto start = std::chrono::high_resolution_clock::now();
+
+            if (sets.size() == 1)
+            {
+                probaSets.push_back(std::move(sets.front()));
+                break;
+            }
+
+            const Set& selectedSet = sets.front();
+            next.clear();
+            for (size_t i = 1; i < sets.size(); ++i)
+                appendDisjointSets(selectedSet, std::move(sets[i]), next);
+            probaSets.push_back(std::move(sets.front()));
+            sets.swap(next);
+
+            if (debug)
+            {
+                std::chrono::duration<double> duration = std::chrono::high_resolution_clock::now() - start;
+                (*debug)[iteration++] = {static_cast<int>(probaSets.size()), duration.count()};
+            }
         }
+        return probaSets;
+    }
 
-        return result;
+    void SetFamily::append(const SetFamily& other)
+    {
+        const int64_t shift = static_cast<int64_t>(elements.size());
+        elements.insert(elements.end(), other.elements.begin(), other.elements.end());
+        offsets.reserve(offsets.size() + other.size());
+        for (size_t i = 1; i < other.offsets.size(); ++i)
+            offsets.push_back(other.offsets[i] + shift);
+    }
+
+    std::vector<Set> SetFamily::toSets() const
+    {
+        std::vector<Set> sets;
+        sets.reserve(size());
+        for (size_t i = 0; i < size(); ++i)
+            sets.emplace_back(begin(i), end(i));
+        return sets;
+    }
+
+    SetFamily SetFamily::fromSets(const std::vector<Set>& sets)
+    {
+        SetFamily family;
+        size_t total = 0;
+        for (const auto& s : sets) total += s.size();
+        family.elements.reserve(total);
+        family.offsets.reserve(sets.size() + 1);
+        for (const auto& s : sets) family.push_back(s);
+        return family;
     }
 } // namespace pyrbd_core
@@ -0,0 +1,93 @@
+#pragma once
+#include <array>
+#include <bit>
+#include <cstddef>
+#include <cstdint>
+
+namespace pyrbd_core::bits
+{
+    // ================================================================
+    // Fixed-width node bitsets
+    //
+    // Node IDs are mapped to bit positions directly (bit i ↔ node i).
+    // The word count W is a compile-time constant so that membership,
+    // union and subset tests unroll into a handful of word operations;
+    // callers pick W at runtime from the number of nodes.
+    // ================================================================
+
+    using Word = std::uint64_t;
+    inline constexpr size_t kWordBits = 64;
+
+    // Largest word count for which fixed-width kernels are instantiated
+    inline constexpr size_t kMaxWords = 8;
+
+    // Number of words needed to hold nbits bits
+    inline constexpr size_t wordsFor(size_t nbits)
+    {
+        return (nbits + kWordBits - 1) / kWordBits;
+    }
+
+    template <size_t W>
+    struct NodeBits
+    {
+        std::array<Word, W> w{};
+
+        void set(size_t i)   { w[i / kWordBits] |= Word(1) << (i % kWordBits); }
+        void reset(size_t i) { w[i / kWordBits] &= ~(Word(1) << (i % kWordBits)); }
+
+        bool test(size_t i) const
+        {
+            return (w[i / kWordBits] >> (i % kWordBits)) & Word(1);
+        }
+
+        NodeBits& operator|=(const NodeBits& other)
+        {
+            for (size_t i = 0; i < W; ++i) w[i] |= other.w[i];
+            return *this;
+        }
+
+        NodeBits operator|(const NodeBits& other) const
+        {
+            NodeBits result = *this;
+            result |= other;
+            return result;
+        }
+
+        bool operator==(const NodeBits& other) const { return w == other.w; }
+
+        bool intersects(const NodeBits& other) const
+        {
+            for (size_t i = 0; i < W; ++i)
+                if (w[i] & other.w[i]) return true;
+            return false;
+        }
+
+        // True if every bit of this is also set in other
+        bool isSubsetOf(const NodeBits& other) const
+        {
+            for (size_t i = 0; i < W; ++i)
+                if (w[i] & ~other.w[i]) return false;
+            return true;
+        }
+
+        int count() const
+        {
+            int c = 0;
+            for (size_t i = 0; i < W; ++i) c += std::popcount(w[i]);
+            return c;
+        }
+    };
+
+    // ================================================================
+    // Runtime-width helpers over flat word arrays (n words per set)
+    // ================================================================
+
+    // True if every bit of a is also set in b
+    inline bool isSubset(const Word* a, const Word* b, size_t n)
+    {
+        for (size_t i = 0; i < n; ++i)
+            if (a[i] & ~b[i]) return false;
+        return true;
+    }
+
+} // namespace pyrbd_core::bits
@@ -3,6 +3,7 @@
 #include <vector>
 #include <map>
 #include <algorithm>
+#include <cstdint>
 #include <tuple>
 
 namespace pyrbd_core
@@ -21,6 +22,41 @@ namespace pyrbd_core
     // Adjacency list: adj[u] = list of neighbours of u
     using AdjList = std::vector<std::vector<NodeID>>;
 
+    // ================================================================
+    // SetFamily
+    //
+    // Compressed sparse row (CSR) list of sets: all sets are stored back
+    // to back in one flat element array and set i spans
+    // elements[offsets[i] .. offsets[i + 1]). A family costs two
+    // allocations however many sets it holds, and both arrays can be
+    // handed to NumPy without copying.
+    // ================================================================
+    struct SetFamily
+    {
+        std::vector<int32_t> elements;
+        std::vector<int64_t> offsets{0};
+
+        size_t size() const { return offsets.size() - 1; }
+        bool empty() const { return offsets.size() == 1; }
+
+        const int32_t* begin(size_t i) const { return elements.data() + offsets[i]; }
+        const int32_t* end(size_t i) const { return elements.data() + offsets[i + 1]; }
+
+        void push_back(const Set& s)
+        {
+            elements.insert(elements.end(), s.begin(), s.end());
+            offsets.push_back(static_cast<int64_t>(elements.size()));
+        }
+
+        /**
+         * @brief Append all sets of other to this family.
+         */
+        void append(const SetFamily& other);
+
+        std::vector<Set> toSets() const;
+        static SetFamily fromSets(const std::vector<Set>& sets);
+    };
+
     // ================================================================
     // ProbabilityMap
     //
@@ -164,4 +200,21 @@ namespace pyrbd_core
      */
     DisjointSets makeDisjointSet(const Set& set1, Set set2);
 
+    /**
+     * @brief makeDisjointSet appending to out; set2 is moved into the last
+     * product (or kept as is when set1 and set2 are already disjoint).
+     */
+    void appendDisjointSets(const Set& set1, Set&& set2, DisjointSets& out);
+
+    /**
+     * @brief Sum of disjoint products of a set family.
+     *
+     * Each round takes the first set as a term and disjoints the remaining
+     * ones against it. The remaining sets move between two worklists
+     * reused across rounds, so no set is copied except for the extra
+     * products makeDisjointSet creates.
+     * @param debug If given, receives per-round {terms so far, seconds}.
+     */
+    ProbaSets disjointProducts(std::vector<Set> sets, DebugInfo* debug = nullptr);
+
 } // namespace pyrbd_core
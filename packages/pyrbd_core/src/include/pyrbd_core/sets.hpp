@@ -1,13 +1,20 @@
 #pragma once
 #include <pyrbd_core/common.hpp>
+#include <pyrbd_core/bitset.hpp>
+#include <chrono>
 #include <functional>
+#include <list>
+#include <memory>
+#include <mutex>
 #include <string>
+#include <unordered_map>
 
 namespace pyrbd_core::sets
 {
     // Convenience aliases
     using PathSets    = std::vector<Set>;
     using MinCutSets  = std::vector<Set>;
+    using EdgeWeights = std::vector<std::vector<double>>;  // weights[u][i] of edge u - adj[u][i]
 
     // ================================================================
     // Minimal paths (DFS)
@@ -22,9 +29,167 @@ namespace pyrbd_core::sets
      */
     PathSets minimalpaths(const AdjList& adj, NodeID src, NodeID dst);
 
+    /**
+     * @brief Parallel variant of minimalpaths (OpenMP).
+     * Splits the DFS on the first two hops from src and explores the
+     * resulting subtrees concurrently. Output order matches minimalpaths.
+     */
+    PathSets minimalpathsParallel(const AdjList& adj, NodeID src, NodeID dst);
+
+    /**
+     * @brief Variant of minimalpaths writing the paths to a CSR SetFamily.
+     * Avoids one heap allocation per path; same paths in the same order.
+     */
+    SetFamily minimalpathsFamily(const AdjList& adj, NodeID src, NodeID dst, bool parallel = false);
+
+    /**
+     * @brief Find minimal paths for many (src, dst) pairs in one call (OpenMP).
+     * The adjacency list is preprocessed once and pairs are distributed
+     * across threads.
+     * @return One path family per pair, in the order of nodePairs.
+     */
+    std::vector<SetFamily> minimalpathsAllPairs(const AdjList& adj, const NodePairs& nodePairs);
+
+    /**
+     * @brief Find minimal paths from src to every other node with one DFS.
+     * Every prefix explored by the DFS is a minimal path to its last node,
+     * so the families of all destinations are collected in a single run.
+     * Each family has the same order as minimalpaths(adj, src, dst).
+     * @return Path families indexed by destination node (empty for src and
+     * unreachable nodes).
+     */
+    std::vector<SetFamily> minimalpathsFromSource(const AdjList& adj, NodeID src);
+
+    // ================================================================
+    // PathEnumerator — resumable minimal path DFS
+    // ================================================================
+    class PathEnumerator
+    {
+    public:
+        /**
+         * @brief Prepare the DFS between src and dst. Paths are produced in
+         * the same order as minimalpaths(adj, src, dst).
+         * @param maxPaths Stop after this many paths (0 = no limit).
+         * @param maxLength Only produce paths with at most this many nodes (0 = no limit).
+         * @param timeBudget Stop once this many seconds have passed since
+         *                   construction (<= 0 = no limit).
+         * @param latency Symmetric per-edge latencies, shaped like adj.
+         * @param maxLatency Only produce paths whose summed edge latency is
+         *                   at most this (<= 0 = no limit).
+         *
+         * Both length and latency caps prune the DFS with lower bounds on
+         * the remaining distance to dst (BFS hops, Dijkstra latency).
+         */
+        PathEnumerator(AdjList adj, NodeID src, NodeID dst,
+                       size_t maxPaths = 0, size_t maxLength = 0, double timeBudget = 0.0,
+                       EdgeWeights latency = {}, double maxLatency = 0.0);
+
+        /**
+         * @brief Produce up to chunkSize further paths (empty once finished).
+         */
+        PathSets next(size_t chunkSize);
+
+        /**
+         * @brief Run the DFS to the end without storing paths.
+         * @return Number of paths skipped.
+         */
+        size_t skipRemaining();
+
+        /**
+         * @brief True if no more paths will be produced.
+         */
+        bool finished() const { return stopped_ || iterStack_.empty(); }
+
+        /**
+         * @brief True if the DFS ran to completion, i.e. every path within
+         * maxLength was produced and no path cap or time budget cut it short.
+         */
+        bool exhausted() const { return iterStack_.empty(); }
+
+        /**
+         * @brief Number of paths produced so far.
+         */
+        size_t produced() const { return produced_; }
+
+    private:
+        using Clock = std::chrono::steady_clock;
+
+        AdjList adj_;
+        NodeID dst_;
+        size_t maxPaths_;
+        size_t maxLength_;
+        bool hasDeadline_;
+        Clock::time_point deadline_;
+        EdgeWeights latency_;
+        double maxLatency_;
+
+        // Lower bounds on the distance from each node to dst
+        std::vector<size_t> hopsToDst_;
+        std::vector<double> latencyToDst_;
+
+        // DFS state (see minimalpaths.cpp for the forbidden counters)
+        std::vector<int> forbidden_;
+        std::vector<char> onPath_;
+        std::vector<NodeID> visited_;
+        std::vector<size_t> iterStack_;
+        std::vector<double> latencyStack_;  // latency of the path up to each visited node
+
+        size_t produced_ = 0;
+        bool stopped_ = false;
+
+        // Advance the DFS by up to limit paths, appending them to out if given
+        size_t advance(size_t limit, PathSets* out);
+        void updateForbidden(NodeID node, int delta);
+        bool admissible(NodeID current, size_t edge, NodeID child) const;
+    };
+
+    // ================================================================
+    // Family size estimators (Knuth random probes)
+    // ================================================================
+
+    struct CountEstimate
+    {
+        double count;     // estimated family size
+        double stdError;  // standard error of the estimate
+    };
+
+    struct PathCountEstimate
+    {
+        double count;      // estimated number of minimal paths
+        double stdError;   // standard error of the estimate
+        double meanLength; // estimated mean number of nodes per path
+    };
+
+    /**
+     * @brief Estimate the number of minimal paths between src and dst
+     * without enumerating them, from random probes of the DFS tree.
+     */
+    PathCountEstimate estimatePathCount(const AdjList& adj, NodeID src, NodeID dst,
+                                        size_t probes = 64, std::uint64_t seed = 0);
+
+    /**
+     * @brief Estimate the number of minimal cut sets (minimal transversals
+     * of pathSets, including {src} and {dst}) from random probes of the
+     * MMCS hitting-set tree.
+     */
+    CountEstimate estimateCutCount(const PathSets& pathSets, size_t probes = 64,
+                                   std::uint64_t seed = 0);
+
     // ================================================================
     // AbsorbList — maintains a family of sets where no set is
     // a subset/superset of another (absorption invariant).
+    //
+    // Every stored set is mirrored as a node bitset (bit i ↔ node i)
+    // in a popcount bucket, and small families are queried by scanning
+    // the bitsets of the buckets that can match. Once the family reaches
+    // kIndexThreshold sets it is also indexed, so queries only touch
+    // sets sharing elements with the new set:
+    //  - subset of X: a set-trie over the sorted elements, following
+    //    only children whose element is in X;
+    //  - supersets of X: an inverted index element → ids, scanning the
+    //    shortest posting list among the elements of X.
+    // Sets removed through the index are tombstoned and compacted once
+    // they outnumber live ones.
     // ================================================================
     class AbsorbList
     {
@@ -32,9 +197,11 @@ namespace pyrbd_core::sets
         AbsorbList() = default;
 
         /**
-         * @brief Insert a new set. Returns true if the family changed.
+         * @brief Insert a new set (non-negative elements). Returns true if
+         * the family changed.
          */
         bool add(const Set& s);
+        bool add(Set&& s);
 
         /**
          * @brief Batch insert multiple sets. Returns number of changes.
@@ -42,7 +209,7 @@ namespace pyrbd_core::sets
         int addMany(const std::vector<Set>& sets);
 
         /**
-         * @brief Return all stored sets.
+         * @brief Return all stored sets (sorted, by increasing size).
          */
         std::vector<Set> toSetList() const;
 
@@ -54,14 +221,128 @@ namespace pyrbd_core::sets
         void clear();
 
     private:
-        // Buckets keyed by set size
-        std::map<size_t, std::vector<Set>> buckets_;
+        using Id = std::uint32_t;
+
+        struct Bucket
+        {
+            std::vector<Set> sets;         // sorted elements
+            std::vector<bits::Word> bits;  // words_ words per set
+            std::vector<Id> ids;           // only once indexed
+        };
+
+        struct TrieNode
+        {
+            int elem;
+            Id terminal;            // id of the set ending here, or kNone
+            std::uint32_t parent;
+            std::uint32_t child;    // first child (children sorted by elem), 0 = none
+            std::uint32_t sibling;  // next sibling, 0 = none
+            std::uint32_t live;     // live sets ending in this subtree
+        };
+
+        // Buckets keyed by popcount (set size)
+        std::map<size_t, Bucket> buckets_;
+        size_t words_ = 1;
         size_t count_ = 0;
+        std::vector<bits::Word> scratch_;  // bitset of the set being added
+
+        // Indexes, built once the family grows (indexed_)
+        bool indexed_ = false;
+        std::vector<TrieNode> trie_;          // trie_[0] is the root
+        std::vector<std::uint32_t> idNode_;   // id → trie node where it ends
+        std::vector<std::vector<Id>> index_;  // element → ids (may hold dead ones)
+        std::vector<std::uint32_t> idSize_;
+        std::vector<bits::Word> idBits_;      // words_ words per id
+        std::vector<char> alive_;
+        size_t dead_ = 0;
+
+        bool hasSubsetOf(const Set& s) const;
+        void removeSupersetsOf(const Set& s);
+        bool trieHasSubset(std::uint32_t node) const;
+        void trieInsert(const Set& s, Id id);
+        void trieErase(Id id);
+        void indexInsert(const Set& s, const bits::Word* words, Id id);
+        void buildIndex();
+        void widen(size_t words);
+    };
+
+    // ================================================================
+    // TransversalCache — memo of minimal transversals (cut families)
+    // of clause families, keyed by a 128-bit fingerprint of the family.
+    //
+    // The fingerprint sums per-clause hashes, so it is the same for any
+    // order of the clauses and costs one pass over them (no sorting).
+    // The minimal transversals of a family only depend on the family
+    // itself, not on the pair it was derived from, so one cache can be
+    // shared by every subproblem of a decision tree and by all pairs of
+    // a topology (node IDs must refer to the same graph). Entries are
+    // evicted least recently used first once their total size exceeds
+    // maxBytes. All members are thread-safe.
+    // ================================================================
+    class TransversalCache
+    {
+    public:
+        using Family = std::vector<Set>;
+
+        struct Fingerprint
+        {
+            std::uint64_t lo, hi;
+            bool operator==(const Fingerprint&) const = default;
+        };
+
+        static constexpr size_t kDefaultMaxBytes = size_t(256) << 20;
+
+        /**
+         * @param maxBytes Memory cap of the stored entries (0 = store nothing).
+         */
+        explicit TransversalCache(size_t maxBytes = kDefaultMaxBytes) : maxBytes_(maxBytes) {}
 
-        // Internal helpers
-        void addInternal(const Set& s);
-        void discardInternal(const Set& s);
-        static bool isSubsetSorted(const Set& a, const Set& b);
+        /**
+         * @brief Fingerprint of a family of sorted, distinct clauses
+         * (independent of the clause order).
+         * @param variant Distinguishes results computed under different
+         *                settings for the same family (e.g. an order bound).
+         */
+        static Fingerprint fingerprint(const Family& clauses, std::uint64_t variant = 0);
+
+        /**
+         * @brief Cached transversals of the family, or nullptr.
+         */
+        std::shared_ptr<const Family> find(const Fingerprint& key);
+
+        /**
+         * @brief Store the transversals of the family, evicting old entries if needed.
+         */
+        void insert(const Fingerprint& key, Family transversals);
+
+        size_t size() const;
+        size_t bytes() const;
+        size_t maxBytes() const { return maxBytes_; }
+        size_t hits() const;
+        size_t misses() const;
+
+        void clear();
+
+    private:
+        struct KeyHash
+        {
+            size_t operator()(const Fingerprint& key) const { return static_cast<size_t>(key.lo); }
+        };
+
+        struct Entry
+        {
+            Fingerprint key;
+            std::shared_ptr<const Family> value;
+            size_t bytes;
+        };
+
+        const size_t maxBytes_;
+        mutable std::mutex mutex_;
+        std::list<Entry> lru_;  // most recently used first
+        std::unordered_map<Fingerprint, std::list<Entry>::iterator, KeyHash> map_;
+        size_t bytes_ = 0;
+        size_t hits_ = 0;
+        size_t misses_ = 0;
     };
 
     // ================================================================
@@ -75,18 +356,68 @@ namespace pyrbd_core::sets
      * @param dst Destination node.
      * @param num_nodes Total number of nodes in the graph.
      * @param method Algorithm to use: "cnf_tree", "shannon", "multiplication",
-     *               "combination", "combination_matrix".
+     *               "combination", "combination_matrix", "separators",
+     *               "dualize".
+     * @param parallel Use OpenMP (cnf_tree evaluates independent subtrees as
+     *                 tasks, shannon expands both branches as tasks,
+     *                 multiplication multiplies halves of the path
+     *                 family as tasks, combination_matrix splits its
+     *                 search by first node); other methods run
+     *                 sequentially.
+     * @param cache Memo of subproblem transversals shared across calls
+     *              (cnf_tree, shannon); nullptr = a private memo per call.
+     * @param max_order Only return cut sets with at most this many nodes
+     *                  (0 = no limit). Methods built on path products drop
+     *                  larger partial sets as they grow; the combination
+     *                  methods stop at this order; separators and dualize
+     *                  are filtered.
      * @return Minimal cut sets (including {src} and {dst}).
      */
     MinCutSets minimalcuts(const AdjList& adj, NodeID src, NodeID dst,
-                           int num_nodes, const std::string& method = "cnf_tree");
+                           int num_nodes, const std::string& method = "cnf_tree",
+                           bool parallel = false, TransversalCache* cache = nullptr,
+                           int max_order = 0);
+
+    /**
+     * @brief Minimal cut sets from an already enumerated minimal path
+     * family, so that path- and cut-based evaluations of one pair share a
+     * single DFS. Takes the same methods and options as minimalcuts()
+     * except "separators", which works on the graph.
+     * @param paths Minimal src-dst paths (node sequences including src and dst).
+     * @param num_nodes Largest node ID that may appear in paths.
+     */
+    MinCutSets minimalcutsFromPaths(const PathSets& paths, NodeID src, NodeID dst,
+                                    int num_nodes, const std::string& method = "cnf_tree",
+                                    bool parallel = false, TransversalCache* cache = nullptr,
+                                    int max_order = 0);
 
-    // Individual algorithm implementations
-    MinCutSets minimalcuts_cnf_tree(const AdjList& adj, NodeID src, NodeID dst, int num_nodes);
-    MinCutSets minimalcuts_shannon(const AdjList& adj, NodeID src, NodeID dst, int num_nodes);
-    MinCutSets minimalcuts_multiplication(const AdjList& adj, NodeID src, NodeID dst, int num_nodes);
-    MinCutSets minimalcuts_combination(const AdjList& adj, NodeID src, NodeID dst, int num_nodes, int order = -1);
-    MinCutSets minimalcuts_combination_matrix(const AdjList& adj, NodeID src, NodeID dst, int num_nodes, int order = -1);
+    // Individual algorithm implementations (all but separators start from
+    // the minimal path family)
+    MinCutSets minimalcuts_cnf_tree(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                    bool parallel = false, TransversalCache* cache = nullptr,
+                                    int max_order = 0);
+    MinCutSets minimalcuts_shannon(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                   int max_order = 0, bool parallel = false,
+                                   TransversalCache* cache = nullptr);
+    MinCutSets minimalcuts_multiplication(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                          int max_order = 0, bool parallel = false);
+    MinCutSets minimalcuts_combination(const PathSets& paths, NodeID src, NodeID dst, int num_nodes, int order = -1);
+    MinCutSets minimalcuts_combination_matrix(const PathSets& paths, NodeID src, NodeID dst, int num_nodes, int order = -1,
+                                              bool parallel = false);
+
+    /**
+     * @brief Minimal src-dst vertex separators listed from the graph
+     * itself (Kloks-Kratsch), without enumerating minimal paths.
+     */
+    MinCutSets minimalcuts_separators(const AdjList& adj, NodeID src, NodeID dst, int num_nodes,
+                                      int max_order = 0);
+
+    /**
+     * @brief Minimal transversals of the minimal path family by
+     * Fredman-Khachiyan dualisation (quasi-polynomial in the output).
+     */
+    MinCutSets minimalcuts_dualize(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                   int max_order = 0);
 
     // ================================================================
     // Internal helpers used by cut set algorithms
@@ -99,14 +430,19 @@ namespace pyrbd_core::sets
     std::pair<int, int> mostCommonElement(const std::vector<Set>& sets, int max_node);
 
     /**
-     * @brief Multiply (expand) a list of path sets into cut sets.
+     * @brief Multiply (expand) a list of path sets into cut sets, as a
+     * balanced product tree whose halves are merged with absorption.
+     * @param max_order Drop sets growing beyond this many elements (0 = no limit).
+     * @param parallel Multiply the halves as OpenMP tasks.
      */
-    std::vector<Set> multiplyPathsets(const std::vector<Set>& pathsets);
+    std::vector<Set> multiplyPathsets(const std::vector<Set>& pathsets, int max_order = 0,
+                                      bool parallel = false);
 
     /**
      * @brief Multiply partial sets with a factor set (absorption-aware).
+     * @param max_order Drop sets growing beyond this many elements (0 = no limit).
      */
     std::vector<Set> multiplyTwoPathsets(const std::vector<Set>& partial_set_list,
-                                          const Set& factor_set);
+                                          const Set& factor_set, int max_order = 0);
 
 } // namespace pyrbd_core::sets
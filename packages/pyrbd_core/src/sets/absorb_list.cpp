@@ -1,6 +1,6 @@
 #include <pyrbd_core/sets.hpp>
 #include <algorithm>
-#include <unordered_set>
+#include <limits>
 
 namespace pyrbd_core::sets
 {
@@ -8,74 +8,305 @@ namespace pyrbd_core::sets
     // AbsorbList — C++ port of Python AbsorbList
     //
     // Maintains a family of sets where no set is a subset or superset
-    // of another. Sets are stored sorted for efficient comparison.
+    // of another. Bitset scans are hard to beat on small families; on
+    // large ones the set-trie and the posting lists let a query touch
+    // only the stored sets that share elements with the new set.
     // ================================================================
 
-    // Check if sorted set a ⊆ sorted set b
-    bool AbsorbList::isSubsetSorted(const Set& a, const Set& b)
-    {
-        return std::includes(b.begin(), b.end(), a.begin(), a.end());
+    namespace {
+        constexpr size_t kIndexThreshold = 1024;
+        constexpr size_t kMinCompaction = 64;
+        constexpr size_t kPostingCost = 4;  // posting visit vs bitset test
+        constexpr std::uint32_t kNone = std::numeric_limits<std::uint32_t>::max();
+
+        void setBits(bits::Word* words, const Set& s)
+        {
+            for (int e : s)
+                words[e / bits::kWordBits] |= bits::Word(1) << (e % bits::kWordBits);
+        }
+
+        bool testBit(const bits::Word* words, int e)
+        {
+            return (words[e / bits::kWordBits] >> (e % bits::kWordBits)) & bits::Word(1);
+        }
     }
 
     bool AbsorbList::add(const Set& s)
     {
-        // Store sets sorted internally
-        Set sorted_s = s;
-        std::sort(sorted_s.begin(), sorted_s.end());
-        size_t m = sorted_s.size();
-
-        // Case 0: exact duplicate
-        auto it = buckets_.find(m);
-        if (it != buckets_.end())
+        return add(Set(s));
+    }
+
+    bool AbsorbList::add(Set&& s)
+    {
+        // Store sets sorted internally; callers usually pass them sorted
+        if (!std::is_sorted(s.begin(), s.end()))
+            std::sort(s.begin(), s.end());
+        s.erase(std::unique(s.begin(), s.end()), s.end());
+
+        if (!s.empty() && bits::wordsFor(s.back() + 1) > words_)
+            widen(bits::wordsFor(s.back() + 1));
+        scratch_.assign(words_, 0);
+        setBits(scratch_.data(), s);
+
+        // Case 1: an existing set (or exact duplicate) inside the new one → discard new
+        if (hasSubsetOf(s))
+            return false;
+
+        // Case 2: remove all existing supersets of the new one
+        removeSupersetsOf(s);
+
+        auto& bucket = buckets_[s.size()];
+        bucket.bits.insert(bucket.bits.end(), scratch_.begin(), scratch_.end());
+        if (indexed_)
+        {
+            Id id = static_cast<Id>(alive_.size());
+            alive_.push_back(1);
+            bucket.ids.push_back(id);
+            trieInsert(s, id);
+            indexInsert(s, scratch_.data(), id);
+        }
+        bucket.sets.push_back(std::move(s));
+        ++count_;
+
+        if (!indexed_ && count_ >= kIndexThreshold)
+            buildIndex();
+        return true;
+    }
+
+    bool AbsorbList::hasSubsetOf(const Set& s) const
+    {
+        if (indexed_)
+            return trieHasSubset(0);
+
+        const bits::Word* x = scratch_.data();
+        for (auto it = buckets_.begin(); it != buckets_.end() && it->first <= s.size(); ++it)
         {
-            for (const auto& existing : it->second)
+            const auto& bucket_bits = it->second.bits;
+            for (size_t off = 0; off < bucket_bits.size(); off += words_)
             {
-                if (existing == sorted_s)
-                    return false;
+                if (bits::isSubset(&bucket_bits[off], x, words_))
+                    return true;
             }
         }
+        return false;
+    }
+
+    void AbsorbList::removeSupersetsOf(const Set& s)
+    {
+        const bits::Word* x = scratch_.data();
+        size_t removed = 0;
 
-        // Case 1: if any existing set (smaller or equal) is a subset of new → discard new
-        for (const auto& [k, bucket] : buckets_)
+        // Every superset is in the posting list of each element of s; use
+        // the shortest one unless the larger buckets are smaller still
+        const std::vector<Id>* shortest = nullptr;
+        if (indexed_ && !s.empty())
         {
-            if (k > m) continue;
-            for (const auto& existing : bucket)
+            for (int e : s)
             {
-                if (isSubsetSorted(existing, sorted_s))
-                    return false; // existing ⊆ new → discard new
+                if (static_cast<size_t>(e) >= index_.size())
+                    return;
+                if (!shortest || index_[e].size() < shortest->size())
+                    shortest = &index_[e];
             }
+
+            size_t scanned = 0;
+            for (auto it = buckets_.upper_bound(s.size()); it != buckets_.end(); ++it)
+                scanned += it->second.sets.size();
+            if (scanned <= shortest->size() * kPostingCost)
+                shortest = nullptr;
         }
 
-        // Case 2: remove all existing supersets of the new one
-        std::vector<Set> to_remove;
-        for (const auto& [k, bucket] : buckets_)
+        if (shortest)
         {
-            if (k < m) continue;
-            for (const auto& existing : bucket)
+            // Tombstone the supersets; buckets drop them on compaction
+            for (Id id : *shortest)
             {
-                if (isSubsetSorted(sorted_s, existing))
-                    to_remove.push_back(existing);
+                if (alive_[id] && idSize_[id] > s.size() &&
+                    bits::isSubset(x, &idBits_[id * words_], words_))
+                {
+                    trieErase(id);
+                    ++removed;
+                }
             }
         }
+        else
+        {
+            // Scan the larger buckets, compacting each in place to keep
+            // insertion order
+            for (auto it = buckets_.upper_bound(s.size()); it != buckets_.end();)
+            {
+                auto& bucket = it->second;
+                size_t kept = 0;
+                for (size_t i = 0; i < bucket.sets.size(); ++i)
+                {
+                    const bits::Word* existing = &bucket.bits[i * words_];
+                    if (indexed_ && !alive_[bucket.ids[i]])
+                        continue;
+                    if (bits::isSubset(x, existing, words_))
+                    {
+                        if (indexed_)
+                            trieErase(bucket.ids[i]);
+                        ++removed;
+                        continue;
+                    }
+                    if (kept != i)
+                    {
+                        bucket.sets[kept] = std::move(bucket.sets[i]);
+                        std::copy_n(existing, words_, &bucket.bits[kept * words_]);
+                        if (indexed_)
+                            bucket.ids[kept] = bucket.ids[i];
+                    }
+                    ++kept;
+                }
 
-        for (const auto& rem : to_remove)
-            discardInternal(rem);
+                if (kept == 0)
+                {
+                    it = buckets_.erase(it);
+                    continue;
+                }
+                bucket.sets.resize(kept);
+                bucket.bits.resize(kept * words_);
+                if (indexed_)
+                    bucket.ids.resize(kept);
+                ++it;
+            }
+        }
 
-        addInternal(sorted_s);
-        return true;
+        count_ -= removed;
+        if (indexed_)
+        {
+            dead_ += removed;
+            if (dead_ >= kMinCompaction && dead_ > count_)
+                buildIndex();
+        }
+    }
+
+    bool AbsorbList::trieHasSubset(std::uint32_t node) const
+    {
+        // Follow only elements of the new set (scratch_)
+        if (trie_[node].terminal != kNone)
+            return true;
+        for (std::uint32_t c = trie_[node].child; c != 0; c = trie_[c].sibling)
+        {
+            if (trie_[c].live && testBit(scratch_.data(), trie_[c].elem) && trieHasSubset(c))
+                return true;
+        }
+        return false;
+    }
+
+    void AbsorbList::trieInsert(const Set& s, Id id)
+    {
+        std::uint32_t node = 0;
+        ++trie_[0].live;
+        for (int e : s)
+        {
+            // Find or insert the child for e, keeping siblings sorted
+            std::uint32_t prev = 0;
+            std::uint32_t c = trie_[node].child;
+            while (c != 0 && trie_[c].elem < e)
+            {
+                prev = c;
+                c = trie_[c].sibling;
+            }
+            if (c == 0 || trie_[c].elem != e)
+            {
+                std::uint32_t created = static_cast<std::uint32_t>(trie_.size());
+                trie_.push_back({e, kNone, node, 0, c, 0});
+                if (prev == 0)
+                    trie_[node].child = created;
+                else
+                    trie_[prev].sibling = created;
+                c = created;
+            }
+            node = c;
+            ++trie_[node].live;
+        }
+        trie_[node].terminal = id;
+        if (idNode_.size() <= id)
+            idNode_.resize(id + 1);
+        idNode_[id] = node;
+    }
+
+    void AbsorbList::indexInsert(const Set& s, const bits::Word* words, Id id)
+    {
+        if (!s.empty() && static_cast<size_t>(s.back()) >= index_.size())
+            index_.resize(s.back() + 1);
+        for (int e : s)
+            index_[e].push_back(id);
+        idSize_.push_back(static_cast<std::uint32_t>(s.size()));
+        idBits_.insert(idBits_.end(), words, words + words_);
+    }
+
+    void AbsorbList::trieErase(Id id)
+    {
+        alive_[id] = 0;
+        std::uint32_t node = idNode_[id];
+        trie_[node].terminal = kNone;
+        while (node != 0)
+        {
+            --trie_[node].live;
+            node = trie_[node].parent;
+        }
+        --trie_[0].live;
+    }
+
+    void AbsorbList::buildIndex()
+    {
+        // Drop dead sets from the buckets, renumber the live ones and
+        // rebuild the trie from them
+        trie_.assign(1, {-1, kNone, 0, 0, 0, 0});
+        idNode_.clear();
+        for (auto& postings : index_)
+            postings.clear();
+        idSize_.clear();
+        idBits_.clear();
+        Id next = 0;
+        for (auto it = buckets_.begin(); it != buckets_.end();)
+        {
+            auto& bucket = it->second;
+            size_t kept = 0;
+            for (size_t i = 0; i < bucket.sets.size(); ++i)
+            {
+                if (indexed_ && !alive_[bucket.ids[i]])
+                    continue;
+                if (kept != i)
+                {
+                    bucket.sets[kept] = std::move(bucket.sets[i]);
+                    std::copy_n(&bucket.bits[i * words_], words_, &bucket.bits[kept * words_]);
+                }
+                ++kept;
+            }
+            bucket.sets.resize(kept);
+            bucket.bits.resize(kept * words_);
+            bucket.ids.resize(kept);
+            for (size_t i = 0; i < kept; ++i)
+            {
+                bucket.ids[i] = next;
+                trieInsert(bucket.sets[i], next);
+                indexInsert(bucket.sets[i], &bucket.bits[i * words_], next++);
+            }
+            it = kept == 0 ? buckets_.erase(it) : std::next(it);
+        }
+
+        alive_.assign(next, 1);
+        dead_ = 0;
+        indexed_ = true;
     }
 
     int AbsorbList::addMany(const std::vector<Set>& sets)
     {
         // Sort by size first (insert smaller sets first to prune more)
-        std::vector<Set> sorted_sets = sets;
-        std::sort(sorted_sets.begin(), sorted_sets.end(),
-                  [](const Set& a, const Set& b) { return a.size() < b.size(); });
+        std::vector<const Set*> order;
+        order.reserve(sets.size());
+        for (const auto& s : sets)
+            order.push_back(&s);
+        std::stable_sort(order.begin(), order.end(),
+                         [](const Set* a, const Set* b) { return a->size() < b->size(); });
 
         int changed = 0;
-        for (const auto& s : sorted_sets)
+        for (const Set* s : order)
         {
-            if (add(s)) ++changed;
+            if (add(*s)) ++changed;
         }
         return changed;
     }
@@ -86,38 +317,32 @@ namespace pyrbd_core::sets
         result.reserve(count_);
         for (const auto& [_, bucket] : buckets_)
         {
-            for (const auto& s : bucket)
-                result.push_back(s);
+            for (size_t i = 0; i < bucket.sets.size(); ++i)
+            {
+                if (!indexed_ || alive_[bucket.ids[i]])
+                    result.push_back(bucket.sets[i]);
+            }
         }
         return result;
     }
 
     void AbsorbList::clear()
     {
-        buckets_.clear();
-        count_ = 0;
+        *this = AbsorbList();
     }
 
-    void AbsorbList::addInternal(const Set& s)
+    void AbsorbList::widen(size_t words)
     {
-        buckets_[s.size()].push_back(s);
-        ++count_;
-    }
-
-    void AbsorbList::discardInternal(const Set& s)
-    {
-        auto it = buckets_.find(s.size());
-        if (it == buckets_.end()) return;
-
-        auto& bucket = it->second;
-        auto pos = std::find(bucket.begin(), bucket.end(), s);
-        if (pos != bucket.end())
+        // Rebuild the bitsets with the wider stride
+        for (auto& [_, bucket] : buckets_)
         {
-            bucket.erase(pos);
-            --count_;
-            if (bucket.empty())
-                buckets_.erase(it);
+            bucket.bits.assign(bucket.sets.size() * words, 0);
+            for (size_t i = 0; i < bucket.sets.size(); ++i)
+                setBits(&bucket.bits[i * words], bucket.sets[i]);
         }
+        words_ = words;
+        if (indexed_)
+            buildIndex();
     }
 
 } // namespace pyrbd_core::sets
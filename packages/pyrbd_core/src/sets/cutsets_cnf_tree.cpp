@@ -1,159 +1,184 @@
 #include <pyrbd_core/sets.hpp>
 #include <algorithm>
 #include <queue>
-#include <memory>
+#include <set>
 #include <numeric>
+#include <omp.h>
 
 namespace pyrbd_core::sets
 {
     // ================================================================
     // CNF Decision Tree — C++ port of _cnf_decision_tree.py
+    //
+    // Subtrees are created when their parent is evaluated and destroyed
+    // as soon as their transversals are merged, so peak memory follows
+    // the depth of the tree rather than its size.
+    //
+    // The left and right subtrees of a node are independent until
+    // evaluateTwoLeaf merges them, so the parallel evaluation runs them
+    // as OpenMP tasks. Tasks are only spawned near the root and for
+    // nodes with enough clauses to outweigh the scheduling overhead.
+    //
+    // Different branches often reduce to the same residual clause family,
+    // so node transversals (without the branching element) are memoised
+    // in a TransversalCache keyed by the fingerprint of the clause family.
+    // Single clauses are cheaper to multiply out than to look up.
     // ================================================================
 
     namespace {
 
-        struct DecisionTreeNode
+        constexpr int kTaskMaxDepth = 16;
+        constexpr size_t kTaskMinClauses = 32;
+        constexpr size_t kMemoMinClauses = 2;
+
+        // Decision tree over a clause family, built and evaluated depth-first.
+        // A node splits its clauses between its two children and hands them
+        // over, so only the families waiting on the current branch and the
+        // transversals held for pending merges are alive at any time.
+        class DecisionTree
         {
-            std::vector<Set> value;   // CNF clauses
-            int max_val;
-            int most_common_value;    // -1 if none
-            std::vector<Set> evaluation;
-            std::unique_ptr<DecisionTreeNode> left;
-            std::unique_ptr<DecisionTreeNode> right;
-
-            DecisionTreeNode(std::vector<Set> val, int max_v, int mcv = -1)
-                : value(std::move(val)), max_val(max_v), most_common_value(mcv)
+        public:
+            DecisionTree(int max_val, TransversalCache& memo, int max_order = 0)
+                : max_val_(max_val), memo_(memo), max_order_(max_order)
             {
-                auto [common_elem, counts] = mostCommonElement(value, max_val);
+            }
 
-                if (counts > 1)
+            // Minimal transversals of clauses (the branching element of the
+            // node is added by its parent)
+            std::vector<Set> evaluate(std::vector<Set> clauses, bool parallel = false, int depth = 0)
+            {
+                // Only the clauses matter: their transversals are shared by
+                // every node (and pair) with the same family
+                const bool memoised = clauses.size() >= kMemoMinClauses;
+                TransversalCache::Fingerprint key{};
+                if (memoised)
                 {
-                    std::vector<Set> with_elem, without_elem;
-                    for (const auto& subset : value)
-                    {
-                        bool has = false;
-                        for (int e : subset)
-                            if (e == common_elem) { has = true; break; }
-
-                        if (has)
-                        {
-                            Set new_subset;
-                            for (int e : subset)
-                                if (e != common_elem) new_subset.push_back(e);
-                            with_elem.push_back(std::move(new_subset));
-                        }
-                        else
-                        {
-                            without_elem.push_back(subset);
-                        }
-                    }
-
-                    if (!without_elem.empty())
-                        left = std::make_unique<DecisionTreeNode>(std::move(without_elem), max_val);
-                    if (!with_elem.empty())
-                        right = std::make_unique<DecisionTreeNode>(std::move(with_elem), max_val, common_elem);
+                    key = TransversalCache::fingerprint(clauses, max_order_);
+                    if (auto hit = memo_.find(key))
+                        return *hit;
                 }
+
+                auto [common_elem, counts] = mostCommonElement(clauses, max_val_);
+                std::vector<Set> transversals = counts > 1
+                    ? evaluateChildren(std::move(clauses), common_elem, parallel, depth)
+                    : evaluateSelf(clauses, max_order_);
+
+                if (memoised)
+                    memo_.insert(key, transversals);
+                return transversals;
             }
 
-            void evaluate()
+        private:
+            int max_val_;
+            TransversalCache& memo_;
+            int max_order_;  // drop transversals larger than this (0 = keep all)
+
+            std::vector<Set> evaluateChildren(std::vector<Set> clauses, int common_elem,
+                                              bool parallel, int depth)
             {
-                if (!left && !right)
-                {
-                    if (evaluation.empty())
-                        evaluateSelf();
-                    return;
-                }
+                const bool spawn = parallel && depth < kTaskMaxDepth && clauses.size() >= kTaskMinClauses;
 
-                if (left && left->evaluation.empty())
-                    left->evaluate();
-                if (right && right->evaluation.empty())
-                    right->evaluate();
+                std::vector<Set> with_elem, without_elem;
+                for (auto& subset : clauses)
+                {
+                    bool has = false;
+                    for (int e : subset)
+                        if (e == common_elem) { has = true; break; }
 
-                const std::vector<Set>* left_eval = left ? &left->evaluation : nullptr;
-                const std::vector<Set>* right_eval = right ? &right->evaluation : nullptr;
+                    if (has)
+                    {
+                        Set new_subset;
+                        for (int e : subset)
+                            if (e != common_elem) new_subset.push_back(e);
+                        with_elem.push_back(std::move(new_subset));
+                    }
+                    else
+                    {
+                        without_elem.push_back(std::move(subset));
+                    }
+                }
+                std::vector<Set>().swap(clauses);
 
-                if ((!left_eval || left_eval->empty()) && (!right_eval || right_eval->empty()))
+                // The right child always exists (common_elem is in 2+ clauses)
+                const bool has_left = !without_elem.empty();
+                std::vector<Set> left_eval, right_eval;
+                if (spawn && has_left)
                 {
-                    if (evaluation.empty())
-                        evaluateSelf();
+                    #pragma omp task shared(left_eval, without_elem) firstprivate(depth)
+                    left_eval = evaluate(std::move(without_elem), true, depth + 1);
+                    right_eval = evaluate(std::move(with_elem), true, depth + 1);
+                    #pragma omp taskwait
                 }
-                else if (evaluation.empty())
+                else
                 {
-                    evaluateTwoLeaf(left_eval, right_eval);
+                    if (has_left)
+                        left_eval = evaluate(std::move(without_elem), parallel, depth + 1);
+                    right_eval = evaluate(std::move(with_elem), parallel, depth + 1);
                 }
+                right_eval.push_back({common_elem});
+
+                // Under max_order the left clauses may have no small enough
+                // transversal, and then neither has the whole family
+                if (has_left && left_eval.empty())
+                    return {};
+                return evaluateTwoLeaf(left_eval, right_eval, max_order_);
             }
 
-        private:
-            void evaluateSelf()
+            static std::vector<Set> evaluateSelf(const std::vector<Set>& clauses, int max_order)
             {
-                if (value.empty())
-                {
-                    evaluation.clear();
-                    return;
-                }
+                if (clauses.empty())
+                    return {};
 
                 // Start with singletons from first clause
                 std::vector<Set> final_eval;
-                for (int e : value[0])
+                for (int e : clauses[0])
                     final_eval.push_back({e});
 
                 // Multiply with remaining clauses
-                for (size_t i = 1; i < value.size(); ++i)
-                    final_eval = multiplyTwoPathsets(final_eval, value[i]);
+                for (size_t i = 1; i < clauses.size(); ++i)
+                    final_eval = multiplyTwoPathsets(final_eval, clauses[i], max_order);
 
-                if (most_common_value >= 0)
-                    final_eval.push_back({most_common_value});
-
-                evaluation = std::move(final_eval);
+                return final_eval;
             }
 
-            void evaluateTwoLeaf(const std::vector<Set>* left_eval,
-                                 const std::vector<Set>* right_eval)
+            static std::vector<Set> evaluateTwoLeaf(const std::vector<Set>& left_eval,
+                                                    const std::vector<Set>& right_eval,
+                                                    int max_order)
             {
                 AbsorbList final_eval;
 
-                if (most_common_value >= 0)
-                    final_eval.add({most_common_value});
-
-                if (!left_eval || left_eval->empty())
+                if (left_eval.empty())
                 {
-                    if (right_eval)
-                        final_eval.addMany(*right_eval);
-                    evaluation = final_eval.toSetList();
-                    return;
-                }
-
-                if (!right_eval || right_eval->empty())
-                {
-                    final_eval.addMany(*left_eval);
-                    evaluation = final_eval.toSetList();
-                    return;
+                    final_eval.addMany(right_eval);
+                    return final_eval.toSetList();
                 }
 
                 // Multiply left × right
-                for (const auto& l : *left_eval)
+                for (const auto& l : left_eval)
                 {
-                    for (const auto& r : *right_eval)
+                    for (const auto& r : right_eval)
                     {
                         Set new_set = l;
                         new_set.insert(new_set.end(), r.begin(), r.end());
                         std::sort(new_set.begin(), new_set.end());
                         // Remove duplicates
                         new_set.erase(std::unique(new_set.begin(), new_set.end()), new_set.end());
-                        final_eval.add(new_set);
+                        if (max_order > 0 && new_set.size() > static_cast<size_t>(max_order))
+                            continue;
+                        final_eval.add(std::move(new_set));
                     }
                 }
 
-                evaluation = final_eval.toSetList();
+                return final_eval.toSetList();
             }
         };
 
     } // anonymous namespace
 
-    MinCutSets minimalcuts_cnf_tree(const AdjList& adj, NodeID src, NodeID dst, int num_nodes)
+    MinCutSets minimalcuts_cnf_tree(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                    bool parallel, TransversalCache* cache, int max_order)
     {
-        // Get minimal paths
-        PathSets mps = minimalpaths(adj, src, dst);
+        PathSets mps = paths;
 
         // Direct connection
         if (mps.size() == 1 && mps[0].size() == 2 &&
@@ -166,8 +191,11 @@ namespace pyrbd_core::sets
         std::sort(mps.begin(), mps.end(),
                   [](const Set& a, const Set& b) { return a.size() < b.size(); });
 
-        // Remove src and dst from each path, convert to sets
+        // Remove src and dst from each path, convert to sets. Paths through
+        // the same nodes give one clause, so every tree node holds distinct
+        // clauses (as TransversalCache::fingerprint expects).
         std::vector<Set> pathsets;
+        std::set<Set> seen;
         for (auto& mp : mps)
         {
             Set ps;
@@ -177,16 +205,30 @@ namespace pyrbd_core::sets
                     ps.push_back(node);
             }
             std::sort(ps.begin(), ps.end());
-            pathsets.push_back(std::move(ps));
+            if (seen.insert(ps).second)
+                pathsets.push_back(std::move(ps));
         }
 
         // Build decision tree and evaluate
-        DecisionTreeNode tree(pathsets, num_nodes);
-        tree.evaluate();
+        TransversalCache local;
+        TransversalCache& memo = cache ? *cache : local;
+
+        DecisionTree tree(num_nodes, memo, max_order);
+        std::vector<Set> evaluation;
+        if (parallel)
+        {
+            #pragma omp parallel
+            #pragma omp single
+            evaluation = tree.evaluate(std::move(pathsets), true);
+        }
+        else
+        {
+            evaluation = tree.evaluate(std::move(pathsets));
+        }
 
         // Sort results
         std::vector<Set> temp_result;
-        for (auto& s : tree.evaluation)
+        for (auto& s : evaluation)
         {
             std::sort(s.begin(), s.end());
             temp_result.push_back(std::move(s));
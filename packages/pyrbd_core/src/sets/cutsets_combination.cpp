@@ -1,161 +1,163 @@
 #include <pyrbd_core/sets.hpp>
+#include <pyrbd_core/bitset.hpp>
 #include <algorithm>
+#include <bit>
 #include <cmath>
-#include <unordered_set>
-#include <unordered_map>
-#include <numeric>
 
 namespace pyrbd_core::sets
 {
     // ================================================================
-    // Combination method — C++ port of _cutsets_combination.py
+    // Combination method — minimal hitting sets of the path family
     //
-    // Uses incidence matrix approach to find combinations of nodes
-    // that disconnect all paths.
+    // Instead of testing every node combination, cut sets are built by
+    // branching on an uncovered path (MMCS, Murakami & Uno, 2014): the
+    // uncovered path with the fewest candidate nodes is picked, and each
+    // of its candidates starts a child. A child is only entered if every
+    // chosen node still covers a path no other chosen node covers (its
+    // critical paths), so every partial set can grow into a minimal cut
+    // and every leaf with all paths covered is one. Candidates already
+    // tried at a node are withheld from later siblings, so each cut is
+    // generated once and the search grows with the output.
     // ================================================================
 
-    MinCutSets minimalcuts_combination(const AdjList& adj, NodeID src, NodeID dst,
-                                       int num_nodes, int order)
-    {
-        if (order < 0)
-            order = static_cast<int>(std::ceil(num_nodes / 2.0));
-
-        MinCutSets minimal;
-
-        // Get paths
-        PathSets paths = minimalpaths(adj, src, dst);
-        std::cout << "[DEBUG] Got " << paths.size() << " paths from minimalpaths." << std::endl;
-        for (size_t i = 0; i < paths.size(); ++i) {
-            std::cout << "[DEBUG] Path " << i << ":";
-            for (int n : paths[i]) std::cout << " " << n;
-            std::cout << std::endl;
-        }
+    namespace {
 
-        if (paths.size() == 1 && paths[0].size() == 2 &&
-            paths[0][0] == src && paths[0][1] == dst)
-        {
-            return {{src}, {dst}};
-        }
+        using bits::Word;
+        using Bits = std::vector<Word>;
 
-        // Build valid nodes (all nodes except src and dst)
-        std::vector<NodeID> valid_nodes;
-        for (int n = 1; n <= num_nodes; ++n)
+        class HittingSetSearch
         {
-            if (n != src && n != dst)
-                valid_nodes.push_back(n);
-        }
-
-        // Build incidence matrix: paths × valid_nodes
-        // incidence[p][n] = true if node n is in path p
-        size_t P = paths.size();
-        size_t N = valid_nodes.size();
-
-        std::unordered_map<int, size_t> node_to_col;
-        for (size_t i = 0; i < N; ++i)
-            node_to_col[valid_nodes[i]] = i;
-
-        std::vector<std::vector<bool>> incidence(P, std::vector<bool>(N, false));
-        for (size_t p = 0; p < P; ++p)
-        {
-            for (int node : paths[p])
+        public:
+            HittingSetSearch(const PathSets& paths, NodeID src, NodeID dst, size_t order)
+                : paths_(paths), words_(bits::wordsFor(paths.size())), order_(order)
             {
-                auto it = node_to_col.find(node);
-                if (it != node_to_col.end())
-                    incidence[p][it->second] = true;
+                NodeID max_node = std::max(src, dst);
+                for (const auto& path : paths)
+                    for (NodeID v : path) max_node = std::max(max_node, v);
+
+                pathsOf_.assign(max_node + 1, Bits(words_, 0));
+                cand_.assign(max_node + 1, 0);
+                for (size_t p = 0; p < paths.size(); ++p)
+                {
+                    for (NodeID v : paths[p])
+                    {
+                        if (v == src || v == dst)
+                            continue;
+                        pathsOf_[v][p / bits::kWordBits] |= Word(1) << (p % bits::kWordBits);
+                        cand_[v] = 1;
+                    }
+                }
             }
-        }
 
-        // Find order-1 cut sets (single nodes that are in ALL paths)
-        std::vector<NodeID> firstpairs;
-        for (size_t n = 0; n < N; ++n)
-        {
-            bool all_true = true;
-            for (size_t p = 0; p < P; ++p)
+            MinCutSets run()
             {
-                if (!incidence[p][n]) { all_true = false; break; }
+                Bits uncov(words_, ~Word(0));
+                if (paths_.size() % bits::kWordBits)
+                    uncov.back() = (Word(1) << (paths_.size() % bits::kWordBits)) - 1;
+
+                found_.clear();
+                chosen_.clear();
+                extend(uncov, {});
+                return std::move(found_);
             }
-            if (all_true)
-                minimal.push_back({valid_nodes[n]});
-            else
-                firstpairs.push_back(valid_nodes[n]);
-        }
 
-        std::cout << "[DEBUG] firstpairs.size() = " << firstpairs.size() << std::endl;
-        // Iteratively find higher-order cut sets
-        for (int k = 1; k < order; ++k)
-        {
-            size_t combo_size = k + 1;
-            if (firstpairs.size() < combo_size) break;
+        private:
+            const PathSets& paths_;
+            size_t words_;
+            size_t order_;
+            std::vector<Bits> pathsOf_;     // pathsOf_[v]: paths containing v
+            std::vector<char> cand_;
+            Set chosen_;
+            MinCutSets found_;
 
-            // Generate all combinations of size combo_size from firstpairs
-            std::vector<Set> newpairs;
+            void extend(const Bits& uncov, const std::vector<Bits>& crit)
             {
-                std::vector<size_t> indices(combo_size);
-                std::iota(indices.begin(), indices.end(), 0);
-
-                while (true)
+                // Uncovered path with the fewest candidates
+                size_t best = paths_.size(), best_size = SIZE_MAX;
+                for (size_t w = 0; w < words_; ++w)
                 {
-                    Set combo;
-                    for (size_t idx : indices)
-                        combo.push_back(firstpairs[idx]);
-
-                    // Check if combo is a superset of any existing minimal cut set
-                    bool is_superset = false;
-                    std::unordered_set<int> combo_set(combo.begin(), combo.end());
-                    for (const auto& m : minimal)
+                    for (Word bits = uncov[w]; bits; bits &= bits - 1)
                     {
-                        bool subset = true;
-                        for (int e : m)
+                        size_t p = w * bits::kWordBits + std::countr_zero(bits);
+                        size_t size = 0;
+                        for (NodeID v : paths_[p]) size += cand_[v];
+                        if (size < best_size)
                         {
-                            if (combo_set.count(e) == 0) { subset = false; break; }
+                            best = p;
+                            best_size = size;
                         }
-                        if (subset) { is_superset = true; break; }
                     }
+                }
 
-                    if (!is_superset) {
-                        newpairs.push_back(combo);
-                    } else {
-                        if (combo_set.count(13) && combo_set.count(14) && combo_set.count(16) && combo.size() == 3) {
-                            std::cout << "[DEBUG] 13, 14, 16 skipped due to superset!" << std::endl;
+                if (best == paths_.size())
+                {
+                    found_.push_back(chosen_);
+                    return;
+                }
+                if (chosen_.size() == order_ || best_size == 0)
+                    return;
+
+                std::vector<NodeID> branch;
+                for (NodeID v : paths_[best])
+                    if (cand_[v]) branch.push_back(v);
+                for (NodeID v : branch)
+                    cand_[v] = 0;
+
+                Bits child_uncov(words_);
+                std::vector<Bits> child_crit(crit.size() + 1, Bits(words_));
+                for (NodeID v : branch)
+                {
+                    const Bits& hit = pathsOf_[v];
+
+                    // Every chosen node must keep a critical path
+                    bool keeps_crit = true;
+                    for (size_t i = 0; i < crit.size() && keeps_crit; ++i)
+                    {
+                        bool remains = false;
+                        for (size_t w = 0; w < words_; ++w)
+                        {
+                            child_crit[i][w] = crit[i][w] & ~hit[w];
+                            remains |= child_crit[i][w] != 0;
                         }
+                        keeps_crit = remains;
                     }
 
-                    // Next combination
-                    int i = combo_size - 1;
-                    while (i >= 0 && indices[i] == firstpairs.size() - combo_size + i)
-                        --i;
-                    if (i < 0) break;
-                    ++indices[i];
-                    for (size_t j = i + 1; j < combo_size; ++j)
-                        indices[j] = indices[j - 1] + 1;
-                }
-            }
-
-            // Build incidence matrix for new pairs
-            for (const auto& combo : newpairs)
-            {
-                bool all_paths_covered = true;
-                for (size_t p = 0; p < P; ++p)
-                {
-                    bool covered = false;
-                    for (int node : combo)
+                    if (keeps_crit)
                     {
-                        auto it = node_to_col.find(node);
-                        if (it != node_to_col.end() && incidence[p][it->second])
+                        for (size_t w = 0; w < words_; ++w)
                         {
-                            covered = true;
-                            break;
+                            child_crit.back()[w] = uncov[w] & hit[w];
+                            child_uncov[w] = uncov[w] & ~hit[w];
                         }
+                        chosen_.push_back(v);
+                        extend(child_uncov, child_crit);
+                        chosen_.pop_back();
                     }
-                    if (!covered) { all_paths_covered = false; break; }
-                }
 
-                if (all_paths_covered) {
-                    minimal.push_back(combo);
+                    // Later siblings may use v again
+                    cand_[v] = 1;
                 }
             }
+        };
+
+    } // anonymous namespace
+
+    MinCutSets minimalcuts_combination(const PathSets& paths, NodeID src, NodeID dst,
+                                       int num_nodes, int order)
+    {
+        if (order < 0)
+            order = static_cast<int>(std::ceil(num_nodes / 2.0));
+
+        if (paths.size() == 1 && paths[0].size() == 2 &&
+            paths[0][0] == src && paths[0][1] == dst)
+        {
+            return {{src}, {dst}};
         }
 
+        MinCutSets minimal;
+        if (!paths.empty())
+            minimal = HittingSetSearch(paths, src, dst, static_cast<size_t>(order)).run();
+
         // Sort results
         for (auto& s : minimal)
             std::sort(s.begin(), s.end());
@@ -1,192 +1,191 @@
 #include <pyrbd_core/sets.hpp>
+#include <pyrbd_core/bitset.hpp>
 #include <algorithm>
 #include <cmath>
-#include <numeric>
-#include <unordered_map>
-#include <unordered_set>
-#include <set>
+#include <omp.h>
 
 namespace pyrbd_core::sets
 {
     // ================================================================
     // Combination Matrix method — C++ port of _cutsets_combination_matrix.py
     //
-    // Uses incidence matrices with logical OR operations to efficiently
-    // test higher-order cut sets.
+    // Every node that lies on some path gets a packed incidence column
+    // (bit p ↔ path p), and a combination of nodes is a cut set exactly
+    // when the OR of its columns is all ones.
+    //
+    // Combinations are grown depth-first in increasing column order with
+    // the running OR kept per depth. A node is only added if it covers a
+    // path the combination does not cover yet: otherwise it could never
+    // be necessary in a minimal cut. Growth stops at the first covering
+    // combination, so supersets of cut sets are never generated and no
+    // upper set has to be stored. A covering combination is minimal when
+    // each of its nodes covers a path that no other node covers.
+    //
+    // The searches rooted at different first nodes are independent and
+    // run across threads in the parallel variant.
     // ================================================================
 
-    MinCutSets minimalcuts_combination_matrix(const AdjList& adj, NodeID src, NodeID dst,
-                                              int num_nodes, int order)
-    {
-        if (order < 0)
-            order = static_cast<int>(std::ceil(num_nodes / 2.0));
+    namespace {
 
-        MinCutSets minimal;
+        using bits::Word;
 
-        // Check direct connection
-        bool direct = false;
-        if (src >= 0 && static_cast<size_t>(src) < adj.size())
+        class CombinationSearch
         {
-            for (NodeID n : adj[src])
+        public:
+            CombinationSearch(const std::vector<Word>& columns, size_t words, Word last_mask,
+                              size_t order)
+                : columns_(columns), words_(words), lastMask_(last_mask), order_(order),
+                  cover_((order + 1) * words, 0), combo_(order)
             {
-                if (n == dst) { direct = true; break; }
             }
-        }
 
-        // If directly connected, check all paths
-        PathSets paths = minimalpaths(adj, src, dst);
-        if (paths.size() == 1 && paths[0].size() == 2)
-        {
-            return {{src}, {dst}};
-        }
-
-        // If not directly connected, proceed with combination matrix method
-        if (!direct || paths.size() > 1)
-        {
-            // Build valid nodes (all except src, dst)
-            std::vector<NodeID> valid_nodes;
-            for (int n = 1; n <= num_nodes; ++n)
+            // Minimal cut sets (column indices) whose smallest column is first
+            std::vector<std::vector<size_t>> run(size_t first)
             {
-                if (n != src && n != dst)
-                    valid_nodes.push_back(n);
+                found_.clear();
+                combo_[0] = first;
+                std::copy_n(column(first), words_, cover_.begin() + words_);
+                extend(1);
+                return std::move(found_);
             }
 
-            size_t P = paths.size();
-            size_t N = valid_nodes.size();
+        private:
+            const std::vector<Word>& columns_;
+            size_t words_;
+            Word lastMask_;
+            size_t order_;
+            std::vector<Word> cover_;   // OR of the first d columns at depth d
+            std::vector<size_t> combo_;
+            std::vector<std::vector<size_t>> found_;
 
-            std::unordered_map<int, size_t> node_to_col;
-            for (size_t i = 0; i < N; ++i)
-                node_to_col[valid_nodes[i]] = i;
+            const Word* column(size_t c) const { return columns_.data() + c * words_; }
 
-            // Origin incidence matrix
-            std::vector<std::vector<bool>> incidence_origin(P, std::vector<bool>(N, false));
-            for (size_t p = 0; p < P; ++p)
+            bool covers(const Word* cover) const
             {
-                for (int node : paths[p])
-                {
-                    auto it = node_to_col.find(node);
-                    if (it != node_to_col.end())
-                        incidence_origin[p][it->second] = true;
-                }
+                for (size_t i = 0; i + 1 < words_; ++i)
+                    if (~cover[i]) return false;
+                return (cover[words_ - 1] & lastMask_) == lastMask_;
             }
 
-            // Find order-1 cut sets (columns that are all true)
-            std::vector<NodeID> firstpairs;
-            for (size_t n = 0; n < N; ++n)
+            void extend(size_t depth)
             {
-                bool all_true = true;
-                for (size_t p = 0; p < P; ++p)
+                const Word* cover = cover_.data() + depth * words_;
+                if (covers(cover))
                 {
-                    if (!incidence_origin[p][n]) { all_true = false; break; }
+                    if (isMinimal(depth))
+                        found_.emplace_back(combo_.begin(), combo_.begin() + depth);
+                    return;
+                }
+                if (depth == order_)
+                    return;
+
+                Word* next = cover_.data() + (depth + 1) * words_;
+                size_t num_columns = columns_.size() / words_;
+                for (size_t c = combo_[depth - 1] + 1; c < num_columns; ++c)
+                {
+                    const Word* col = column(c);
+                    bool adds = false;
+                    for (size_t i = 0; i < words_; ++i)
+                    {
+                        next[i] = cover[i] | col[i];
+                        adds |= (col[i] & ~cover[i]) != 0;
+                    }
+                    if (!adds)
+                        continue;
+                    combo_[depth] = c;
+                    extend(depth + 1);
                 }
-                if (all_true)
-                    minimal.push_back({valid_nodes[n]});
-                else
-                    firstpairs.push_back(valid_nodes[n]);
             }
 
-            // Iterate for higher orders
-            for (int k = 1; k < order; ++k)
+            // Every node of the combination covers a path no other node covers
+            bool isMinimal(size_t size) const
             {
-                size_t combo_size = k + 1;
-                if (firstpairs.size() < combo_size) break;
-
-                // Build upper set (supersets of known minimals)
-                std::unordered_set<int> firstpairset(firstpairs.begin(), firstpairs.end());
-                std::set<std::vector<int>> upperset;
-
-                for (const auto& tup : minimal)
+                for (size_t j = 0; j < size; ++j)
                 {
-                    std::set<int> tupset(tup.begin(), tup.end());
-                    std::vector<int> remainder;
-                    for (int fp : firstpairs)
+                    bool private_path = false;
+                    for (size_t i = 0; i < words_ && !private_path; ++i)
                     {
-                        if (tupset.count(fp) == 0)
-                            remainder.push_back(fp);
+                        Word others = 0;
+                        for (size_t k = 0; k < size; ++k)
+                            if (k != j) others |= column(combo_[k])[i];
+                        private_path = (column(combo_[j])[i] & ~others) != 0;
                     }
+                    if (!private_path)
+                        return false;
+                }
+                return true;
+            }
+        };
 
-                    int need = static_cast<int>(combo_size) - static_cast<int>(tup.size());
-                    if (need <= 0) continue;
-                    if (remainder.size() < static_cast<size_t>(need)) continue;
+    } // anonymous namespace
 
-                    // Generate combinations of remainder of size need
-                    std::vector<size_t> indices(need);
-                    std::iota(indices.begin(), indices.end(), 0);
+    MinCutSets minimalcuts_combination_matrix(const PathSets& paths, NodeID src, NodeID dst,
+                                              int num_nodes, int order, bool parallel)
+    {
+        if (order < 0)
+            order = static_cast<int>(std::ceil(num_nodes / 2.0));
 
-                    while (true)
-                    {
-                        std::vector<int> combo;
-                        for (int idx : indices)
-                            combo.push_back(remainder[idx]);
-                        for (int t : tup)
-                            combo.push_back(t);
-                        std::sort(combo.begin(), combo.end());
-                        upperset.insert(combo);
-
-                        int i = need - 1;
-                        while (i >= 0 && indices[i] == remainder.size() - need + i)
-                            --i;
-                        if (i < 0) break;
-                        ++indices[i];
-                        for (int j = i + 1; j < need; ++j)
-                            indices[j] = indices[j - 1] + 1;
-                    }
-                }
+        if (paths.size() == 1 && paths[0].size() == 2)
+        {
+            return {{src}, {dst}};
+        }
 
-                // Generate all combinations and filter out upper sets
-                std::vector<Set> newpairs;
-                {
-                    std::vector<size_t> indices(combo_size);
-                    std::iota(indices.begin(), indices.end(), 0);
+        MinCutSets minimal;
+        if (!paths.empty() && order > 0)
+        {
+            // Nodes on some path (others never belong to a minimal cut set)
+            std::vector<char> on_path(num_nodes + 1, 0);
+            for (const auto& path : paths)
+                for (NodeID node : path)
+                    if (node != src && node != dst) on_path[node] = 1;
 
-                    while (true)
-                    {
-                        std::vector<int> combo;
-                        for (size_t idx : indices)
-                            combo.push_back(firstpairs[idx]);
-                        std::sort(combo.begin(), combo.end());
-
-                        if (upperset.count(combo) == 0)
-                            newpairs.push_back(combo);
-
-                        int i = combo_size - 1;
-                        while (i >= 0 && indices[i] == firstpairs.size() - combo_size + i)
-                            --i;
-                        if (i < 0) break;
-                        ++indices[i];
-                        for (size_t j = i + 1; j < combo_size; ++j)
-                            indices[j] = indices[j - 1] + 1;
-                    }
+            std::vector<NodeID> nodes;
+            for (size_t n = 0; n < on_path.size(); ++n)
+                if (on_path[n]) nodes.push_back(static_cast<NodeID>(n));
+
+            std::vector<int> node_to_col(on_path.size(), -1);
+            for (size_t c = 0; c < nodes.size(); ++c)
+                node_to_col[nodes[c]] = static_cast<int>(c);
+
+            // Packed incidence columns: bit p of column c ↔ nodes[c] on path p
+            size_t P = paths.size();
+            size_t words = bits::wordsFor(P);
+            std::vector<Word> columns(nodes.size() * words, 0);
+            for (size_t p = 0; p < P; ++p)
+            {
+                for (NodeID node : paths[p])
+                {
+                    int c = node != src && node != dst ? node_to_col[node] : -1;
+                    if (c >= 0)
+                        columns[c * words + p / bits::kWordBits] |= Word(1) << (p % bits::kWordBits);
                 }
+            }
+            Word last_mask = P % bits::kWordBits ? (Word(1) << (P % bits::kWordBits)) - 1 : ~Word(0);
+
+            const long num_columns = static_cast<long>(nodes.size());
+            #pragma omp parallel if (parallel)
+            {
+                CombinationSearch search(columns, words, last_mask, static_cast<size_t>(order));
+                MinCutSets local;
 
-                // Check each new combination using OR on origin incidence columns
-                for (const auto& combo : newpairs)
+                #pragma omp for schedule(dynamic)
+                for (long first = 0; first < num_columns; ++first)
                 {
-                    bool all_paths_covered = true;
-                    for (size_t p = 0; p < P; ++p)
+                    for (const auto& combo : search.run(static_cast<size_t>(first)))
                     {
-                        bool covered = false;
-                        for (int node : combo)
-                        {
-                            auto it = node_to_col.find(node);
-                            if (it != node_to_col.end() && incidence_origin[p][it->second])
-                            {
-                                covered = true;
-                                break;
-                            }
-                        }
-                        if (!covered) { all_paths_covered = false; break; }
+                        Set cut;
+                        for (size_t c : combo)
+                            cut.push_back(nodes[c]);
+                        local.push_back(std::move(cut));
                     }
-
-                    if (all_paths_covered)
-                        minimal.push_back(combo);
                 }
+
+                #pragma omp critical
+                minimal.insert(minimal.end(), local.begin(), local.end());
             }
         }
 
         // Sort results
-        for (auto& s : minimal)
-            std::sort(s.begin(), s.end());
         std::sort(minimal.begin(), minimal.end(),
                   [](const Set& a, const Set& b) {
                       if (a.size() != b.size()) return a.size() < b.size();
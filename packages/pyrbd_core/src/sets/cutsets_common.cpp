@@ -2,6 +2,7 @@
 #include <algorithm>
 #include <numeric>
 #include <unordered_set>
+#include <omp.h>
 
 namespace pyrbd_core::sets
 {
@@ -30,7 +31,7 @@ namespace pyrbd_core::sets
     }
 
     std::vector<Set> multiplyTwoPathsets(const std::vector<Set>& partial_set_list,
-                                          const Set& factor_set)
+                                          const Set& factor_set, int max_order)
     {
         std::unordered_set<int> factor_elems(factor_set.begin(), factor_set.end());
 
@@ -50,6 +51,9 @@ namespace pyrbd_core::sets
 
             if (disjoint)
             {
+                // Sets only grow, so one beyond max_order never yields a kept cut
+                if (max_order > 0 && partial.size() >= static_cast<size_t>(max_order))
+                    continue;
                 for (int f : factor_set)
                 {
                     Set new_set = partial;
@@ -68,40 +72,258 @@ namespace pyrbd_core::sets
         return absorbed.toSetList();
     }
 
-    std::vector<Set> multiplyPathsets(const std::vector<Set>& pathsets)
-    {
-        if (pathsets.empty()) return {};
+    namespace {
+
+        constexpr size_t kLeafClauses = 8;
+        constexpr size_t kTaskMinClauses = 64;
+
+        // ============================================================
+        // Balanced product tree
+        //
+        // The transversals of A + B are the minimal unions a + b of
+        // transversals of A and of B, so the clause list is split in
+        // halves, both halves are multiplied independently (as OpenMP
+        // tasks when parallel) and the results are merged with
+        // absorption. A transversal of one half that already hits every
+        // clause of the other is kept as is and never paired. Clauses
+        // are first grouped so that neighbours share nodes, which keeps
+        // the products of the halves small; short ranges are folded.
+        // ============================================================
+        class ProductTree
+        {
+        public:
+            ProductTree(std::vector<Set> clauses, int max_order)
+                : clauses_(std::move(clauses)), maxOrder_(max_order)
+            {
+                for (const auto& c : clauses_)
+                    for (int e : c) maxElem_ = std::max(maxElem_, e);
+                group();
+            }
+
+            std::vector<Set> multiply(bool parallel)
+            {
+                std::vector<Set> result;
+                if (parallel && !omp_in_parallel())
+                {
+                    #pragma omp parallel
+                    #pragma omp single
+                    result = product(0, clauses_.size(), true);
+                }
+                else
+                {
+                    result = product(0, clauses_.size(), parallel);
+                }
+                return result;
+            }
+
+        private:
+            std::vector<Set> clauses_;
+            int maxOrder_;
+            int maxElem_ = 0;
+
+            // Order clauses so that those sharing the most common node of a
+            // range are contiguous, recursively
+            void group()
+            {
+                std::vector<int> counts(maxElem_ + 1, 0);
+                std::vector<int> touched;
+                std::vector<std::pair<size_t, size_t>> ranges = {{0, clauses_.size()}};
+                while (!ranges.empty())
+                {
+                    auto [begin, end] = ranges.back();
+                    ranges.pop_back();
+                    if (end - begin <= kLeafClauses)
+                        continue;
+
+                    touched.clear();
+                    for (size_t i = begin; i < end; ++i)
+                        for (int e : clauses_[i])
+                            if (counts[e]++ == 0) touched.push_back(e);
+
+                    // Nodes in every clause of the range do not split it
+                    int pivot = -1, best = 1;
+                    const int size = static_cast<int>(end - begin);
+                    for (int e : touched)
+                    {
+                        if (counts[e] > best && counts[e] < size)
+                        {
+                            best = counts[e];
+                            pivot = e;
+                        }
+                        counts[e] = 0;
+                    }
+                    if (pivot < 0)
+                        continue;
+
+                    auto mid = std::stable_partition(
+                        clauses_.begin() + begin, clauses_.begin() + end, [pivot](const Set& c) {
+                            return std::find(c.begin(), c.end(), pivot) != c.end();
+                        });
+                    size_t split = mid - clauses_.begin();
+                    ranges.push_back({begin, split});
+                    ranges.push_back({split, end});
+                }
+            }
+
+            std::vector<Set> product(size_t begin, size_t end, bool parallel)
+            {
+                if (begin == end)
+                    return {};
+
+                if (end - begin <= kLeafClauses)
+                {
+                    std::vector<Set> result;
+                    for (int elem : clauses_[begin])
+                        result.push_back({elem});
+                    for (size_t i = begin + 1; i < end; ++i)
+                        result = multiplyTwoPathsets(result, clauses_[i], maxOrder_);
+                    return result;
+                }
+
+                size_t mid = begin + (end - begin) / 2;
+                std::vector<Set> left, right;
+                if (parallel && end - begin >= kTaskMinClauses)
+                {
+                    #pragma omp task shared(left)
+                    left = product(begin, mid, true);
+
+                    right = product(mid, end, true);
+                    #pragma omp taskwait
+                }
+                else
+                {
+                    left = product(begin, mid, parallel);
+                    right = product(mid, end, parallel);
+                }
+                return merge(left, right, begin, mid, end);
+            }
+
+            std::vector<Set> merge(const std::vector<Set>& left, const std::vector<Set>& right,
+                                   size_t begin, size_t mid, size_t end) const
+            {
+                std::vector<char> mark(maxElem_ + 1, 0);
+                auto hitsAll = [&](const Set& t, size_t from, size_t to) {
+                    for (int e : t) mark[e] = 1;
+                    bool hits = true;
+                    for (size_t i = from; i < to && hits; ++i)
+                        hits = std::any_of(clauses_[i].begin(), clauses_[i].end(),
+                                           [&](int e) { return mark[e] != 0; });
+                    for (int e : t) mark[e] = 0;
+                    return hits;
+                };
+
+                AbsorbList absorbed;
+                std::vector<const Set*> open_left, open_right;
+                for (const auto& a : left)
+                {
+                    if (hitsAll(a, mid, end))
+                        absorbed.add(a);
+                    else
+                        open_left.push_back(&a);
+                }
+                for (const auto& b : right)
+                {
+                    if (hitsAll(b, begin, mid))
+                        absorbed.add(b);
+                    else
+                        open_right.push_back(&b);
+                }
+
+                Set joined;
+                for (const Set* a : open_left)
+                {
+                    for (const Set* b : open_right)
+                    {
+                        joined.clear();
+                        std::set_union(a->begin(), a->end(), b->begin(), b->end(),
+                                       std::back_inserter(joined));
+                        if (maxOrder_ > 0 && joined.size() > static_cast<size_t>(maxOrder_))
+                            continue;
+                        absorbed.add(joined);
+                    }
+                }
+                return absorbed.toSetList();
+            }
+        };
 
-        // Initialize with singleton sets from first path
-        std::vector<Set> result;
-        for (int elem : pathsets[0])
-            result.push_back({elem});
+    } // anonymous namespace
 
-        // Multiply with each subsequent set
-        for (size_t i = 1; i < pathsets.size(); ++i)
-            result = multiplyTwoPathsets(result, pathsets[i]);
+    std::vector<Set> multiplyPathsets(const std::vector<Set>& pathsets, int max_order, bool parallel)
+    {
+        if (pathsets.empty()) return {};
 
-        return result;
+        std::vector<Set> clauses;
+        clauses.reserve(pathsets.size());
+        for (const auto& p : pathsets)
+        {
+            Set c = p;
+            std::sort(c.begin(), c.end());
+            clauses.push_back(std::move(c));
+        }
+        return ProductTree(std::move(clauses), max_order).multiply(parallel);
     }
 
     // ================================================================
-    // Unified entry point
+    // Unified entry points
     // ================================================================
+    namespace {
+
+        // Whether a method works on the minimal path family (all but
+        // separators); unknown methods are rejected before any DFS
+        bool usesPaths(const std::string& method)
+        {
+            if (method == "cnf_tree" || method == "shannon" || method == "multiplication" ||
+                method == "combination" || method == "combination_matrix" || method == "dualize")
+                return true;
+            if (method == "separators")
+                return false;
+            throw std::invalid_argument("Unknown minimalcuts method: " + method);
+        }
+
+    } // anonymous namespace
+
     MinCutSets minimalcuts(const AdjList& adj, NodeID src, NodeID dst,
-                           int num_nodes, const std::string& method)
+                           int num_nodes, const std::string& method, bool parallel,
+                           TransversalCache* cache, int max_order)
     {
+        if (max_order < 0)
+            throw std::invalid_argument("max_order must be non-negative");
+
+        if (!usesPaths(method))
+            return minimalcuts_separators(adj, src, dst, num_nodes, max_order);
+
+        PathSets paths = parallel ? minimalpathsParallel(adj, src, dst) : minimalpaths(adj, src, dst);
+        return minimalcutsFromPaths(paths, src, dst, num_nodes, method, parallel, cache, max_order);
+    }
+
+    MinCutSets minimalcutsFromPaths(const PathSets& paths, NodeID src, NodeID dst,
+                                    int num_nodes, const std::string& method, bool parallel,
+                                    TransversalCache* cache, int max_order)
+    {
+        if (max_order < 0)
+            throw std::invalid_argument("max_order must be non-negative");
+        if (!usesPaths(method))
+            throw std::invalid_argument("Method " + method + " needs the graph, not its minimal paths");
+        for (const auto& path : paths)
+            for (NodeID node : path)
+                if (node < 1 || node > num_nodes)
+                    throw std::invalid_argument("Path node out of range: " + std::to_string(node));
+
+        // The combination methods already enumerate by increasing order
+        int order = max_order > 0 ? max_order : -1;
+
         if (method == "cnf_tree")
-            return minimalcuts_cnf_tree(adj, src, dst, num_nodes);
+            return minimalcuts_cnf_tree(paths, src, dst, num_nodes, parallel, cache, max_order);
         else if (method == "shannon")
-            return minimalcuts_shannon(adj, src, dst, num_nodes);
+            return minimalcuts_shannon(paths, src, dst, num_nodes, max_order, parallel, cache);
         else if (method == "multiplication")
-            return minimalcuts_multiplication(adj, src, dst, num_nodes);
+            return minimalcuts_multiplication(paths, src, dst, num_nodes, max_order, parallel);
         else if (method == "combination")
-            return minimalcuts_combination(adj, src, dst, num_nodes);
+            return minimalcuts_combination(paths, src, dst, num_nodes, order);
         else if (method == "combination_matrix")
-            return minimalcuts_combination_matrix(adj, src, dst, num_nodes);
+            return minimalcuts_combination_matrix(paths, src, dst, num_nodes, order, parallel);
         else
-            throw std::invalid_argument("Unknown minimalcuts method: " + method);
+            return minimalcuts_dualize(paths, src, dst, num_nodes, max_order);
     }
 
 } // namespace pyrbd_core::sets
@@ -0,0 +1,400 @@
+#include <pyrbd_core/sets.hpp>
+#include <pyrbd_core/bitset.hpp>
+#include <algorithm>
+#include <bit>
+#include <cmath>
+
+namespace pyrbd_core::sets
+{
+    // ================================================================
+    // Dualize method — minimal transversals of the path family by
+    // Fredman & Khachiyan's duality test (algorithm A, "On the
+    // complexity of dualization of monotone disjunctive normal forms",
+    // 1996).
+    //
+    // With F the path interiors and G the cut sets found so far, a set
+    // X that contains no path and meets every cut in G is a witness:
+    // V - X is a transversal of F that contains no known cut, and
+    // shrinking it greedily yields a new minimal cut set. Once no
+    // witness exists, G is the whole dual of F.
+    //
+    // The witness search branches on the most frequent variable v (v in
+    // X, or v not in X), which keeps every path meeting every cut. When
+    // the families are too sparse for that to be needed (the expected
+    // number of violated sets under a random X is below one), a witness
+    // is built directly by conditional expectations. Each test costs
+    // (|F| + |G|)^{O(log(|F| + |G|))}, so unlike the clause-multiplying
+    // methods the run time is bounded quasi-polynomially in the output
+    // and never depends on intermediate products.
+    //
+    // A subtree without witnesses stays without witnesses when G grows,
+    // so the tests are not restarted: a new cut is added, restricted to
+    // the free variables, to every open node of the search, which then
+    // continues where it was.
+    // ================================================================
+
+    namespace {
+
+        using bits::Word;
+        using Bits = std::vector<Word>;
+        using Family = std::vector<Bits>;
+
+        bool meets(const Bits& a, const Bits& b)
+        {
+            for (size_t i = 0; i < a.size(); ++i)
+                if (a[i] & b[i]) return true;
+            return false;
+        }
+
+        bool isEmpty(const Bits& a)
+        {
+            return std::all_of(a.begin(), a.end(), [](Word w) { return w == 0; });
+        }
+
+        size_t count(const Bits& a)
+        {
+            size_t c = 0;
+            for (Word w : a) c += std::popcount(w);
+            return c;
+        }
+
+        bool test(const Bits& a, size_t v)
+        {
+            return (a[v / bits::kWordBits] >> (v % bits::kWordBits)) & Word(1);
+        }
+
+        void set(Bits& a, size_t v) { a[v / bits::kWordBits] |= Word(1) << (v % bits::kWordBits); }
+        void reset(Bits& a, size_t v) { a[v / bits::kWordBits] &= ~(Word(1) << (v % bits::kWordBits)); }
+
+        // Drop v from the members of an antichain and keep the result
+        // inclusion-minimal. Shrunk members stay an antichain and are never
+        // supersets of untouched ones, so only untouched members containing
+        // a shrunk one are removed.
+        Family removeVariable(const Family& family, size_t v)
+        {
+            Family shrunk, kept;
+            for (const auto& e : family)
+            {
+                if (test(e, v))
+                {
+                    shrunk.push_back(e);
+                    reset(shrunk.back(), v);
+                }
+            }
+            for (const auto& e : family)
+            {
+                if (test(e, v))
+                    continue;
+                bool redundant = std::any_of(shrunk.begin(), shrunk.end(), [&](const Bits& s) {
+                    return bits::isSubset(s.data(), e.data(), e.size());
+                });
+                if (!redundant)
+                    kept.push_back(e);
+            }
+            kept.insert(kept.end(), std::make_move_iterator(shrunk.begin()),
+                        std::make_move_iterator(shrunk.end()));
+            return kept;
+        }
+
+        // Add a set to an antichain unless it contains a member
+        void addMinimal(Family& family, Bits e)
+        {
+            for (const auto& m : family)
+                if (bits::isSubset(m.data(), e.data(), e.size())) return;
+            std::erase_if(family, [&](const Bits& m) {
+                return bits::isSubset(e.data(), m.data(), e.size());
+            });
+            family.push_back(std::move(e));
+        }
+
+        // Expected number of violated sets when the variables outside in
+        // and out are drawn uniformly
+        double expectedViolations(const Family& F, const Family& G, const Bits& in, const Bits& out)
+        {
+            double expected = 0.0;
+            for (const auto& p : F)
+            {
+                if (meets(p, out)) continue;
+                size_t free = 0;
+                for (size_t i = 0; i < p.size(); ++i) free += std::popcount(p[i] & ~in[i]);
+                expected += std::ldexp(1.0, -static_cast<int>(free));
+            }
+            for (const auto& c : G)
+            {
+                if (meets(c, in)) continue;
+                size_t free = 0;
+                for (size_t i = 0; i < c.size(); ++i) free += std::popcount(c[i] & ~out[i]);
+                expected += std::ldexp(1.0, -static_cast<int>(free));
+            }
+            return expected;
+        }
+
+        class Dualizer
+        {
+        public:
+            Dualizer(const Family& paths, size_t num_vars)
+                : paths_(paths), vars_(num_vars), words_(bits::wordsFor(num_vars))
+            {
+            }
+
+            // All minimal transversals of the path family
+            Family run()
+            {
+                Frame root{{}, Bits(words_, 0), Bits(words_, 0)};
+                search(paths_, root, all());
+                return std::move(cuts_);
+            }
+
+        private:
+            // Open search node: the cut family restricted to its free
+            // variables and the variables fixed in / out of X above it
+            struct Frame
+            {
+                Family G;
+                Bits in;
+                Bits out;
+            };
+
+            enum class Outcome { None, Witness, Branch };
+
+            const Family& paths_;
+            size_t vars_;
+            size_t words_;
+            std::vector<Frame*> open_;
+            Family cuts_;
+
+            Bits all() const
+            {
+                Bits b(words_, ~Word(0));
+                if (vars_ % bits::kWordBits)
+                    b.back() = (Word(1) << (vars_ % bits::kWordBits)) - 1;
+                return b;
+            }
+
+            void search(const Family& F, Frame& frame, const Bits& free)
+            {
+                open_.push_back(&frame);
+                while (true)
+                {
+                    Bits x(words_, 0);
+                    Outcome outcome = settle(F, frame.G, free, x);
+                    if (outcome == Outcome::Witness)
+                    {
+                        for (size_t i = 0; i < words_; ++i) x[i] |= frame.in[i];
+                        record(x);
+                        continue;
+                    }
+                    if (outcome == Outcome::Branch)
+                        branch(F, frame, free);
+                    break;
+                }
+                open_.pop_back();
+            }
+
+            void branch(const Family& F, Frame& frame, const Bits& free)
+            {
+                // Most frequent variable relative to its family
+                std::vector<size_t> in_f(vars_, 0), in_g(vars_, 0);
+                auto tally = [&](const Family& family, std::vector<size_t>& freq) {
+                    for (const auto& e : family)
+                        for (size_t i = 0; i < words_; ++i)
+                            for (Word w = e[i]; w; w &= w - 1)
+                                ++freq[i * bits::kWordBits + std::countr_zero(w)];
+                };
+                tally(F, in_f);
+                tally(frame.G, in_g);
+
+                size_t v = vars_;
+                double best = -1.0;
+                for (size_t u = 0; u < vars_; ++u)
+                {
+                    if (!test(free, u)) continue;
+                    double freq = std::max(static_cast<double>(in_f[u]) / F.size(),
+                                           static_cast<double>(in_g[u]) / frame.G.size());
+                    if (freq > best)
+                    {
+                        best = freq;
+                        v = u;
+                    }
+                }
+
+                Bits rest = free;
+                reset(rest, v);
+
+                // v in X: paths lose v, cuts through v are met
+                {
+                    Frame child{{}, frame.in, frame.out};
+                    set(child.in, v);
+                    for (const auto& c : frame.G)
+                        if (!test(c, v)) child.G.push_back(c);
+                    search(removeVariable(F, v), child, rest);
+                }
+
+                // v not in X: paths through v are avoided, cuts lose v
+                // (frame.G may have grown while the first child ran)
+                {
+                    Frame child{removeVariable(frame.G, v), frame.in, frame.out};
+                    set(child.out, v);
+                    Family f0;
+                    for (const auto& p : F)
+                        if (!test(p, v)) f0.push_back(p);
+                    search(f0, child, rest);
+                }
+            }
+
+            // Base cases on the free variables; x receives a witness
+            Outcome settle(const Family& F, const Family& G, const Bits& free, Bits& x) const
+            {
+                if (std::any_of(F.begin(), F.end(), isEmpty) || std::any_of(G.begin(), G.end(), isEmpty))
+                    return Outcome::None;
+
+                if (F.empty())
+                {
+                    x = free;
+                    return Outcome::Witness;
+                }
+                if (G.empty())
+                    return Outcome::Witness;
+
+                // One path: leave out one of its nodes that is not a cut alone
+                if (F.size() == 1)
+                {
+                    for (size_t v = 0; v < vars_; ++v)
+                    {
+                        if (!test(F[0], v)) continue;
+                        bool singleton_cut = std::any_of(G.begin(), G.end(), [&](const Bits& c) {
+                            return count(c) == 1 && test(c, v);
+                        });
+                        if (!singleton_cut)
+                        {
+                            x = free;
+                            reset(x, v);
+                            return Outcome::Witness;
+                        }
+                    }
+                    return Outcome::None;
+                }
+
+                // One cut: take one of its nodes that is not a path alone
+                if (G.size() == 1)
+                {
+                    for (size_t v = 0; v < vars_; ++v)
+                    {
+                        if (!test(G[0], v)) continue;
+                        bool singleton_path = std::any_of(F.begin(), F.end(), [&](const Bits& p) {
+                            return count(p) == 1 && test(p, v);
+                        });
+                        if (!singleton_path)
+                        {
+                            set(x, v);
+                            return Outcome::Witness;
+                        }
+                    }
+                    return Outcome::None;
+                }
+
+                // Sparse families: fix the free variables one by one without
+                // letting the expected number of violations reach one (both
+                // families only hold free variables)
+                Bits in(words_, 0), out(words_, 0);
+                if (expectedViolations(F, G, in, out) >= 1.0)
+                    return Outcome::Branch;
+
+                for (size_t v = 0; v < vars_; ++v)
+                {
+                    if (!test(free, v)) continue;
+                    set(in, v);
+                    double e_in = expectedViolations(F, G, in, out);
+                    reset(in, v);
+                    set(out, v);
+                    if (e_in <= expectedViolations(F, G, in, out))
+                    {
+                        reset(out, v);
+                        set(in, v);
+                    }
+                }
+                x = std::move(in);
+                return Outcome::Witness;
+            }
+
+            // Shrink V - X to a minimal cut and add it to every open node
+            void record(const Bits& x)
+            {
+                Bits cut = all();
+                for (size_t i = 0; i < words_; ++i) cut[i] &= ~x[i];
+                for (size_t v = 0; v < vars_; ++v)
+                {
+                    if (!test(cut, v)) continue;
+                    reset(cut, v);
+                    bool hits_all = std::all_of(paths_.begin(), paths_.end(),
+                                                [&](const Bits& p) { return meets(p, cut); });
+                    if (!hits_all)
+                        set(cut, v);
+                }
+
+                for (Frame* frame : open_)
+                {
+                    if (meets(cut, frame->in))
+                        continue;
+                    Bits restricted = cut;
+                    for (size_t i = 0; i < words_; ++i) restricted[i] &= ~frame->out[i];
+                    addMinimal(frame->G, std::move(restricted));
+                }
+                cuts_.push_back(std::move(cut));
+            }
+        };
+
+    } // anonymous namespace
+
+    MinCutSets minimalcuts_dualize(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                   int max_order)
+    {
+        if (paths.empty() || (paths.size() == 1 && paths[0].size() == 2))
+        {
+            return {{src}, {dst}};
+        }
+
+        // Variables: nodes on some path besides src and dst
+        std::vector<NodeID> nodes;
+        for (const auto& path : paths)
+            for (NodeID v : path)
+                if (v != src && v != dst) nodes.push_back(v);
+        std::sort(nodes.begin(), nodes.end());
+        nodes.erase(std::unique(nodes.begin(), nodes.end()), nodes.end());
+
+        const size_t words = bits::wordsFor(nodes.size());
+        Family F;
+        for (const auto& path : paths)
+        {
+            Bits p(words, 0);
+            for (NodeID v : path)
+            {
+                if (v == src || v == dst) continue;
+                set(p, std::lower_bound(nodes.begin(), nodes.end(), v) - nodes.begin());
+            }
+            F.push_back(std::move(p));
+        }
+
+        // Every cut is found before the test can succeed, so an order bound
+        // filters the output
+        MinCutSets minimal;
+        for (const auto& cut : Dualizer(F, nodes.size()).run())
+        {
+            Set s;
+            for (size_t v = 0; v < nodes.size(); ++v)
+                if (test(cut, v)) s.push_back(nodes[v]);
+            if (max_order <= 0 || s.size() <= static_cast<size_t>(max_order))
+                minimal.push_back(std::move(s));
+        }
+        std::sort(minimal.begin(), minimal.end(),
+                  [](const Set& a, const Set& b) {
+                      if (a.size() != b.size()) return a.size() < b.size();
+                      return a < b;
+                  });
+
+        MinCutSets result = {{src}, {dst}};
+        result.insert(result.end(), minimal.begin(), minimal.end());
+        return result;
+    }
+
+} // namespace pyrbd_core::sets
@@ -7,9 +7,10 @@ namespace pyrbd_core::sets
     // Multiplication method — C++ port of _cutsets_multiplication.py
     // ================================================================
 
-    MinCutSets minimalcuts_multiplication(const AdjList& adj, NodeID src, NodeID dst, int num_nodes)
+    MinCutSets minimalcuts_multiplication(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                          int max_order, bool parallel)
     {
-        PathSets mps = minimalpaths(adj, src, dst);
+        PathSets mps = paths;
 
         if (mps.size() == 1 && mps[0].size() == 2 &&
             mps[0][0] == src && mps[0][1] == dst)
@@ -32,7 +33,7 @@ namespace pyrbd_core::sets
         }
 
         // Multiply pathsets
-        auto result_sets = multiplyPathsets(pathsets);
+        auto result_sets = multiplyPathsets(pathsets, max_order, parallel);
 
         // Sort
         for (auto& s : result_sets)
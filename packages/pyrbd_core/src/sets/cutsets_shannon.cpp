@@ -1,58 +1,135 @@
 #include <pyrbd_core/sets.hpp>
 #include <algorithm>
+#include <set>
+#include <omp.h>
 
 namespace pyrbd_core::sets
 {
     // ================================================================
     // Shannon expansion — C++ port of _cutsets_shannon.py
+    //
+    // The cut sets of a clause family F split on its most common
+    // element p into those without p, the transversals of F with p
+    // removed from every clause, and those with p, {p} joined with the
+    // transversals of the clauses not containing p. Absorption over the
+    // union leaves the minimal ones. Both residual families are expanded
+    // again until they are small or no element repeats, and are then
+    // multiplied out.
+    //
+    // The two branches are independent and run as OpenMP tasks near the
+    // root in the parallel variant. Branches often reach the same
+    // residual family, so results are memoised in a TransversalCache
+    // keyed by the family and the order budget left.
     // ================================================================
 
     namespace {
 
-        std::vector<Set> shannonExpansion(const std::vector<Set>& pathsets, int max_node)
-        {
-            auto [pivot_elem, counts] = mostCommonElement(pathsets, max_node);
+        constexpr int kTaskMaxDepth = 16;
+        constexpr size_t kTaskMinClauses = 32;
+        constexpr size_t kLeafClauses = 8;
 
-            if (counts < 2)
+        class ShannonExpansion
+        {
+        public:
+            ShannonExpansion(int max_val, TransversalCache& memo)
+                : max_val_(max_val), memo_(memo)
             {
-                return multiplyPathsets(pathsets);
             }
 
-            std::vector<Set> left_subset, right_subset;
-            for (const auto& subset : pathsets)
+            // Minimal transversals of sorted, distinct clauses with at most
+            // max_order elements (0 = no limit)
+            std::vector<Set> expand(const std::vector<Set>& clauses, int max_order,
+                                    bool parallel = false, int depth = 0)
             {
-                // Left: remove pivot_elem from all sets
-                Set left_s;
-                for (int e : subset)
-                    if (e != pivot_elem) left_s.push_back(e);
-                left_subset.push_back(std::move(left_s));
-
-                // Right: only sets not containing pivot_elem
-                bool has_pivot = false;
-                for (int e : subset)
-                    if (e == pivot_elem) { has_pivot = true; break; }
-                if (!has_pivot)
-                    right_subset.push_back(subset);
-            }
-            right_subset.push_back({pivot_elem});
+                for (const auto& c : clauses)
+                    if (c.empty()) return {};
 
-            // Multiply both subsets
-            auto left_result = multiplyPathsets(left_subset);
-            auto right_result = multiplyPathsets(right_subset);
+                auto [pivot, counts] = mostCommonElement(clauses, max_val_);
+                if (counts < 2 || clauses.size() <= kLeafClauses)
+                    return multiplyPathsets(clauses, max_order);
 
-            // Combine with absorption
-            AbsorbList absorbed;
-            absorbed.addMany(left_result);
-            absorbed.addMany(right_result);
+                auto key = TransversalCache::fingerprint(clauses, max_order);
+                if (auto hit = memo_.find(key))
+                    return *hit;
 
-            return absorbed.toSetList();
-        }
+                std::vector<Set> transversals = expandPivot(clauses, pivot, max_order, parallel, depth);
+                memo_.insert(key, transversals);
+                return transversals;
+            }
+
+        private:
+            int max_val_;
+            TransversalCache& memo_;
+
+            std::vector<Set> expandPivot(const std::vector<Set>& clauses, int pivot, int max_order,
+                                         bool parallel, int depth)
+            {
+                // Without pivot: every clause loses it (kept minimal and
+                // distinct); a clause {pivot} cannot be hit at all
+                AbsorbList reduced;
+                std::vector<Set> avoiding;
+                bool blocked = false;
+                for (const auto& c : clauses)
+                {
+                    if (std::binary_search(c.begin(), c.end(), pivot))
+                    {
+                        Set r;
+                        for (int e : c)
+                            if (e != pivot) r.push_back(e);
+                        if (r.empty())
+                            blocked = true;
+                        else
+                            reduced.add(std::move(r));
+                    }
+                    else
+                    {
+                        reduced.add(c);
+                        avoiding.push_back(c);
+                    }
+                }
+                std::vector<Set> without_pivot = reduced.toSetList();
+
+                // With pivot: the clauses avoiding it still need a transversal,
+                // which may only use max_order - 1 elements
+                const bool fits = max_order != 1 || avoiding.empty();
+                const int rest_order = max_order > 1 ? max_order - 1 : 0;
+
+                const bool spawn = parallel && depth < kTaskMaxDepth && clauses.size() >= kTaskMinClauses;
+                std::vector<Set> left_eval, right_eval;
+                if (spawn && !blocked && fits && !avoiding.empty())
+                {
+                    #pragma omp task shared(left_eval, without_pivot) firstprivate(depth)
+                    left_eval = expand(without_pivot, max_order, true, depth + 1);
+                    right_eval = expand(avoiding, rest_order, true, depth + 1);
+                    #pragma omp taskwait
+                }
+                else
+                {
+                    if (!blocked)
+                        left_eval = expand(without_pivot, max_order, parallel, depth + 1);
+                    if (fits)
+                        right_eval = avoiding.empty() ? std::vector<Set>{{}}
+                                                      : expand(avoiding, rest_order, parallel, depth + 1);
+                }
+
+                // Combine with absorption
+                AbsorbList absorbed;
+                absorbed.addMany(left_eval);
+                for (auto& r : right_eval)
+                {
+                    r.insert(std::upper_bound(r.begin(), r.end(), pivot), pivot);
+                    absorbed.add(std::move(r));
+                }
+                return absorbed.toSetList();
+            }
+        };
 
     } // anonymous namespace
 
-    MinCutSets minimalcuts_shannon(const AdjList& adj, NodeID src, NodeID dst, int num_nodes)
+    MinCutSets minimalcuts_shannon(const PathSets& paths, NodeID src, NodeID dst, int num_nodes,
+                                   int max_order, bool parallel, TransversalCache* cache)
     {
-        PathSets mps = minimalpaths(adj, src, dst);
+        PathSets mps = paths;
 
         if (mps.size() == 1 && mps[0].size() == 2 &&
             mps[0][0] == src && mps[0][1] == dst)
@@ -63,17 +140,32 @@ namespace pyrbd_core::sets
         std::sort(mps.begin(), mps.end(),
                   [](const Set& a, const Set& b) { return a.size() < b.size(); });
 
+        // Clauses must be distinct for TransversalCache::fingerprint
         std::vector<Set> pathsets;
+        std::set<Set> seen;
         for (auto& mp : mps)
         {
             Set ps;
             for (int node : mp)
                 if (node != src && node != dst) ps.push_back(node);
             std::sort(ps.begin(), ps.end());
-            pathsets.push_back(std::move(ps));
+            if (seen.insert(ps).second)
+                pathsets.push_back(std::move(ps));
         }
 
-        auto result_sets = shannonExpansion(pathsets, num_nodes);
+        TransversalCache local;
+        ShannonExpansion expansion(num_nodes, cache ? *cache : local);
+        std::vector<Set> result_sets;
+        if (parallel)
+        {
+            #pragma omp parallel
+            #pragma omp single
+            result_sets = expansion.expand(pathsets, max_order, true);
+        }
+        else
+        {
+            result_sets = expansion.expand(pathsets, max_order);
+        }
 
         // Sort
         for (auto& s : result_sets)
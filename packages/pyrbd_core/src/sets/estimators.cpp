@@ -0,0 +1,237 @@
+#include <pyrbd_core/sets.hpp>
+#include <algorithm>
+#include <bit>
+#include <cmath>
+#include <random>
+
+namespace pyrbd_core::sets
+{
+    // ================================================================
+    // Knuth random-probe size estimators
+    //
+    // A search tree can be sized without walking it: follow one random
+    // root-to-leaf branch, and at every node multiply the running weight
+    // by the number of children. Each node's output is counted with the
+    // weight of the branch that reached it. The average over many probes
+    // is an unbiased estimate of the total output of the tree (Knuth,
+    // "Estimating the efficiency of backtrack programs", 1975).
+    //
+    // Paths are estimated on the minimalpaths DFS tree, cuts on the MMCS
+    // hitting-set tree (Murakami & Uno, 2014) over a path family, whose
+    // leaves are exactly the minimal cut sets.
+    // ================================================================
+
+    namespace {
+        using Bits = std::vector<std::uint64_t>;
+
+        constexpr size_t kWordBits = 64;
+
+        bool anySet(const Bits& bits)
+        {
+            return std::any_of(bits.begin(), bits.end(), [](std::uint64_t w) { return w != 0; });
+        }
+
+        // Mean and standard error of the probe values
+        std::pair<double, double> summarise(const std::vector<double>& values)
+        {
+            const double n = static_cast<double>(values.size());
+            double mean = 0.0;
+            for (double v : values) mean += v;
+            mean /= n;
+
+            double var = 0.0;
+            for (double v : values) var += (v - mean) * (v - mean);
+            var = values.size() > 1 ? var / (n - 1) : 0.0;
+
+            return {mean, std::sqrt(var / n)};
+        }
+    } // anonymous namespace
+
+    PathCountEstimate estimatePathCount(const AdjList& adj, NodeID src, NodeID dst,
+                                        size_t probes, std::uint64_t seed)
+    {
+        size_t bound = std::max<size_t>(adj.size(), std::max(src, dst) + 1);
+        for (const auto& neighbours : adj)
+        {
+            for (NodeID neigh : neighbours)
+                bound = std::max<size_t>(bound, neigh + 1);
+        }
+
+        std::mt19937_64 rng(seed);
+        std::vector<double> counts, lengths;
+        counts.reserve(probes);
+        lengths.reserve(probes);
+
+        std::vector<int> forbidden(bound);
+        std::vector<char> onPath(bound);
+        std::vector<NodeID> visited, extensions;
+
+        for (size_t probe = 0; probe < std::max<size_t>(probes, 1); ++probe)
+        {
+            std::fill(forbidden.begin(), forbidden.end(), 0);
+            std::fill(onPath.begin(), onPath.end(), 0);
+            visited = {src};
+            onPath[src] = 1;
+
+            double weight = 1.0, count = 0.0, length = 0.0;
+
+            while (static_cast<size_t>(visited.back()) < adj.size())
+            {
+                NodeID current = visited.back();
+
+                // Children of the current DFS node, as in minimalpaths
+                extensions.clear();
+                bool reachesDst = false;
+                for (NodeID child : adj[current])
+                {
+                    if (forbidden[child] > 0)
+                        continue;
+                    if (child == dst)
+                        reachesDst = true;
+                    else if (!onPath[child])
+                        extensions.push_back(child);
+                }
+
+                if (reachesDst)
+                {
+                    count += weight;
+                    length += weight * static_cast<double>(visited.size() + 1);
+                }
+                if (extensions.empty())
+                    break;
+
+                weight *= static_cast<double>(extensions.size());
+                NodeID child = extensions[std::uniform_int_distribution<size_t>(0, extensions.size() - 1)(rng)];
+
+                for (NodeID neigh : adj[current])
+                    ++forbidden[neigh];
+                visited.push_back(child);
+                onPath[child] = 1;
+            }
+
+            counts.push_back(count);
+            lengths.push_back(length);
+        }
+
+        auto [count, error] = summarise(counts);
+        double length = summarise(lengths).first;
+        return {count, error, count > 0.0 ? length / count : 0.0};
+    }
+
+    CountEstimate estimateCutCount(const PathSets& pathSets, size_t probes, std::uint64_t seed)
+    {
+        if (pathSets.empty())
+            return {0.0, 0.0};
+
+        const size_t numPaths = pathSets.size();
+        const size_t words = (numPaths + kWordBits - 1) / kWordBits;
+
+        // pathsOf[v]: bitset of the paths containing node v
+        NodeID maxNode = 0;
+        for (const auto& path : pathSets)
+            for (NodeID v : path) maxNode = std::max(maxNode, v);
+
+        std::vector<Bits> pathsOf(maxNode + 1, Bits(words, 0));
+        for (size_t p = 0; p < numPaths; ++p)
+            for (NodeID v : pathSets[p])
+                pathsOf[v][p / kWordBits] |= std::uint64_t(1) << (p % kWordBits);
+
+        Bits allPaths(words, ~std::uint64_t(0));
+        if (numPaths % kWordBits)
+            allPaths.back() = (std::uint64_t(1) << (numPaths % kWordBits)) - 1;
+
+        std::mt19937_64 rng(seed);
+        std::vector<double> counts;
+        counts.reserve(probes);
+
+        for (size_t probe = 0; probe < std::max<size_t>(probes, 1); ++probe)
+        {
+            std::vector<char> cand(maxNode + 1, 0);
+            for (const auto& path : pathSets)
+                for (NodeID v : path) cand[v] = 1;
+
+            std::vector<Bits> crit;
+            Bits uncov = allPaths;
+            double weight = 1.0, count = 0.0;
+
+            while (true)
+            {
+                if (!anySet(uncov))
+                {
+                    count = weight;
+                    break;
+                }
+
+                // Uncovered path with the fewest candidates (MMCS choice rule)
+                size_t best = numPaths, bestSize = SIZE_MAX;
+                for (size_t w = 0; w < words; ++w)
+                {
+                    for (std::uint64_t bits = uncov[w]; bits; bits &= bits - 1)
+                    {
+                        size_t p = w * kWordBits + std::countr_zero(bits);
+                        size_t size = 0;
+                        for (NodeID v : pathSets[p]) size += cand[v];
+                        if (size < bestSize)
+                        {
+                            best = p;
+                            bestSize = size;
+                        }
+                    }
+                }
+
+                std::vector<NodeID> branch;
+                for (NodeID v : pathSets[best])
+                    if (cand[v]) branch.push_back(v);
+
+                // Child i keeps the candidates outside branch plus branch[0..i-1];
+                // it is valid if every chosen node keeps a critical path
+                std::vector<size_t> valid;
+                for (size_t i = 0; i < branch.size(); ++i)
+                {
+                    const Bits& hit = pathsOf[branch[i]];
+                    bool keepsCrit = true;
+                    for (const Bits& c : crit)
+                    {
+                        bool remains = false;
+                        for (size_t w = 0; w < words && !remains; ++w)
+                            remains = (c[w] & ~hit[w]) != 0;
+                        if (!remains)
+                        {
+                            keepsCrit = false;
+                            break;
+                        }
+                    }
+                    if (keepsCrit)
+                        valid.push_back(i);
+                }
+
+                if (valid.empty())
+                    break;
+
+                weight *= static_cast<double>(valid.size());
+                size_t pick = valid[std::uniform_int_distribution<size_t>(0, valid.size() - 1)(rng)];
+                NodeID v = branch[pick];
+                const Bits& hit = pathsOf[v];
+
+                for (Bits& c : crit)
+                    for (size_t w = 0; w < words; ++w) c[w] &= ~hit[w];
+                Bits own(words);
+                for (size_t w = 0; w < words; ++w)
+                {
+                    own[w] = uncov[w] & hit[w];
+                    uncov[w] &= ~hit[w];
+                }
+                crit.push_back(std::move(own));
+
+                for (size_t i = pick; i < branch.size(); ++i)
+                    cand[branch[i]] = 0;
+            }
+
+            counts.push_back(count);
+        }
+
+        auto [count, error] = summarise(counts);
+        return {count, error};
+    }
+
+} // namespace pyrbd_core::sets
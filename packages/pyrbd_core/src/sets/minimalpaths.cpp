@@ -1,6 +1,7 @@
 #include <pyrbd_core/sets.hpp>
+#include <pyrbd_core/bitset.hpp>
 #include <stack>
-#include <unordered_set>
+#include <omp.h>
 
 namespace pyrbd_core::sets
 {
@@ -11,89 +12,439 @@ namespace pyrbd_core::sets
     //   For each node in visited (except the last), all its neighbours
     //   are forbidden for the current extension. This prunes paths
     //   that revisit neighbours of already-traversed intermediate nodes.
+    //
+    // Instead of rebuilding the dontgo set for every child, the DFS
+    // keeps a per-node reference counter: forbidden[v] is the number
+    // of nodes in visited (except the last) adjacent to v. It is
+    // updated when a node stops or starts being the last one on the
+    // path, so each child check is O(1).
+    //
+    // For graphs up to 64 * bits::kMaxWords nodes the DFS state is held
+    // in fixed-width bitsets instead: the forbidden set of every depth is
+    // the union of precomputed neighbour masks, and both the visited and
+    // forbidden checks become single-bit tests. Larger graphs fall back
+    // to the counter-based DFS. Both produce identical output.
+    //
+    // Both kernels extend a given prefix path rather than starting at
+    // src, so the parallel variant can split the search tree on the
+    // first two hops and run the independent subtrees concurrently.
+    //
+    // Every prefix the DFS enters is itself a minimal path from src to
+    // its last node. The kernels report paths through a visitor: the
+    // single-target visitor stops at dst, while the single-source
+    // visitor never stops and files each entered prefix under its last
+    // node, yielding the families of all destinations in one DFS.
+    //
+    // Paths are written either to a PathSets (vector of vectors, used by
+    // the cut set algorithms) or to a CSR SetFamily, which avoids one
+    // allocation per path.
     // ================================================================
 
     namespace {
-        // Collect neighbours of all visited nodes except the last one
-        std::unordered_set<NodeID> getDontgo(const AdjList& adj,
-                                              const std::vector<NodeID>& visited)
+        // Number of hops expanded sequentially before the parallel split
+        constexpr size_t kSplitHops = 2;
+
+        // A unit of parallel work: either a finished path or a prefix to extend
+        struct PathWorkItem
+        {
+            Set prefix;
+            bool complete;
+        };
+
+        // Number of slots needed to index every node referenced by adj
+        size_t nodeBound(const AdjList& adj, NodeID src, NodeID dst)
         {
-            std::unordered_set<NodeID> dontgo;
-            if (visited.size() > 1)
+            size_t bound = std::max<size_t>(adj.size(), std::max(src, dst) + 1);
+            for (const auto& neighbours : adj)
             {
-                // For all nodes in visited except the last, add their neighbours
-                for (size_t i = 0; i < visited.size() - 1; ++i)
+                for (NodeID neigh : neighbours)
+                    bound = std::max<size_t>(bound, neigh + 1);
+            }
+            return bound;
+        }
+
+        // Append visited + last as one path to out
+        inline void appendPath(PathSets& out, const Set& visited, NodeID last)
+        {
+            Set path = visited;
+            path.push_back(last);
+            out.push_back(std::move(path));
+        }
+
+        inline void appendPath(SetFamily& out, const Set& visited, NodeID last)
+        {
+            out.elements.insert(out.elements.end(), visited.begin(), visited.end());
+            out.elements.push_back(last);
+            out.offsets.push_back(static_cast<int64_t>(out.elements.size()));
+        }
+
+        // Append all paths of part to out
+        inline void appendPaths(PathSets& out, PathSets&& part)
+        {
+            std::move(part.begin(), part.end(), std::back_inserter(out));
+        }
+
+        inline void appendPaths(SetFamily& out, SetFamily&& part)
+        {
+            out.append(part);
+        }
+
+        // Collects the paths ending at dst; dst itself is never extended
+        template <typename Out>
+        struct TargetVisitor
+        {
+            NodeID dst;
+            Out& out;
+
+            bool isTarget(NodeID child) const { return child == dst; }
+
+            void onTarget(const Set& visited, NodeID child) { appendPath(out, visited, child); }
+
+            void onEnter(const Set&, NodeID) {}
+        };
+
+        // Collects every entered prefix under its last node
+        template <typename Out>
+        struct SourceVisitor
+        {
+            std::vector<Out>& out;
+
+            bool isTarget(NodeID) const { return false; }
+
+            void onTarget(const Set&, NodeID) {}
+
+            void onEnter(const Set& visited, NodeID child) { appendPath(out[child], visited, child); }
+        };
+
+        // Add delta to the forbidden counter of every neighbour of node
+        inline void updateForbidden(const AdjList& adj, NodeID node,
+                                    std::vector<int>& forbidden, int delta)
+        {
+            if (node >= 0 && static_cast<size_t>(node) < adj.size())
+            {
+                for (NodeID neigh : adj[node])
+                    forbidden[neigh] += delta;
+            }
+        }
+
+        // Counter-based DFS, used for graphs too large for the bitset kernels.
+        // Reports every minimal path extending prefix to visit.
+        template <typename Visitor>
+        void extendPathsCounter(const AdjList& adj, size_t bound, const Set& prefix,
+                                Visitor& visit)
+        {
+            std::vector<int> forbidden(bound, 0);
+            std::vector<char> onPath(bound, 0);
+
+            // Stack-based iterative DFS
+            std::vector<NodeID> visited = prefix;
+            for (size_t i = 0; i < visited.size(); ++i)
+            {
+                onPath[visited[i]] = 1;
+                if (i + 1 < visited.size())
+                    updateForbidden(adj, visited[i], forbidden, +1);
+            }
+
+            // Stack of iterators (index into adjacency list)
+            std::stack<size_t> iterStack;
+            iterStack.push(0); // start at first neighbour of the prefix end
+
+            while (!iterStack.empty())
+            {
+                NodeID current = visited.back();
+
+                if (static_cast<size_t>(current) >= adj.size() || iterStack.top() >= adj[current].size())
                 {
-                    NodeID node = visited[i];
-                    if (node >= 0 && static_cast<size_t>(node) < adj.size())
-                    {
-                        for (NodeID neigh : adj[node])
-                            dontgo.insert(neigh);
-                    }
+                    // Backtrack: the new last node no longer forbids its neighbours
+                    iterStack.pop();
+                    onPath[current] = 0;
+                    visited.pop_back();
+                    if (!visited.empty())
+                        updateForbidden(adj, visited.back(), forbidden, -1);
+                    if (!iterStack.empty())
+                        ++iterStack.top(); // advance parent's iterator
+                    continue;
+                }
+
+                NodeID child = adj[current][iterStack.top()];
+
+                if (forbidden[child] > 0)
+                {
+                    ++iterStack.top();
+                    continue;
+                }
+
+                if (visit.isTarget(child))
+                {
+                    // Found a path
+                    visit.onTarget(visited, child);
+                    ++iterStack.top();
+                }
+                else if (!onPath[child])
+                {
+                    // Extend path: current stops being the last node
+                    visit.onEnter(visited, child);
+                    updateForbidden(adj, current, forbidden, +1);
+                    visited.push_back(child);
+                    onPath[child] = 1;
+                    iterStack.push(0);
+                }
+                else
+                {
+                    ++iterStack.top();
                 }
             }
-            return dontgo;
         }
-    } // anonymous namespace
 
-    PathSets minimalpaths(const AdjList& adj, NodeID src, NodeID dst)
-    {
-        PathSets result;
+        // Bitset DFS. Reports every minimal path extending prefix to visit.
+        template <size_t W, typename Visitor>
+        void extendPathsBits(const AdjList& adj, const std::vector<bits::NodeBits<W>>& neighMask,
+                             const Set& prefix, Visitor& visit)
+        {
+            using Bits = bits::NodeBits<W>;
+
+            // forbiddenStack[k] = neighbours of visited[0..k-1], i.e. the
+            // forbidden set while visited[k] is the last node on the path
+            std::vector<NodeID> visited = prefix;
+            std::vector<Bits> forbiddenStack(1);
+            Bits visitedMask;
+            for (size_t i = 0; i < visited.size(); ++i)
+            {
+                visitedMask.set(visited[i]);
+                if (i + 1 < visited.size())
+                    forbiddenStack.push_back(forbiddenStack.back() | neighMask[visited[i]]);
+            }
+
+            std::vector<size_t> iterStack = {0};
 
-        // Stack-based iterative DFS
-        std::vector<NodeID> visited = {src};
-        std::unordered_set<NodeID> visitedSet = {src};
+            while (!iterStack.empty())
+            {
+                NodeID current = visited.back();
 
-        // Stack of iterators (index into adjacency list)
-        std::stack<size_t> iterStack;
-        iterStack.push(0); // start at first neighbour of src
+                if (static_cast<size_t>(current) >= adj.size() || iterStack.back() >= adj[current].size())
+                {
+                    // Backtrack
+                    iterStack.pop_back();
+                    forbiddenStack.pop_back();
+                    visitedMask.reset(current);
+                    visited.pop_back();
+                    if (!iterStack.empty())
+                        ++iterStack.back();
+                    continue;
+                }
+
+                NodeID child = adj[current][iterStack.back()];
+                const Bits& forbidden = forbiddenStack.back();
+
+                if (forbidden.test(child))
+                {
+                    ++iterStack.back();
+                    continue;
+                }
 
-        while (!iterStack.empty())
+                if (visit.isTarget(child))
+                {
+                    visit.onTarget(visited, child);
+                    ++iterStack.back();
+                }
+                else if (!visitedMask.test(child))
+                {
+                    visit.onEnter(visited, child);
+                    forbiddenStack.push_back(forbidden | neighMask[current]);
+                    visited.push_back(child);
+                    visitedMask.set(child);
+                    iterStack.push_back(0);
+                }
+                else
+                {
+                    ++iterStack.back();
+                }
+            }
+        }
+
+        // Expand the first kSplitHops levels of the DFS in sequential
+        // order. Concatenating the results of all items reproduces the
+        // output order of the sequential enumeration.
+        std::vector<PathWorkItem> splitFirstHops(const AdjList& adj, size_t bound,
+                                                 NodeID src, NodeID dst)
         {
-            NodeID current = visited.back();
+            std::vector<PathWorkItem> frontier = {{{src}, false}};
 
-            if (static_cast<size_t>(current) >= adj.size() || iterStack.top() >= adj[current].size())
+            for (size_t hop = 0; hop < kSplitHops; ++hop)
             {
-                // Backtrack
-                iterStack.pop();
-                visitedSet.erase(visited.back());
-                visited.pop_back();
-                if (!iterStack.empty())
-                    ++iterStack.top(); // advance parent's iterator
-                continue;
+                std::vector<PathWorkItem> next;
+                for (auto& item : frontier)
+                {
+                    if (item.complete)
+                    {
+                        next.push_back(std::move(item));
+                        continue;
+                    }
+
+                    const Set& prefix = item.prefix;
+                    NodeID current = prefix.back();
+                    if (static_cast<size_t>(current) >= adj.size())
+                        continue;
+
+                    std::vector<char> forbidden(bound, 0), onPath(bound, 0);
+                    for (size_t i = 0; i < prefix.size(); ++i)
+                    {
+                        onPath[prefix[i]] = 1;
+                        if (i + 1 < prefix.size())
+                            for (NodeID neigh : adj[prefix[i]]) forbidden[neigh] = 1;
+                    }
+
+                    for (NodeID child : adj[current])
+                    {
+                        if (forbidden[child])
+                            continue;
+
+                        Set extended = prefix;
+                        extended.push_back(child);
+                        if (child == dst)
+                            next.push_back({std::move(extended), true});
+                        else if (!onPath[child])
+                            next.push_back({std::move(extended), false});
+                    }
+                }
+                frontier = std::move(next);
             }
 
-            NodeID child = adj[current][iterStack.top()];
-            auto dontgo = getDontgo(adj, visited);
+            return frontier;
+        }
 
-            if (dontgo.count(child))
+        // Run extend() from src, optionally split across OpenMP threads
+        template <typename Out, typename Extend>
+        Out runPathSearch(const AdjList& adj, size_t bound, NodeID src, NodeID dst,
+                          bool parallel, Extend extend)
+        {
+            Out result;
+            if (!parallel)
             {
-                ++iterStack.top();
-                continue;
+                extend(Set{src}, result);
+                return result;
             }
 
-            if (child == dst)
+            std::vector<PathWorkItem> items = splitFirstHops(adj, bound, src, dst);
+            std::vector<Out> partial(items.size());
+
+            #pragma omp parallel for schedule(dynamic)
+            for (size_t i = 0; i < items.size(); ++i)
             {
-                // Found a path
-                Set path = visited;
-                path.push_back(dst);
-                result.push_back(std::move(path));
-                ++iterStack.top();
+                if (items[i].complete)
+                    partial[i].push_back(items[i].prefix);
+                else
+                    extend(items[i].prefix, partial[i]);
             }
-            else if (visitedSet.count(child) == 0)
+
+            for (auto& paths : partial)
+                appendPaths(result, std::move(paths));
+            return result;
+        }
+
+        // Build the neighbour mask of every node
+        template <size_t W>
+        std::vector<bits::NodeBits<W>> neighbourMasks(const AdjList& adj, size_t bound)
+        {
+            std::vector<bits::NodeBits<W>> neighMask(bound);
+            for (size_t u = 0; u < adj.size(); ++u)
             {
-                // Extend path
-                visited.push_back(child);
-                visitedSet.insert(child);
-                iterStack.push(0);
+                for (NodeID neigh : adj[u])
+                    neighMask[u].set(neigh);
             }
-            else
+            return neighMask;
+        }
+
+        // Call fn with the DFS kernel matching the graph size. The kernel
+        // has the signature extend(prefix, visitor).
+        template <typename Fn>
+        decltype(auto) withPathKernel(const AdjList& adj, size_t bound, Fn&& fn)
+        {
+            auto bitsKernel = [&](auto words) -> decltype(auto) {
+                constexpr size_t W = decltype(words)::value;
+                auto neighMask = neighbourMasks<W>(adj, bound);
+                return fn([&](const Set& prefix, auto& visit) {
+                    extendPathsBits<W>(adj, neighMask, prefix, visit);
+                });
+            };
+
+            switch (bits::wordsFor(bound))
             {
-                ++iterStack.top();
+                case 1: return bitsKernel(std::integral_constant<size_t, 1>{});
+                case 2: return bitsKernel(std::integral_constant<size_t, 2>{});
+                case 3: return bitsKernel(std::integral_constant<size_t, 3>{});
+                case 4: return bitsKernel(std::integral_constant<size_t, 4>{});
+                case 5: return bitsKernel(std::integral_constant<size_t, 5>{});
+                case 6: return bitsKernel(std::integral_constant<size_t, 6>{});
+                case 7: return bitsKernel(std::integral_constant<size_t, 7>{});
+                case 8: return bitsKernel(std::integral_constant<size_t, 8>{});
+                default:
+                    return fn([&](const Set& prefix, auto& visit) {
+                        extendPathsCounter(adj, bound, prefix, visit);
+                    });
             }
         }
 
-        return result;
+        template <typename Out>
+        Out enumeratePaths(const AdjList& adj, NodeID src, NodeID dst, bool parallel)
+        {
+            const size_t bound = nodeBound(adj, src, dst);
+            return withPathKernel(adj, bound, [&](auto extend) {
+                return runPathSearch<Out>(adj, bound, src, dst, parallel,
+                    [&](const Set& prefix, Out& out) {
+                        TargetVisitor<Out> visit{dst, out};
+                        extend(prefix, visit);
+                    });
+            });
+        }
+    } // anonymous namespace
+
+    PathSets minimalpaths(const AdjList& adj, NodeID src, NodeID dst)
+    {
+        return enumeratePaths<PathSets>(adj, src, dst, false);
+    }
+
+    PathSets minimalpathsParallel(const AdjList& adj, NodeID src, NodeID dst)
+    {
+        return enumeratePaths<PathSets>(adj, src, dst, true);
+    }
+
+    SetFamily minimalpathsFamily(const AdjList& adj, NodeID src, NodeID dst, bool parallel)
+    {
+        return enumeratePaths<SetFamily>(adj, src, dst, parallel);
+    }
+
+    std::vector<SetFamily> minimalpathsAllPairs(const AdjList& adj, const NodePairs& nodePairs)
+    {
+        size_t bound = nodeBound(adj, 0, 0);
+        for (const auto& [src, dst] : nodePairs)
+            bound = std::max<size_t>(bound, std::max(src, dst) + 1);
+
+        return withPathKernel(adj, bound, [&](auto extend) {
+            std::vector<SetFamily> pathsetsList(nodePairs.size());
+
+            #pragma omp parallel for schedule(dynamic)
+            for (size_t i = 0; i < nodePairs.size(); ++i)
+            {
+                const auto& [src, dst] = nodePairs[i];
+                TargetVisitor<SetFamily> visit{dst, pathsetsList[i]};
+                extend(Set{src}, visit);
+            }
+
+            return pathsetsList;
+        });
+    }
+
+    std::vector<SetFamily> minimalpathsFromSource(const AdjList& adj, NodeID src)
+    {
+        const size_t bound = nodeBound(adj, src, src);
+
+        return withPathKernel(adj, bound, [&](auto extend) {
+            std::vector<SetFamily> pathsetsByDst(bound);
+            SourceVisitor<SetFamily> visit{pathsetsByDst};
+            extend(Set{src}, visit);
+            return pathsetsByDst;
+        });
     }
 
 } // namespace pyrbd_core::sets
@@ -0,0 +1,230 @@
+#include <pyrbd_core/sets.hpp>
+#include <algorithm>
+#include <functional>
+#include <limits>
+#include <queue>
+#include <stdexcept>
+
+namespace pyrbd_core::sets
+{
+    // ================================================================
+    // PathEnumerator — resumable minimal path DFS
+    //
+    // Same counter-based "dontgo" DFS as minimalpaths, but the stacks
+    // live in the object so enumeration can pause after any path and
+    // resume on the next call. Length and latency caps prune the DFS
+    // instead of filtering its output, and the time budget is polled
+    // every kClockInterval steps to keep clock reads off the hot loop.
+    //
+    // A child is only entered if the path to it plus a lower bound on
+    // the rest of the way to dst (BFS hops / Dijkstra latency from dst)
+    // still fits the caps. Dropping chords never lengthens a path, so
+    // every path within the caps contains a minimal path within them.
+    // ================================================================
+
+    namespace {
+        constexpr size_t kClockInterval = 4096;
+        constexpr size_t kUnreachable = std::numeric_limits<size_t>::max() / 2;
+        constexpr double kLatencyTolerance = 1e-9;
+
+        std::vector<size_t> hopDistances(const AdjList& adj, NodeID from, size_t bound)
+        {
+            std::vector<size_t> dist(bound, kUnreachable);
+            std::vector<NodeID> frontier = {from};
+            dist[from] = 0;
+            for (size_t i = 0; i < frontier.size(); ++i)
+            {
+                NodeID node = frontier[i];
+                if (static_cast<size_t>(node) >= adj.size())
+                    continue;
+                for (NodeID neigh : adj[node])
+                {
+                    if (dist[neigh] == kUnreachable)
+                    {
+                        dist[neigh] = dist[node] + 1;
+                        frontier.push_back(neigh);
+                    }
+                }
+            }
+            return dist;
+        }
+
+        std::vector<double> latencyDistances(const AdjList& adj, const EdgeWeights& latency,
+                                             NodeID from, size_t bound)
+        {
+            using Entry = std::pair<double, NodeID>;
+            std::vector<double> dist(bound, std::numeric_limits<double>::infinity());
+            std::priority_queue<Entry, std::vector<Entry>, std::greater<Entry>> queue;
+            dist[from] = 0.0;
+            queue.push({0.0, from});
+            while (!queue.empty())
+            {
+                auto [d, node] = queue.top();
+                queue.pop();
+                if (d > dist[node] || static_cast<size_t>(node) >= adj.size())
+                    continue;
+                for (size_t i = 0; i < adj[node].size(); ++i)
+                {
+                    NodeID neigh = adj[node][i];
+                    double candidate = d + latency[node][i];
+                    if (candidate < dist[neigh])
+                    {
+                        dist[neigh] = candidate;
+                        queue.push({candidate, neigh});
+                    }
+                }
+            }
+            return dist;
+        }
+    }
+
+    PathEnumerator::PathEnumerator(AdjList adj, NodeID src, NodeID dst,
+                                   size_t maxPaths, size_t maxLength, double timeBudget,
+                                   EdgeWeights latency, double maxLatency)
+        : adj_(std::move(adj)),
+          dst_(dst),
+          maxPaths_(maxPaths),
+          maxLength_(maxLength),
+          hasDeadline_(timeBudget > 0.0),
+          deadline_(Clock::now() + std::chrono::duration_cast<Clock::duration>(
+                        std::chrono::duration<double>(std::max(timeBudget, 0.0)))),
+          latency_(std::move(latency)),
+          maxLatency_(std::max(maxLatency, 0.0))
+    {
+        size_t bound = std::max<size_t>(adj_.size(), std::max(src, dst) + 1);
+        for (const auto& neighbours : adj_)
+        {
+            for (NodeID neigh : neighbours)
+                bound = std::max<size_t>(bound, neigh + 1);
+        }
+
+        forbidden_.assign(bound, 0);
+        onPath_.assign(bound, 0);
+        visited_ = {src};
+        onPath_[src] = 1;
+        iterStack_ = {0};
+
+        if (maxLength_ > 0)
+            hopsToDst_ = hopDistances(adj_, dst, bound);
+        if (maxLatency_ > 0.0)
+        {
+            if (latency_.size() < adj_.size())
+                throw std::invalid_argument("PathEnumerator: latency must have one row per node");
+            for (size_t u = 0; u < adj_.size(); ++u)
+            {
+                if (latency_[u].size() != adj_[u].size())
+                    throw std::invalid_argument("PathEnumerator: latency row sizes must match adj");
+            }
+            latencyToDst_ = latencyDistances(adj_, latency_, dst, bound);
+            latencyStack_ = {0.0};
+        }
+    }
+
+    void PathEnumerator::updateForbidden(NodeID node, int delta)
+    {
+        if (node >= 0 && static_cast<size_t>(node) < adj_.size())
+        {
+            for (NodeID neigh : adj_[node])
+                forbidden_[neigh] += delta;
+        }
+    }
+
+    bool PathEnumerator::admissible(NodeID current, size_t edge, NodeID child) const
+    {
+        if (maxLength_ > 0 && visited_.size() + 1 + hopsToDst_[child] > maxLength_)
+            return false;
+        if (maxLatency_ > 0.0 &&
+            latencyStack_.back() + latency_[current][edge] + latencyToDst_[child] > maxLatency_ + kLatencyTolerance)
+            return false;
+        return true;
+    }
+
+    size_t PathEnumerator::advance(size_t limit, PathSets* out)
+    {
+        if (maxPaths_ > 0)
+            limit = std::min(limit, maxPaths_ - std::min(produced_, maxPaths_));
+
+        size_t found = 0;
+        size_t steps = 0;
+
+        while (!iterStack_.empty() && !stopped_ && found < limit)
+        {
+            if (hasDeadline_ && ++steps % kClockInterval == 0 && Clock::now() >= deadline_)
+            {
+                stopped_ = true;
+                break;
+            }
+
+            NodeID current = visited_.back();
+
+            if (static_cast<size_t>(current) >= adj_.size() || iterStack_.back() >= adj_[current].size())
+            {
+                // Backtrack: the new last node no longer forbids its neighbours
+                iterStack_.pop_back();
+                onPath_[current] = 0;
+                visited_.pop_back();
+                if (maxLatency_ > 0.0)
+                    latencyStack_.pop_back();
+                if (!visited_.empty())
+                    updateForbidden(visited_.back(), -1);
+                if (!iterStack_.empty())
+                    ++iterStack_.back();
+                continue;
+            }
+
+            size_t edge = iterStack_.back();
+            NodeID child = adj_[current][edge];
+
+            if (forbidden_[child] > 0 || !admissible(current, edge, child))
+            {
+                ++iterStack_.back();
+                continue;
+            }
+
+            if (child == dst_)
+            {
+                if (out)
+                {
+                    Set path = visited_;
+                    path.push_back(dst_);
+                    out->push_back(std::move(path));
+                }
+                ++found;
+                ++iterStack_.back();
+            }
+            else if (!onPath_[child])
+            {
+                // Extend path: current stops being the last node
+                updateForbidden(current, +1);
+                if (maxLatency_ > 0.0)
+                    latencyStack_.push_back(latencyStack_.back() + latency_[current][edge]);
+                visited_.push_back(child);
+                onPath_[child] = 1;
+                iterStack_.push_back(0);
+            }
+            else
+            {
+                ++iterStack_.back();
+            }
+        }
+
+        produced_ += found;
+        if (maxPaths_ > 0 && produced_ >= maxPaths_ && !iterStack_.empty())
+            stopped_ = true;
+        return found;
+    }
+
+    PathSets PathEnumerator::next(size_t chunkSize)
+    {
+        PathSets paths;
+        paths.reserve(std::min<size_t>(chunkSize, 1024));
+        advance(chunkSize, &paths);
+        return paths;
+    }
+
+    size_t PathEnumerator::skipRemaining()
+    {
+        return advance(std::numeric_limits<size_t>::max(), nullptr);
+    }
+
+} // namespace pyrbd_core::sets
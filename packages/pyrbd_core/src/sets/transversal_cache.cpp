@@ -0,0 +1,132 @@
+#include <pyrbd_core/sets.hpp>
+#include <algorithm>
+
+namespace pyrbd_core::sets
+{
+    // ================================================================
+    // TransversalCache
+    //
+    // Each clause is hashed in two independent 64-bit lanes and the lanes
+    // are summed over the clauses, so the fingerprint of a family does
+    // not depend on the clause order. Hits move the entry to the front
+    // of the LRU list; inserts evict from the back.
+    // ================================================================
+
+    namespace {
+        constexpr size_t kEntryOverhead = 96;  // list node, map node, control block
+
+        // splitmix64 finaliser
+        std::uint64_t mix(std::uint64_t x)
+        {
+            x ^= x >> 30;
+            x *= 0xbf58476d1ce4e5b9ULL;
+            x ^= x >> 27;
+            x *= 0x94d049bb133111ebULL;
+            x ^= x >> 31;
+            return x;
+        }
+
+        std::uint64_t clauseHash(const Set& clause, std::uint64_t seed)
+        {
+            std::uint64_t h = seed;
+            for (NodeID e : clause)
+                h = mix(h ^ static_cast<std::uint32_t>(e));
+            return mix(h ^ clause.size());
+        }
+
+        size_t familyBytes(const TransversalCache::Family& family)
+        {
+            size_t bytes = family.size() * sizeof(Set);
+            for (const auto& s : family)
+                bytes += s.size() * sizeof(NodeID);
+            return bytes;
+        }
+    }
+
+    TransversalCache::Fingerprint TransversalCache::fingerprint(const Family& clauses,
+                                                                std::uint64_t variant)
+    {
+        Fingerprint key{mix(clauses.size()), mix(variant)};
+        for (const auto& c : clauses)
+        {
+            key.lo += clauseHash(c, 0x9e3779b97f4a7c15ULL);
+            key.hi += clauseHash(c, 0xc2b2ae3d27d4eb4fULL);
+        }
+        return key;
+    }
+
+    std::shared_ptr<const TransversalCache::Family>
+    TransversalCache::find(const Fingerprint& key)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        auto it = map_.find(key);
+        if (it == map_.end())
+        {
+            ++misses_;
+            return nullptr;
+        }
+        ++hits_;
+        lru_.splice(lru_.begin(), lru_, it->second);
+        return it->second->value;
+    }
+
+    void TransversalCache::insert(const Fingerprint& key, Family transversals)
+    {
+        size_t bytes = familyBytes(transversals) + kEntryOverhead;
+        if (bytes > maxBytes_)
+            return;
+
+        auto value = std::make_shared<const Family>(std::move(transversals));
+
+        std::lock_guard<std::mutex> lock(mutex_);
+        if (map_.count(key))
+            return;  // computed concurrently by another task
+
+        while (bytes_ + bytes > maxBytes_)
+        {
+            const Entry& victim = lru_.back();
+            bytes_ -= victim.bytes;
+            map_.erase(victim.key);
+            lru_.pop_back();
+        }
+
+        lru_.push_front(Entry{key, std::move(value), bytes});
+        map_.emplace(key, lru_.begin());
+        bytes_ += bytes;
+    }
+
+    size_t TransversalCache::size() const
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return map_.size();
+    }
+
+    size_t TransversalCache::bytes() const
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return bytes_;
+    }
+
+    size_t TransversalCache::hits() const
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return hits_;
+    }
+
+    size_t TransversalCache::misses() const
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return misses_;
+    }
+
+    void TransversalCache::clear()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        map_.clear();
+        lru_.clear();
+        bytes_ = 0;
+        hits_ = 0;
+        misses_ = 0;
+    }
+
+} // namespace pyrbd_core::sets
@@ -27,9 +27,15 @@ __all__ = [
     "graph_to_adjlist",
     "to_link_graph",
     "relabel_graph_A_dict",
+    "reduce_series_parallel",
+    "block_cut_tree",
     # Analysis
     "evaluate_availability",
+    "estimate_complexity",
     "to_boolean_expression",
     "minimalpaths",
+    "iter_minimalpaths",
+    "count_minimalpaths",
+    "minimalpaths_from_source",
     "minimalcuts",
 ]
@@ -6,9 +6,19 @@ Provides a unified evaluate_availability() entry point that dispatches
 to the appropriate C++ algorithm (MCS, Pathset, SDP) via pyrbd_core.
 """
 
+from collections import OrderedDict
 from itertools import combinations
+import math
+import threading
+import networkx as nx
 from pyrbd_suite.io import read_graph
-from pyrbd_suite.graph import graph_to_adjlist, to_link_graph, relabel_graph_A_dict
+from pyrbd_suite.graph import (
+    graph_to_adjlist,
+    to_link_graph,
+    relabel_graph_A_dict,
+    reduce_series_parallel,
+    block_cut_tree,
+)
 
 # Import the unified C++ core
 try:
@@ -33,6 +43,10 @@ ALGORITHM_CONFIG = {
         "cpp_module": "mcs",
         "problem_set_func": "minimalcuts",
         "needs_cuts": True,
+        # minimalcuts method; "separators" avoids enumerating paths on meshes
+        "cut_method": "cnf_tree",
+        # Memory cap of the cnf_tree subproblem memo shared by the pairs of a run
+        "cut_cache_bytes": 256 * 2**20,
     },
     "pathset": {
         "cpp_module": "pathset",
@@ -46,21 +60,171 @@ ALGORITHM_CONFIG = {
     },
 }
 
+# Engine selection for algorithm="auto". Estimated run time in seconds:
+#   sdp, pathset: coefficient * P^2 * L   (P paths of mean length L)
+#   mcs:          coefficient * C^2       (C minimal cut sets)
+# Coefficients were fitted on the bundled topologies.
+AUTO_CONFIG = {
+    "probes": 64,
+    "seed": 0,
+    # Cuts are only estimated (from the enumerated paths) below this path count
+    "max_cut_probe_paths": 20000,
+    # Refuse a pair when even the cheapest engine is estimated to take longer
+    "max_seconds": 600.0,
+    "coefficients": {
+        "sdp": 2e-7,
+        "pathset": 1e-5,
+        "mcs": 7e-5,
+    },
+}
+
+# Minimal path families of recently evaluated pairs, shared by the path
+# engines and the cut methods that start from paths
+PATH_CACHE_CONFIG = {
+    # Total path elements kept before the least recently used families go
+    "max_elements": 2**24,
+}
+
+
+def minimalpaths(G, src, dst, parallel=False, max_hops=None, max_latency=None,
+                 positions=None):
+    """Find the minimal paths between src and dst.
+
+    With max_hops or max_latency only the paths within the bound are
+    returned; the DFS prunes at the bound instead of filtering.
+
+    Args:
+        G (nx.Graph): The graph.
+        src (int): Source node.
+        dst (int): Destination node.
+        parallel (bool): Use OpenMP parallelization (unbounded only).
+        max_hops (int, optional): Maximum number of links on a path.
+        max_latency (float, optional): Maximum summed link latency, where a
+            link's latency is the Euclidean distance between its end nodes.
+        positions (dict, optional): Node → (x, y), as returned by read_graph.
+            Defaults to the X_coordinate/Y_coordinate node attributes.
+
+    Returns:
+        list: Minimal paths (lists of nodes).
+    """
+    if max_hops is not None or max_latency is not None:
+        enumerator, reverse_mapping = _path_enumerator(
+            G, src, dst, None, _hops_to_length(max_hops), None,
+            max_latency, positions)
+        return [[reverse_mapping[n] for n in p] for p in _drain(enumerator)]
 
-def minimalpaths(G, src, dst):
     # Relabel graph to 0..N-1 to avoid phantom node bugs in C++
     G_r, _, mapping = relabel_graph_A_dict(G, {})
     reverse_mapping = {v: k for k, v in mapping.items()}
     src_r, dst_r = mapping[src], mapping[dst]
     
     adj = graph_to_adjlist(G_r)
-    paths_r = cpp.sets.minimalpaths(adj, src_r, dst_r)
+    paths_r = _path_cache.get(adj, src_r, dst_r, parallel).to_list()
     
     # Map back
     return [[reverse_mapping[n] for n in p] for p in paths_r]
 
 
-def minimalcuts(G, src, dst, method="cnf_tree"):
+def iter_minimalpaths(G, src, dst, chunk_size=1024, max_paths=None,
+                      max_length=None, time_budget=None):
+    """Yield the minimal paths between src and dst without building the family.
+
+    Paths are fetched from the native DFS in chunks and come in the same
+    order as minimalpaths(). Enumeration stops early on any of the caps.
+
+    Args:
+        G (nx.Graph): The graph.
+        src (int): Source node.
+        dst (int): Destination node.
+        chunk_size (int): Number of paths fetched per native call.
+        max_paths (int, optional): Stop after this many paths.
+        max_length (int, optional): Only yield paths with at most this many nodes.
+        time_budget (float, optional): Stop after this many seconds.
+
+    Yields:
+        list: One minimal path (list of nodes).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+
+    enumerator, reverse_mapping = _path_enumerator(G, src, dst, max_paths,
+                                                   max_length, time_budget)
+    while not enumerator.finished:
+        for p in enumerator.next(chunk_size):
+            yield [reverse_mapping[n] for n in p]
+
+
+def count_minimalpaths(G, src, dst, max_paths=None, max_length=None,
+                       time_budget=None):
+    """Count the minimal paths between src and dst without storing them.
+
+    Useful to probe the size of a path family before running an engine
+    on it.
+
+    Args:
+        G (nx.Graph): The graph.
+        src (int): Source node.
+        dst (int): Destination node.
+        max_paths (int, optional): Stop counting after this many paths.
+        max_length (int, optional): Only count paths with at most this many nodes.
+        time_budget (float, optional): Stop counting after this many seconds.
+
+    Returns:
+        tuple: (count, complete) where complete is False if a path cap or
+        the time budget stopped the enumeration.
+    """
+    enumerator, _ = _path_enumerator(G, src, dst, max_paths, max_length, time_budget)
+    count = enumerator.skip_remaining()
+    return count, enumerator.exhausted
+
+
+def minimalpaths_from_source(G, src):
+    """Find the minimal paths from src to every other node with one DFS.
+
+    Args:
+        G (nx.Graph): The graph.
+        src (int): Source node.
+
+    Returns:
+        dict: Destination node → list of minimal paths from src.
+    """
+    # Relabel graph to 0..N-1 to avoid phantom node bugs in C++
+    G_r, _, mapping = relabel_graph_A_dict(G, {})
+    reverse_mapping = {v: k for k, v in mapping.items()}
+    src_r = mapping[src]
+
+    adj = graph_to_adjlist(G_r)
+    paths_by_dst_r = cpp.sets.minimalpaths_from_source(adj, src_r)
+
+    # Map back
+    return {
+        reverse_mapping[dst_r]: [[reverse_mapping[n] for n in p] for p in paths_r]
+        for dst_r, paths_r in enumerate(paths_by_dst_r)
+        if dst_r != src_r
+    }
+
+
+def minimalcuts(G, src, dst, method="cnf_tree", parallel=False, cache=None, max_order=None):
+    """Find the minimal cut sets between src and dst.
+
+    Args:
+        G (nx.Graph): The graph.
+        src (int): Source node.
+        dst (int): Destination node.
+        method (str): 'cnf_tree', 'shannon', 'multiplication', 'combination',
+            'combination_matrix', 'separators' (listed from the graph
+            without enumerating paths) or 'dualize' (Fredman-Khachiyan
+            dualisation of the path family).
+        parallel (bool): Use OpenMP parallelization (cnf_tree, shannon,
+            multiplication and combination_matrix).
+        cache (cpp.sets.TransversalCache, optional): Subproblem memo to
+            share between calls on the same graph (cnf_tree and shannon).
+        max_order (int, optional): Only return cut sets of at most this
+            many nodes.
+
+    Returns:
+        list: Minimal cut sets (lists of nodes), including [src] and [dst].
+    """
     # Relabel graph to 0..N-1 to avoid phantom node bugs in C++
     G_r, _, mapping = relabel_graph_A_dict(G, {})
     reverse_mapping = {v: k for k, v in mapping.items()}
@@ -68,7 +232,8 @@ def minimalcuts(G, src, dst, method="cnf_tree"):
     
     adj = graph_to_adjlist(G_r)
     num_nodes = len(G_r.nodes())
-    cuts_r = cpp.sets.minimalcuts(adj, src_r, dst_r, num_nodes, method)
+    cuts_r = _minimalcuts(adj, src_r, dst_r, num_nodes, method, parallel, cache,
+                          _check_order(max_order)).to_list()
     
     # Map back
     return [[reverse_mapping[n] for n in c] for c in cuts_r]
@@ -83,25 +248,61 @@ def evaluate_availability(
     parallel=False,
     count_link=False,
     edge_prob=None,
+    reduce=True,
+    decompose=True,
+    max_hops=None,
+    max_latency=None,
+    positions=None,
+    max_order=None,
 ):
     """Evaluate network availability.
 
     Args:
         graph_or_filepath: NetworkX graph or path to pickle file.
         nodes_probabilities (dict): Node ID → availability probability.
-        algorithm (str): 'mcs', 'pathset', or 'sdp'.
+        algorithm (str): 'mcs', 'pathset', 'sdp', or 'auto' to pick the
+            cheapest engine per pair from family size estimates.
         src (int, optional): Source node (None for all pairs).
-        dst (int, optional): Destination node (None for all pairs).
+        dst (int, optional): Destination node (None for all pairs, or for
+            all destinations of src when src is given).
         parallel (bool): Use OpenMP parallelization.
         count_link (bool): Consider link (edge) availability.
         edge_prob (dict, optional): Edge → probability mapping.
+        reduce (bool): Fold series chains and parallel nodes before
+            enumeration (see reduce_series_parallel).
+        decompose (bool): Split the graph into biconnected blocks and
+            multiply the availabilities of the blocks between src and dst.
+        max_hops (int, optional): Only count paths of at most this many
+            links (with count_link, links of the original graph).
+        max_latency (float, optional): Only count paths whose summed link
+            latency (Euclidean distance between node positions) is at most
+            this.
+        positions (dict, optional): Node → (x, y) used for latencies.
+            Defaults to the positions stored with a pickle file, else to the
+            X_coordinate/Y_coordinate node attributes.
+        max_order (int, optional): Only use minimal cut sets of at most
+            this many nodes ('mcs' engine).
+
+    With max_hops or max_latency the result is the probability that a
+    surviving path within the bound exists. Bounded evaluation uses the
+    path engines ('pathset', 'sdp') on the full graph; reduce and
+    decompose are ignored because they do not preserve path lengths.
+
+    With max_order every result gains a fourth entry, an upper bound on
+    the truncation error: the exact availability lies in
+    [availability - error_bound, availability]. Truncated evaluation
+    runs 'mcs' on the full graph; reduce and decompose are ignored
+    because they change cut orders.
 
     Returns:
-        tuple or list[tuple]: (src, dst, availability) results.
+        tuple or list[tuple]: (src, dst, availability) results, or
+        (src, dst, availability, error_bound) with max_order.
     """
     # Load graph
     if isinstance(graph_or_filepath, str):
-        G, _, _ = read_graph("", "", graph_or_filepath)
+        G, file_positions, _ = read_graph("", "", graph_or_filepath)
+        if positions is None:
+            positions = file_positions
     elif hasattr(graph_or_filepath, "nodes") and hasattr(graph_or_filepath, "edges"):
         G = graph_or_filepath
     else:
@@ -112,19 +313,79 @@ def evaluate_availability(
         raise TypeError("nodes_probabilities must be a dictionary.")
     if len(nodes_probabilities) != len(G.nodes()):
         raise ValueError("nodes_probabilities must contain probabilities for all nodes.")
-    if algorithm not in ALGORITHM_CONFIG:
-        raise ValueError(f"Unsupported algorithm: {algorithm}. Choose from {list(ALGORITHM_CONFIG.keys())}.")
+    if algorithm not in ALGORITHM_CONFIG and algorithm != "auto":
+        raise ValueError(f"Unsupported algorithm: {algorithm}. Choose from {list(ALGORITHM_CONFIG.keys()) + ['auto']}.")
+
+    if max_hops is not None or max_latency is not None or max_order is not None:
+        if src is not None and dst is not None:
+            node_pairs = [(src, dst)]
+        elif src is not None:
+            node_pairs = [(src, d) for d in sorted(G.nodes()) if d != src]
+        elif dst is None:
+            node_pairs = list(combinations(sorted(G.nodes()), 2))
+        else:
+            raise ValueError("A destination requires a source; specify src, src and dst, or neither.")
+        if any(n not in G.nodes() for pair in node_pairs for n in pair):
+            raise ValueError(f"Source {src} or destination {dst} not found in graph.")
+        if max_order is None:
+            results = _eval_bounded(G, nodes_probabilities, node_pairs, algorithm, parallel,
+                                    count_link, edge_prob, max_hops, max_latency, positions)
+        elif max_hops is None and max_latency is None:
+            results = _eval_truncated(G, nodes_probabilities, node_pairs, algorithm, parallel,
+                                      count_link, edge_prob, max_order)
+        else:
+            raise ValueError("max_order cannot be combined with max_hops/max_latency.")
+        return results[0] if dst is not None else results
 
     if src is not None and dst is not None:
         if src not in G.nodes() or dst not in G.nodes():
             raise ValueError(f"Source {src} or destination {dst} not found in graph.")
         return _eval_single_pair(G, nodes_probabilities, src, dst, algorithm,
-                                  parallel, count_link, edge_prob)
-    elif src is None and dst is None:
+                                  parallel, count_link, edge_prob, reduce, decompose)
+    elif src is not None:
+        if src not in G.nodes():
+            raise ValueError(f"Source {src} not found in graph.")
+        return _eval_from_source(G, nodes_probabilities, src, algorithm,
+                                 parallel, count_link, edge_prob, reduce, decompose)
+    elif dst is None:
         return _eval_topology(G, nodes_probabilities, algorithm,
-                               parallel, count_link, edge_prob)
+                               parallel, count_link, edge_prob, reduce, decompose)
     else:
-        raise ValueError("Both source and destination must be specified or neither.")
+        raise ValueError("A destination requires a source; specify src, src and dst, or neither.")
+
+
+def estimate_complexity(G, src, dst, probes=None, seed=None):
+    """Estimate how expensive each engine is for a (src, dst) pair.
+
+    Path counts come from random probes of the minimal path DFS. When the
+    path family is small enough it is enumerated and the cut count is
+    estimated from probes of the hitting-set tree over it.
+
+    Args:
+        G (nx.Graph): The graph.
+        src (int): Source node.
+        dst (int): Destination node.
+        probes (int, optional): Number of random probes (AUTO_CONFIG default).
+        seed (int, optional): Random seed (AUTO_CONFIG default).
+
+    Returns:
+        dict: Estimated path count, mean path length and cut count (None
+        if not probed), estimated seconds per engine, the recommended
+        algorithm, and degree/connectivity statistics of G.
+    """
+    G_r, _, mapping = relabel_graph_A_dict(G, {})
+    estimate = _estimate_pair(graph_to_adjlist(G_r), mapping[src], mapping[dst],
+                              probes, seed)
+
+    degrees = [deg for _, deg in G.degree()]
+    estimate.update({
+        "nodes": G.number_of_nodes(),
+        "edges": G.number_of_edges(),
+        "mean_degree": sum(degrees) / len(degrees),
+        "max_degree": max(degrees),
+        "connectivity": nx.node_connectivity(G, src, dst),
+    })
+    return estimate
 
 
 def to_boolean_expression(G, src, dst, algorithm):
@@ -162,26 +423,184 @@ def to_boolean_expression(G, src, dst, algorithm):
 # Internal helpers
 # ================================================================
 
+class _PathFamilyCache:
+    """LRU of minimal path families (SetFamily) of relabelled pairs.
+
+    Families are keyed by the adjacency lists and terminals, so every
+    engine and cut method evaluating a pair of the same graph reuses one
+    enumeration. The size is bounded by the total number of stored path
+    elements (PATH_CACHE_CONFIG["max_elements"]).
+    """
+
+    def __init__(self):
+        self._families = OrderedDict()
+        self._elements = 0
+        self._lock = threading.Lock()
+
+    def get(self, adj, src, dst, parallel=False):
+        key = (tuple(map(tuple, adj)), src, dst)
+        with self._lock:
+            family = self._families.get(key)
+            if family is not None:
+                self._families.move_to_end(key)
+                return family
+
+        family = cpp.sets.minimalpaths(adj, src, dst, parallel, as_family=True)
+        max_elements = PATH_CACHE_CONFIG["max_elements"]
+        with self._lock:
+            if key not in self._families and len(family.elements) <= max_elements:
+                self._families[key] = family
+                self._elements += len(family.elements)
+            while self._elements > max_elements:
+                _, dropped = self._families.popitem(last=False)
+                self._elements -= len(dropped.elements)
+        return family
+
+    def clear(self):
+        with self._lock:
+            self._families.clear()
+            self._elements = 0
+
+    def __len__(self):
+        return len(self._families)
+
+
+_path_cache = _PathFamilyCache()
+
+
+def _minimalcuts(adj, src, dst, num_nodes, method, parallel=False, cache=None, max_order=0):
+    """Minimal cut sets (SetFamily) of a relabelled pair.
+
+    All methods but separators start from the cached path family.
+    """
+    if method == "separators":
+        return cpp.sets.minimalcuts(adj, src, dst, num_nodes, method, as_family=True,
+                                    parallel=parallel, cache=cache, max_order=max_order)
+    return cpp.sets.minimalcuts_from_paths(_path_cache.get(adj, src, dst, parallel), src, dst,
+                                           method, num_nodes, as_family=True,
+                                           parallel=parallel, cache=cache, max_order=max_order)
+
+
+def _path_enumerator(G, src, dst, max_paths, max_length, time_budget,
+                     max_latency=None, positions=None):
+    """Create a native PathEnumerator on the relabelled graph."""
+    G_r, _, mapping = relabel_graph_A_dict(G, {})
+    reverse_mapping = {v: k for k, v in mapping.items()}
+    adj = graph_to_adjlist(G_r)
+
+    latency = []
+    if max_latency is not None:
+        latency = _latency_adjlist(adj, _node_positions(G, positions), reverse_mapping)
+
+    enumerator = cpp.sets.PathEnumerator(
+        adj, mapping[src], mapping[dst],
+        max_paths=max_paths or 0,
+        max_length=max_length or 0,
+        time_budget=time_budget or 0.0,
+        latency=latency,
+        max_latency=_check_latency(max_latency),
+    )
+    return enumerator, reverse_mapping
+
+
+def _drain(enumerator, chunk_size=4096):
+    """Collect every remaining path of a PathEnumerator."""
+    paths = []
+    while not enumerator.finished:
+        paths.extend(enumerator.next(chunk_size))
+    return paths
+
+
+def _hops_to_length(max_hops, nodes_per_hop=1):
+    """Convert a hop bound into a PathEnumerator max_length (in nodes)."""
+    if max_hops is None:
+        return None
+    if max_hops < 1:
+        raise ValueError("max_hops must be at least 1.")
+    return nodes_per_hop * max_hops + 1
+
+
+def _check_order(max_order):
+    """Validate a cut order bound and convert it for minimalcuts."""
+    if max_order is None:
+        return 0
+    if max_order < 1:
+        raise ValueError("max_order must be at least 1.")
+    return int(max_order)
+
+
+def _check_latency(max_latency):
+    """Validate a latency bound and convert it for PathEnumerator."""
+    if max_latency is None:
+        return 0.0
+    if max_latency <= 0:
+        raise ValueError("max_latency must be positive.")
+    return float(max_latency)
+
+
+def _node_positions(G, positions=None):
+    """Return node → (x, y) for every node of G.
+
+    Missing positions are read from the X_coordinate/Y_coordinate node
+    attributes; nodes inserted by to_link_graph sit at the midpoint of
+    their two end nodes, which keeps link latencies unchanged.
+    """
+    positions = dict(positions or {})
+    for n, data in G.nodes(data=True):
+        if n not in positions and "X_coordinate" in data and "Y_coordinate" in data:
+            positions[n] = (data["X_coordinate"], data["Y_coordinate"])
+
+    for n in G.nodes():
+        if n not in positions:
+            ends = list(G.neighbors(n))
+            if len(ends) != 2 or any(e not in positions for e in ends):
+                raise ValueError(f"No position for node {n}; pass positions to bound latency.")
+            (x1, y1), (x2, y2) = positions[ends[0]], positions[ends[1]]
+            positions[n] = ((x1 + x2) / 2, (y1 + y2) / 2)
+    return positions
+
+
+def _latency_adjlist(adj, positions, reverse_mapping):
+    """Per-edge latencies shaped like adj (relabelled nodes)."""
+    def position(n):
+        return positions[reverse_mapping[n]]
+
+    return [
+        [math.dist(position(u), position(v)) for v in neighbours]
+        for u, neighbours in enumerate(adj)
+    ]
+
+
 def _eval_single_pair(G, A_dict, src, dst, algorithm, parallel=False,
-                       count_link=False, edge_prob=None):
+                       count_link=False, edge_prob=None, reduce=True,
+                       decompose=True):
     """Evaluate availability for a single (src, dst) pair."""
     if count_link and not edge_prob:
         raise ValueError("Edge probabilities required when count_link is True.")
 
-    config = ALGORITHM_CONFIG[algorithm]
-    cpp_module = getattr(cpp, config["cpp_module"])
-
     if count_link:
         G, A_dict = to_link_graph(G, A_dict, edge_prob)
+    if decompose and not nx.is_biconnected(G):
+        return _eval_decomposed(G, A_dict, [(src, dst)], algorithm, parallel, reduce)[0]
+    if reduce:
+        G, A_dict, _ = reduce_series_parallel(G, A_dict, terminals=(src, dst))
 
     G_r, A_dict_r, mapping = relabel_graph_A_dict(G, A_dict)
     src_r, dst_r = mapping[src], mapping[dst]
     adj = graph_to_adjlist(G_r)
 
+    if algorithm == "auto":
+        algorithm = _estimate_pair(adj, src_r, dst_r)["algorithm"]
+    config = ALGORITHM_CONFIG[algorithm]
+    cpp_module = getattr(cpp, config["cpp_module"])
+
+    # Sets stay in native CSR form (SetFamily) on their way to the engine
+    # and the path family is enumerated once for every engine
     if config["needs_cuts"]:
-        problem_sets = cpp.sets.minimalcuts(adj, src_r, dst_r, max(G_r.nodes()) + 1)
+        problem_sets = _minimalcuts(adj, src_r, dst_r, max(G_r.nodes()) + 1,
+                                    config["cut_method"], parallel)
     else:
-        problem_sets = cpp.sets.minimalpaths(adj, src_r, dst_r)
+        problem_sets = _path_cache.get(adj, src_r, dst_r, parallel)
 
     if parallel and hasattr(cpp_module, "eval_avail_parallel"):
         availability = cpp_module.eval_avail_parallel(src_r, dst_r, A_dict_r, problem_sets)
@@ -192,41 +611,402 @@ def _eval_single_pair(G, A_dict, src, dst, algorithm, parallel=False,
 
 
 def _eval_topology(G, A_dict, algorithm, parallel=False,
-                    count_link=False, edge_prob=None):
+                    count_link=False, edge_prob=None, reduce=True,
+                    decompose=True):
     """Evaluate availability for all node pairs."""
     if count_link and not edge_prob:
         raise ValueError("Edge probabilities required when count_link is True.")
 
-    config = ALGORITHM_CONFIG[algorithm]
-    cpp_module = getattr(cpp, config["cpp_module"])
+    if count_link:
+        G, A_dict = to_link_graph(G, A_dict, edge_prob)
+
+    node_pairs = list(combinations(sorted(G.nodes()), 2))
+    if decompose and not nx.is_biconnected(G):
+        return _eval_decomposed(G, A_dict, node_pairs, algorithm, parallel, reduce)
+
+    def evaluate(G, A_dict, node_pairs):
+        return _eval_pairs(G, A_dict, node_pairs, algorithm, parallel)
+
+    if reduce:
+        return _eval_reduced(G, A_dict, node_pairs, algorithm, parallel, evaluate)
+    return evaluate(G, A_dict, node_pairs)
+
+
+def _eval_from_source(G, A_dict, src, algorithm, parallel=False,
+                      count_link=False, edge_prob=None, reduce=True,
+                      decompose=True):
+    """Evaluate availability from src to every other node of G."""
+    if count_link and not edge_prob:
+        raise ValueError("Edge probabilities required when count_link is True.")
+
+    destinations = [d for d in sorted(G.nodes()) if d != src]
 
     if count_link:
         G, A_dict = to_link_graph(G, A_dict, edge_prob)
+    if decompose and not nx.is_biconnected(G):
+        node_pairs = [(src, d) for d in destinations]
+        return _eval_decomposed(G, A_dict, node_pairs, algorithm, parallel, reduce)
+
+    return _eval_source(G, A_dict, src, destinations, algorithm, parallel, reduce)
+
+
+def _eval_source(G, A_dict, src, destinations, algorithm, parallel=False, reduce=True):
+    """Evaluate availability from src to the given destinations of G."""
+    node_pairs = [(src, d) for d in destinations]
+
+    def evaluate(G, A_dict, node_pairs):
+        return _eval_source_pairs(G, A_dict, src, [d for _, d in node_pairs],
+                                  algorithm, parallel)
+
+    if reduce:
+        return _eval_reduced(G, A_dict, node_pairs, algorithm, parallel, evaluate,
+                             terminals=(src,))
+    return evaluate(G, A_dict, node_pairs)
+
+
+def _eval_decomposed(G, A_dict, node_pairs, algorithm, parallel=False, reduce=True):
+    """Evaluate node pairs block by block along the block-cut tree.
+
+    A(s, t) = p(s) * prod A'_B(entry, exit) over the blocks B on the tree
+    path from s to t, where A'_B is the availability within B with its
+    entry node taken as up, since the previous block already counted it.
+    Sub-results are computed once per (block, entry, exit) and shared by
+    all pairs crossing the same block. Pairs in different components are
+    evaluated on the whole graph.
+    """
+    blocks, tree, home = block_cut_tree(G)
+    component = {
+        tree_node: i
+        for i, tree_nodes in enumerate(nx.connected_components(tree))
+        for tree_node in tree_nodes
+    }
+
+    hops_by_pair = {}
+    for s, d in node_pairs:
+        if s in home and d in home and component[home[s]] == component[home[d]]:
+            hops_by_pair[(s, d)] = _block_hops(tree, home, s, d)
+
+    # Exits needed per (block, entry), so each entry is solved in one batch
+    exits = {}
+    for hops in hops_by_pair.values():
+        for block, entry, exit_ in hops:
+            exits.setdefault((block, entry), {})[exit_] = None
+
+    cache = {}
+    for (block, entry), block_exits in exits.items():
+        G_block = G.subgraph(blocks[block])
+        A_block = {n: A_dict[n] for n in blocks[block]}
+        A_block[entry] = 1.0
+        block_exits = list(block_exits)
+
+        if len(blocks[block]) == 2:
+            # Bridge: only the exit node can fail
+            results = [(entry, exit_, A_block[exit_]) for exit_ in block_exits]
+        elif len(block_exits) == 1:
+            results = [_eval_single_pair(G_block, A_block, entry, block_exits[0],
+                                         algorithm, parallel, reduce=reduce,
+                                         decompose=False)]
+        else:
+            results = _eval_source(G_block, A_block, entry, block_exits,
+                                   algorithm, parallel, reduce)
+
+        for _, exit_, avail in results:
+            cache[(block, entry, exit_)] = avail
+
+    results = []
+    for s, d in node_pairs:
+        hops = hops_by_pair.get((s, d))
+        if hops is None:
+            avail = _eval_single_pair(G, A_dict, s, d, algorithm, parallel,
+                                      reduce=reduce, decompose=False)[2]
+        else:
+            avail = A_dict[s]
+            for hop in hops:
+                avail *= cache[hop]
+        results.append((s, d, avail))
+
+    return results
+
+
+def _block_hops(tree, home, src, dst):
+    """List the (block, entry, exit) hops on the block-cut tree path."""
+    path = nx.shortest_path(tree, home[src], home[dst])
+    hops = []
+    entry = src
+    for i, (kind, key) in enumerate(path):
+        if kind == "block":
+            exit_ = path[i + 1][1] if i + 1 < len(path) else dst
+            hops.append((key, entry, exit_))
+            entry = exit_
+    return hops
+
+
+def _eval_reduced(G, A_dict, node_pairs, algorithm, parallel, evaluate, terminals=()):
+    """Evaluate node pairs on a graph reduced once for all of them.
+
+    Pairs whose endpoints survive the shared reduction unmerged are passed
+    to evaluate() on the reduced graph. The remaining pairs are evaluated
+    one by one with a reduction that keeps their endpoints.
+    """
+    G_red, A_red, groups = reduce_series_parallel(G, A_dict, terminals)
+    kept = {node for node, members in groups.items() if members == [node]}
+
+    shared = [(s, d) for s, d in node_pairs if s in kept and d in kept]
+    results = {}
+    if shared:
+        results = {(s, d): avail for s, d, avail in evaluate(G_red, A_red, shared)}
+
+    for s, d in node_pairs:
+        if (s, d) not in results:
+            results[(s, d)] = _eval_single_pair(G, A_dict, s, d, algorithm, parallel,
+                                                decompose=False)[2]
+
+    return [(s, d, results[(s, d)]) for s, d in node_pairs]
+
+
+def _eval_pairs(G, A_dict, node_pairs, algorithm, parallel=False):
+    """Evaluate availability for the given node pairs of G."""
+    if algorithm == "auto":
+        return _eval_auto(G, A_dict, node_pairs, parallel, _eval_pairs)
+
+    config = ALGORITHM_CONFIG[algorithm]
+    cpp_module = getattr(cpp, config["cpp_module"])
 
     G_r, A_dict_r, mapping = relabel_graph_A_dict(G, A_dict)
     reverse_mapping = {v: k for k, v in mapping.items()}
 
-    node_pairs = list(combinations(sorted(G_r.nodes()), 2))
+    node_pairs_r = [(mapping[s], mapping[d]) for s, d in node_pairs]
     adj = graph_to_adjlist(G_r)
 
     if config["needs_cuts"]:
+        cache = cpp.sets.TransversalCache(config["cut_cache_bytes"])
         problem_sets_list = [
-            cpp.sets.minimalcuts(adj, s, d, max(G_r.nodes()) + 1)
-            for s, d in node_pairs
+            _minimalcuts(adj, s, d, max(G_r.nodes()) + 1, config["cut_method"],
+                         parallel, cache)
+            for s, d in node_pairs_r
         ]
     else:
+        problem_sets_list = cpp.sets.minimalpaths_all_pairs(adj, node_pairs_r, as_family=True)
+
+    return _eval_problem_sets(cpp_module, node_pairs_r, A_dict_r, problem_sets_list,
+                              reverse_mapping, parallel)
+
+
+def _eval_source_pairs(G, A_dict, src, destinations, algorithm, parallel=False):
+    """Evaluate availability from src to the given destinations of G."""
+    if algorithm == "auto":
+        def evaluate(G, A_dict, node_pairs, algorithm, parallel):
+            return _eval_source_pairs(G, A_dict, src, [d for _, d in node_pairs],
+                                      algorithm, parallel)
+        return _eval_auto(G, A_dict, [(src, d) for d in destinations], parallel, evaluate)
+
+    config = ALGORITHM_CONFIG[algorithm]
+    cpp_module = getattr(cpp, config["cpp_module"])
+
+    G_r, A_dict_r, mapping = relabel_graph_A_dict(G, A_dict)
+    reverse_mapping = {v: k for k, v in mapping.items()}
+
+    src_r = mapping[src]
+    node_pairs_r = [(src_r, mapping[d]) for d in destinations]
+    adj = graph_to_adjlist(G_r)
+
+    if config["needs_cuts"]:
+        cache = cpp.sets.TransversalCache(config["cut_cache_bytes"])
         problem_sets_list = [
-            cpp.sets.minimalpaths(adj, s, d)
-            for s, d in node_pairs
+            _minimalcuts(adj, s, d, max(G_r.nodes()) + 1, config["cut_method"],
+                         parallel, cache)
+            for s, d in node_pairs_r
         ]
+    else:
+        # One DFS from src yields the path families of all destinations
+        paths_by_dst = cpp.sets.minimalpaths_from_source(adj, src_r, as_family=True)
+        problem_sets_list = [paths_by_dst[d] for _, d in node_pairs_r]
+
+    return _eval_problem_sets(cpp_module, node_pairs_r, A_dict_r, problem_sets_list,
+                              reverse_mapping, parallel)
+
+
+def _eval_auto(G, A_dict, node_pairs, parallel, evaluate):
+    """Pick the cheapest engine per pair and evaluate each group with it."""
+    G_r, _, mapping = relabel_graph_A_dict(G, {})
+    adj = graph_to_adjlist(G_r)
+
+    groups = {}
+    for s, d in node_pairs:
+        algorithm = _estimate_pair(adj, mapping[s], mapping[d])["algorithm"]
+        groups.setdefault(algorithm, []).append((s, d))
+
+    results = {}
+    for algorithm, pairs in groups.items():
+        for s, d, avail in evaluate(G, A_dict, pairs, algorithm, parallel):
+            results[(s, d)] = avail
+
+    return [(s, d, results[(s, d)]) for s, d in node_pairs]
+
+
+def _estimate_pair(adj, src, dst, probes=None, seed=None):
+    """Estimate family sizes and engine costs for a relabelled pair.
+
+    Raises:
+        ValueError: If even the cheapest engine exceeds AUTO_CONFIG["max_seconds"].
+    """
+    probes = AUTO_CONFIG["probes"] if probes is None else probes
+    seed = AUTO_CONFIG["seed"] if seed is None else seed
+    coefficients = AUTO_CONFIG["coefficients"]
+
+    num_paths, _, length = cpp.sets.estimate_path_count(adj, src, dst, probes, seed)
+    num_cuts = None
+    if num_paths <= AUTO_CONFIG["max_cut_probe_paths"]:
+        # Small enough to enumerate: use exact path figures and probe the
+        # cuts (the family stays cached for the chosen engine)
+        paths = _path_cache.get(adj, src, dst)
+        num_paths = len(paths)
+        length = len(paths.elements) / num_paths if num_paths else 0.0
+        num_cuts, _ = cpp.sets.estimate_cut_count(paths, probes, seed)
+
+    costs = {
+        "sdp": coefficients["sdp"] * num_paths ** 2 * length,
+        "pathset": coefficients["pathset"] * num_paths ** 2 * length,
+    }
+    if num_cuts is not None:
+        costs["mcs"] = coefficients["mcs"] * num_cuts ** 2
+
+    algorithm = min(costs, key=costs.get)
+    if costs[algorithm] > AUTO_CONFIG["max_seconds"]:
+        raise ValueError(
+            f"Estimated {num_paths:.3g} minimal paths for the pair; "
+            f"the cheapest engine ({algorithm}) would take about {costs[algorithm]:.3g} s, "
+            f"over the {AUTO_CONFIG['max_seconds']} s limit."
+        )
+
+    return {
+        "paths": num_paths,
+        "path_length": length,
+        "cuts": num_cuts,
+        "costs": costs,
+        "algorithm": algorithm,
+    }
+
+
+def _eval_bounded(G, A_dict, node_pairs, algorithm, parallel, count_link, edge_prob,
+                  max_hops, max_latency, positions):
+    """Evaluate hop/latency-bounded availability for the given node pairs.
+
+    Every path within the bound contains a minimal path within the bound
+    (dropping chords shortens a path in hops and, by the triangle
+    inequality, in latency), so the bounded minimal path family describes
+    the bounded connectivity exactly.
+    """
+    if count_link and not edge_prob:
+        raise ValueError("Edge probabilities required when count_link is True.")
+    if algorithm == "auto":
+        # Both path engines cost coefficient * P^2 * L; take the cheaper one
+        algorithm = min(("sdp", "pathset"), key=AUTO_CONFIG["coefficients"].get)
+    if ALGORITHM_CONFIG[algorithm]["needs_cuts"]:
+        raise ValueError("max_hops/max_latency require a path engine ('pathset' or 'sdp').")
+
+    # A link of the original graph is two hops in the link graph
+    max_length = _hops_to_length(max_hops, 2 if count_link else 1)
+    max_latency_value = _check_latency(max_latency)
+    if count_link:
+        G, A_dict = to_link_graph(G, A_dict, edge_prob)
+
+    G_r, A_dict_r, mapping = relabel_graph_A_dict(G, A_dict)
+    reverse_mapping = {v: k for k, v in mapping.items()}
+    adj = graph_to_adjlist(G_r)
+
+    latency = []
+    if max_latency is not None:
+        latency = _latency_adjlist(adj, _node_positions(G, positions), reverse_mapping)
+
+    node_pairs_r = [(mapping[s], mapping[d]) for s, d in node_pairs]
+    problem_sets_list = [
+        _drain(cpp.sets.PathEnumerator(adj, s, d, max_length=max_length or 0,
+                                       latency=latency, max_latency=max_latency_value))
+        for s, d in node_pairs_r
+    ]
+
+    cpp_module = getattr(cpp, ALGORITHM_CONFIG[algorithm]["cpp_module"])
+    return _eval_problem_sets(cpp_module, node_pairs_r, A_dict_r, problem_sets_list,
+                              reverse_mapping, parallel)
+
+
+def _eval_truncated(G, A_dict, node_pairs, algorithm, parallel, count_link, edge_prob,
+                    max_order):
+    """Evaluate availability from the minimal cut sets of at most max_order nodes.
+
+    Dropping cut sets can only raise the computed availability. A larger
+    minimal cut set never contains src, dst or an articulation node on
+    the way between them (each is a cut set on its own) and lies within
+    the blocks they traverse, so it only fails if more than max_order of
+    the remaining nodes of those blocks fail; that probability bounds the
+    error.
+    """
+    if count_link and not edge_prob:
+        raise ValueError("Edge probabilities required when count_link is True.")
+    if algorithm == "auto":
+        algorithm = "mcs"
+    if not ALGORITHM_CONFIG[algorithm]["needs_cuts"]:
+        raise ValueError("max_order requires the cut set engine ('mcs').")
+    max_order = _check_order(max_order)
+
+    if count_link:
+        G, A_dict = to_link_graph(G, A_dict, edge_prob)
+
+    config = ALGORITHM_CONFIG[algorithm]
+    G_r, A_dict_r, mapping = relabel_graph_A_dict(G, A_dict)
+    reverse_mapping = {v: k for k, v in mapping.items()}
+    adj = graph_to_adjlist(G_r)
+
+    node_pairs_r = [(mapping[s], mapping[d]) for s, d in node_pairs]
+    cache = cpp.sets.TransversalCache(config["cut_cache_bytes"])
+    problem_sets_list = [
+        _minimalcuts(adj, s, d, max(G_r.nodes()) + 1, config["cut_method"],
+                     parallel, cache, max_order)
+        for s, d in node_pairs_r
+    ]
+
+    cpp_module = getattr(cpp, config["cpp_module"])
+    results = _eval_problem_sets(cpp_module, node_pairs_r, A_dict_r, problem_sets_list,
+                                 reverse_mapping, parallel)
+
+    blocks, tree, home = block_cut_tree(G)
+    return [
+        (s, d, avail, _truncation_bound(A_dict, blocks, tree, home, s, d, max_order))
+        for s, d, avail in results
+    ]
+
+
+def _truncation_bound(A_dict, blocks, tree, home, src, dst, max_order):
+    """Probability that more than max_order nodes able to join a larger cut fail."""
+    if src not in home or dst not in home or not nx.has_path(tree, home[src], home[dst]):
+        return 0.0
+
+    hops = _block_hops(tree, home, src, dst)
+    nodes = set().union(*(blocks[block] for block, _, _ in hops))
+    nodes -= {node for _, entry, exit_ in hops for node in (entry, exit_)}
+
+    # failed[j] = P(j nodes failed); the last entry collects more than max_order
+    failed = [1.0] + [0.0] * (max_order + 1)
+    for node in nodes:
+        q = 1.0 - A_dict[node]
+        failed[-1] += failed[-2] * q
+        for j in range(max_order, 0, -1):
+            failed[j] = failed[j] * (1.0 - q) + failed[j - 1] * q
+        failed[0] *= 1.0 - q
+    return failed[-1]
+
 
+def _eval_problem_sets(cpp_module, node_pairs, A_dict, problem_sets_list,
+                       reverse_mapping, parallel=False):
+    """Run a topology engine and map its results back to original labels."""
     if parallel and hasattr(cpp_module, "eval_avail_topo_parallel"):
         availability_lst = cpp_module.eval_avail_topo_parallel(
-            node_pairs, A_dict_r, problem_sets_list
+            node_pairs, A_dict, problem_sets_list
         )
     else:
         availability_lst = cpp_module.eval_avail_topo(
-            node_pairs, A_dict_r, problem_sets_list
+            node_pairs, A_dict, problem_sets_list
         )
 
     return [
@@ -259,7 +1039,11 @@ def _format_bool_expr(result_set, algorithm):
 
 __all__ = [
     "evaluate_availability",
+    "estimate_complexity",
     "to_boolean_expression",
     "minimalpaths",
+    "iter_minimalpaths",
+    "count_minimalpaths",
+    "minimalpaths_from_source",
     "minimalcuts",
 ]
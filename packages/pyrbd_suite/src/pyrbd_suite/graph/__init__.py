@@ -3,7 +3,9 @@ pyrbd_suite.graph — NetworkX graph preparation
 ===============================================
 
 Converts NetworkX graphs to adjacency lists for the C++ core,
-and provides link-graph transformation for edge reliability.
+and provides link-graph transformation for edge reliability,
+series/parallel reduction and block-cut-tree decomposition ahead of
+set enumeration.
 """
 
 import networkx as nx
@@ -74,8 +76,118 @@ def relabel_graph_A_dict(G, avail_dict):
     return G_relabel, A_dict_relabel, relabel_mapping
 
 
+def reduce_series_parallel(G, A_dict, terminals=()):
+    """Shrink a graph with reductions that preserve terminal availability.
+
+    Only non-terminal nodes are touched, so the availability between any
+    two surviving, unmerged nodes is unchanged. The following rules are
+    applied until none matches:
+
+    - A node of degree 0 or 1 is removed; it lies on no simple path.
+    - A degree-2 node whose two neighbours are adjacent is removed; every
+      path through it has a shorter detour.
+    - Two adjacent degree-2 nodes are merged in series; the merged node
+      has the product of their availabilities.
+    - Two degree-2 nodes with the same two neighbours are merged in
+      parallel; the merged node has availability 1 - (1 - p1)(1 - p2).
+
+    Args:
+        G (nx.Graph): The input graph.
+        A_dict (dict): Node availability probabilities.
+        terminals (iterable): Nodes that must be kept as they are.
+
+    Returns:
+        tuple: (reduced_graph, reduced_A_dict, groups), where groups maps
+        each node of the reduced graph to the original nodes folded into it.
+    """
+    H = nx.Graph(G)
+    A = {node: A_dict[node] for node in H.nodes()}
+    groups = {node: [node] for node in H.nodes()}
+    terminals = set(terminals)
+
+    def remove(node):
+        H.remove_node(node)
+        del A[node], groups[node]
+
+    def merge(keep, node, avail):
+        A[keep] = avail
+        groups[keep].extend(groups.pop(node))
+        del A[node]
+
+    changed = True
+    while changed:
+        changed = False
+        for u in list(H.nodes()):
+            if u not in H or u in terminals:
+                continue
+
+            if H.degree(u) <= 1:
+                remove(u)
+                changed = True
+                continue
+            if H.degree(u) != 2:
+                continue
+
+            a, b = H.neighbors(u)
+            if H.has_edge(a, b):
+                remove(u)
+                changed = True
+                continue
+
+            # Series: absorb a degree-2 neighbour, u takes over its other edge
+            v = next((x for x in (a, b) if x not in terminals and H.degree(x) == 2), None)
+            if v is not None:
+                w = next(x for x in H.neighbors(v) if x != u)
+                H.remove_node(v)
+                H.add_edge(u, w)
+                merge(u, v, A[u] * A[v])
+                changed = True
+                continue
+
+            # Parallel: absorb a degree-2 node with the same two neighbours
+            for v in list(H.neighbors(a)):
+                if (v != u and v not in terminals and H.degree(v) == 2
+                        and H.has_edge(v, b)):
+                    H.remove_node(v)
+                    merge(u, v, 1 - (1 - A[u]) * (1 - A[v]))
+                    changed = True
+
+    return H, A, groups
+
+
+def block_cut_tree(G):
+    """Build the block-cut tree of a graph.
+
+    Args:
+        G (nx.Graph): The input graph.
+
+    Returns:
+        tuple: (blocks, tree, home) where blocks is the list of biconnected
+        components (node sets), tree has a node ("block", i) per block and
+        ("cut", v) per articulation node v joined to the blocks containing
+        v, and home maps every non-isolated node to its tree node.
+    """
+    blocks = [frozenset(block) for block in nx.biconnected_components(G)]
+    cuts = set(nx.articulation_points(G))
+
+    tree = nx.Graph()
+    home = {}
+    for i, block in enumerate(blocks):
+        tree.add_node(("block", i))
+        for node in block:
+            if node in cuts:
+                tree.add_edge(("block", i), ("cut", node))
+                home[node] = ("cut", node)
+            else:
+                home[node] = ("block", i)
+
+    return blocks, tree, home
+
+
 __all__ = [
     "graph_to_adjlist",
     "to_link_graph",
     "relabel_graph_A_dict",
+    "reduce_series_parallel",
+    "block_cut_tree",
 ]
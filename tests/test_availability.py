@@ -82,3 +82,182 @@ def test_link_counted_availability(germany17_data):
             count_link=True, edge_prob=edge_prob, parallel=False
         )
         assert new_link[2] == pytest.approx(old_link[2], abs=TOL), f"Link-counted mismatch at {src}->{dst}!"
+
+
+@pytest.mark.parametrize("algorithm", ["mcs", "pathset", "sdp"])
+def test_eval_from_source(germany17_data, algorithm):
+    """One-to-many mode must match single-pair evaluation for every destination."""
+    G, node_prob = germany17_data
+    src = sorted(G.nodes())[0]
+
+    results = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm, src=src)
+    assert [d for _, d, _ in results] == sorted(n for n in G.nodes() if n != src)
+
+    for s, d, avail in results:
+        expected = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm, src=s, dst=d)
+        assert avail == pytest.approx(expected[2], abs=TOL), f"One-to-many {algorithm} mismatch at {s}->{d}"
+
+
+@pytest.mark.parametrize("algorithm", ["mcs", "pathset", "sdp"])
+def test_series_parallel_reduction(germany17_data, algorithm):
+    """Reduction must not change availability for any pair."""
+    G, node_prob = germany17_data
+    plain = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm, reduce=False)
+    reduced = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm, reduce=True)
+
+    for p, r in zip(plain, reduced):
+        assert p[0] == r[0] and p[1] == r[1]
+        assert r[2] == pytest.approx(p[2], abs=TOL), f"Reduced {algorithm} mismatch at {p[0]}->{p[1]}"
+
+
+def test_series_parallel_reduction_structure():
+    """A chain and two parallel branches between s and t fold into one node."""
+    import networkx as nx
+    G = nx.Graph([(0, 1), (1, 2), (2, 5), (0, 3), (3, 5), (0, 4), (4, 5)])
+    A = {0: 0.9, 1: 0.8, 2: 0.7, 3: 0.6, 4: 0.5, 5: 0.95}
+
+    G_red, A_red, groups = pyrbd_suite.reduce_series_parallel(G, A, terminals=(0, 5))
+    assert len(G_red) == 3
+    (merged,) = set(G_red.nodes()) - {0, 5}
+    assert sorted(groups[merged]) == [1, 2, 3, 4]
+    assert A_red[merged] == pytest.approx(1 - (1 - 0.8 * 0.7) * (1 - 0.6) * (1 - 0.5))
+
+    expected = 0.9 * 0.95 * A_red[merged]
+    for algorithm in ["mcs", "pathset", "sdp"]:
+        avail = pyrbd_suite.evaluate_availability(G, A, algorithm=algorithm, src=0, dst=5)
+        assert avail[2] == pytest.approx(expected, abs=TOL)
+
+
+@pytest.mark.parametrize("algorithm", ["mcs", "pathset", "sdp"])
+def test_block_cut_tree_decomposition(algorithm):
+    """Block-by-block evaluation must match evaluation on the whole graph."""
+    import networkx as nx
+    G = nx.Graph([
+        (0, 1), (1, 2), (2, 3), (3, 0), (0, 2),     # block {0, 1, 2, 3}
+        (3, 4),                                     # bridge
+        (4, 5), (5, 6), (6, 4),                     # block {4, 5, 6}, shares 4
+        (6, 7), (7, 8), (8, 9), (9, 6), (7, 9),     # block {6, 7, 8, 9}, shares 6
+    ])
+    node_prob = {n: 0.9 - 0.02 * n for n in G.nodes()}
+
+    blocks, _, _ = pyrbd_suite.block_cut_tree(G)
+    assert len(blocks) == 4
+
+    whole = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm,
+                                              reduce=False, decompose=False)
+    blockwise = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm)
+
+    for w, b in zip(whole, blockwise):
+        assert w[0] == b[0] and w[1] == b[1]
+        assert b[2] == pytest.approx(w[2], abs=TOL), f"Decomposed {algorithm} mismatch at {w[0]}->{w[1]}"
+        single = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm, src=w[0], dst=w[1])
+        assert single[2] == pytest.approx(w[2], abs=TOL)
+
+
+def test_auto_algorithm(germany17_data, monkeypatch):
+    """algorithm='auto' must agree with a fixed engine and refuse over budget."""
+    G, node_prob = germany17_data
+
+    auto = pyrbd_suite.evaluate_availability(G, node_prob, algorithm="auto")
+    sdp = pyrbd_suite.evaluate_availability(G, node_prob, algorithm="sdp")
+    for a, s in zip(auto, sdp):
+        assert a[0] == s[0] and a[1] == s[1]
+        assert a[2] == pytest.approx(s[2], abs=TOL), f"Auto mismatch at {a[0]}->{a[1]}"
+
+    src, dst = sorted(G.nodes())[0], sorted(G.nodes())[-1]
+    estimate = pyrbd_suite.estimate_complexity(G, src, dst)
+    assert estimate["algorithm"] in estimate["costs"]
+
+    from pyrbd_suite import analysis
+    monkeypatch.setitem(analysis.AUTO_CONFIG, "max_seconds", 0.0)
+    with pytest.raises(ValueError):
+        pyrbd_suite.evaluate_availability(G, node_prob, algorithm="auto", src=src, dst=dst,
+                                          reduce=False, decompose=False)
+
+
+@pytest.mark.parametrize("algorithm", ["pathset", "sdp"])
+def test_bounded_availability(algorithm):
+    """Hop/latency-bounded availability must match state enumeration."""
+    import math
+    from itertools import combinations, product
+    import networkx as nx
+    G = nx.Graph([(0, 1), (1, 2), (2, 3), (0, 4), (4, 3), (4, 5), (5, 3), (1, 4), (2, 5)])
+    pos = {0: (0, 0), 1: (1, 1), 2: (2, 1), 3: (3, 0), 4: (1.5, -0.2), 5: (2.5, -1)}
+    node_prob = {n: 0.9 - 0.03 * n for n in G.nodes()}
+
+    def weight(u, v, _):
+        return math.dist(pos[u], pos[v])
+
+    def exact(src, dst, max_hops=None, max_latency=None):
+        nodes = sorted(G.nodes())
+        total = 0.0
+        for state in product((0, 1), repeat=len(nodes)):
+            up = G.subgraph(n for n, s in zip(nodes, state) if s)
+            if src not in up or dst not in up or not nx.has_path(up, src, dst):
+                continue
+            if max_hops is not None and nx.shortest_path_length(up, src, dst) > max_hops:
+                continue
+            if max_latency is not None and nx.shortest_path_length(up, src, dst, weight=weight) > max_latency:
+                continue
+            total += math.prod(node_prob[n] if s else 1 - node_prob[n] for n, s in zip(nodes, state))
+        return total
+
+    for bounds in [{"max_hops": 1}, {"max_hops": 2}, {"max_latency": 3.5}, {"max_hops": 3, "max_latency": 3.2}]:
+        results = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm,
+                                                    positions=pos, **bounds)
+        assert [(s, d) for s, d, _ in results] == list(combinations(sorted(G.nodes()), 2))
+        for s, d, avail in results:
+            assert avail == pytest.approx(exact(s, d, **bounds), abs=TOL), f"Bounded {algorithm} mismatch at {s}->{d} for {bounds}"
+
+    unbounded = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm, src=0, dst=3)
+    loose = pyrbd_suite.evaluate_availability(G, node_prob, algorithm=algorithm, src=0, dst=3, max_hops=len(G))
+    assert loose[2] == pytest.approx(unbounded[2], abs=TOL)
+
+    with pytest.raises(ValueError):
+        pyrbd_suite.evaluate_availability(G, node_prob, algorithm="mcs", src=0, dst=3, max_hops=2)
+
+
+def test_truncated_availability(germany17_data):
+    """Order-truncated MCS must bracket the exact availability within its error bound."""
+    G, _ = germany17_data
+    node_prob = {n: 0.99 - 0.002 * i for i, n in enumerate(sorted(G.nodes()))}
+    exact = {(s, d): a for s, d, a in pyrbd_suite.evaluate_availability(G, node_prob, algorithm="sdp")}
+
+    for max_order in (1, 2, 3):
+        results = pyrbd_suite.evaluate_availability(G, node_prob, algorithm="mcs", max_order=max_order)
+        assert [(s, d) for s, d, _, _ in results] == list(exact)
+        for s, d, avail, error in results:
+            assert 0.0 <= error <= 1.0
+            assert avail - error - TOL <= exact[(s, d)] <= avail + TOL, f"Truncated mcs out of bounds at {s}->{d} for order {max_order}"
+
+    src, dst = sorted(G.nodes())[:2]
+    full = pyrbd_suite.evaluate_availability(G, node_prob, algorithm="mcs", src=src, dst=dst, max_order=len(G))
+    assert full[2] == pytest.approx(exact[(src, dst)], abs=TOL)
+
+    with pytest.raises(ValueError):
+        pyrbd_suite.evaluate_availability(G, node_prob, algorithm="sdp", src=src, dst=dst, max_order=2)
+    with pytest.raises(ValueError):
+        pyrbd_suite.evaluate_availability(G, node_prob, algorithm="mcs", src=src, dst=dst, max_order=0)
+
+
+@pytest.mark.parametrize("algorithm", ["mcs", "pathset"])
+def test_probaset_debug(germany17_data, algorithm):
+    """Debug disjointing must report one round per term of the sum of disjoint products."""
+    from itertools import combinations
+    from pyrbd_suite.analysis import cpp
+    from pyrbd_suite.graph import graph_to_adjlist, relabel_graph_A_dict
+    G, _ = germany17_data
+
+    G_r, _, _ = relabel_graph_A_dict(G, {})
+    adj = graph_to_adjlist(G_r)
+    module = getattr(cpp, algorithm)
+
+    for src, dst in combinations(sorted(G_r.nodes()), 2):
+        if algorithm == "mcs":
+            problem_sets = cpp.sets.minimalcuts(adj, src, dst, len(adj))
+        else:
+            problem_sets = cpp.sets.minimalpaths(adj, src, dst)
+        terms = module.to_probaset(src, dst, problem_sets)
+        debug = module.to_probaset_debug(src, dst, problem_sets)
+        assert len(terms) - 1 <= len(debug) <= len(terms)
+        assert [debug[i][0] for i in range(len(debug))] == list(range(1, len(debug) + 1))
@@ -25,7 +25,9 @@ def test_minimal_paths(germany17_data):
 @pytest.mark.parametrize("method, legacy_pkg", [
     ("cnf_tree", "pyrbd3"),
     ("shannon", "pyrbd3"),
-    ("multiplication", "pyrbd3")
+    ("multiplication", "pyrbd3"),
+    ("combination", "pyrbd_plusplus"),
+    ("combination_matrix", "pyrbd_plusplus")
 ])
 def test_minimal_cuts(germany17_data, method, legacy_pkg):
     """Test mincut generation against corresponding legacy package implementations for all pairs."""
@@ -61,3 +63,224 @@ def test_minimal_cuts(germany17_data, method, legacy_pkg):
         else:
             old_cuts = func_map[method](G, src, dst)
             assert canonicalize(new_cuts) == canonicalize(old_cuts), f"Minimal cuts mismatch for {method} at {src}->{dst}!"
+
+
+def test_minimal_paths_parallel(germany17_data):
+    """Parallel path enumeration must return the sequential result in the same order."""
+    from itertools import combinations
+    G, _ = germany17_data
+
+    for src, dst in combinations(G.nodes(), 2):
+        seq_paths = pyrbd_suite.minimalpaths(G, src, dst)
+        par_paths = pyrbd_suite.minimalpaths(G, src, dst, parallel=True)
+        assert par_paths == seq_paths, f"Parallel minimal paths mismatch for {src}->{dst}!"
+
+def test_minimal_cuts_parallel(germany17_data):
+    """Task-parallel cnf_tree, shannon and multiplication must return the sequential result."""
+    from itertools import combinations
+    G, _ = germany17_data
+
+    for src, dst in combinations(G.nodes(), 2):
+        seq_cuts = pyrbd_suite.minimalcuts(G, src, dst)
+        par_cuts = pyrbd_suite.minimalcuts(G, src, dst, parallel=True)
+        assert par_cuts == seq_cuts, f"Parallel minimal cuts mismatch for {src}->{dst}!"
+        par_cuts = pyrbd_suite.minimalcuts(G, src, dst, method="multiplication", parallel=True)
+        assert par_cuts == seq_cuts, f"Parallel multiplication mismatch for {src}->{dst}!"
+        par_cuts = pyrbd_suite.minimalcuts(G, src, dst, method="shannon", parallel=True)
+        assert par_cuts == seq_cuts, f"Parallel shannon mismatch for {src}->{dst}!"
+
+def test_minimal_cuts_separators(germany17_data):
+    """Separator enumeration must list the cnf_tree cut sets in the same order."""
+    from itertools import permutations
+    G, _ = germany17_data
+
+    for src, dst in permutations(G.nodes(), 2):
+        assert pyrbd_suite.minimalcuts(G, src, dst, method="separators") == \
+            pyrbd_suite.minimalcuts(G, src, dst), f"Separators mismatch at {src}->{dst}!"
+
+def test_minimal_cuts_dualize(germany17_data):
+    """Dualisation of the path family must list the cnf_tree cut sets in the same order."""
+    from itertools import permutations
+    G, _ = germany17_data
+
+    for src, dst in permutations(G.nodes(), 2):
+        cuts = pyrbd_suite.minimalcuts(G, src, dst)
+        assert pyrbd_suite.minimalcuts(G, src, dst, method="dualize") == cuts, \
+            f"Dualize mismatch at {src}->{dst}!"
+        assert pyrbd_suite.minimalcuts(G, src, dst, method="dualize", max_order=2) == \
+            [c for c in cuts if len(c) <= 2]
+
+def test_minimal_cuts_shared_cache(germany17_data):
+    """A subproblem memo shared by all pairs must not change any cut family."""
+    from itertools import permutations
+    from pyrbd_suite.analysis import cpp
+    G, _ = germany17_data
+
+    cache = cpp.sets.TransversalCache()
+    small = cpp.sets.TransversalCache(max_bytes=4096)
+    for src, dst in permutations(G.nodes(), 2):
+        cuts = pyrbd_suite.minimalcuts(G, src, dst)
+        assert pyrbd_suite.minimalcuts(G, src, dst, cache=cache) == cuts
+        assert pyrbd_suite.minimalcuts(G, src, dst, parallel=True, cache=small) == cuts
+        assert small.bytes <= small.max_bytes
+
+    # Reversed pairs share their clause family
+    assert cache.hits > 0 and len(cache) > 0
+    cache.clear()
+    assert len(cache) == 0 and cache.bytes == 0
+
+def test_minimal_paths_all_pairs(germany17_data):
+    """Batched all-pairs enumeration must match per-pair enumeration."""
+    from itertools import combinations
+    from pyrbd_suite.analysis import cpp
+    from pyrbd_suite.graph import graph_to_adjlist, relabel_graph_A_dict
+    G, _ = germany17_data
+
+    G_r, _, _ = relabel_graph_A_dict(G, {})
+    adj = graph_to_adjlist(G_r)
+    node_pairs = list(combinations(sorted(G_r.nodes()), 2))
+
+    batched = cpp.sets.minimalpaths_all_pairs(adj, node_pairs)
+    assert len(batched) == len(node_pairs)
+    for (src, dst), paths in zip(node_pairs, batched):
+        assert paths == cpp.sets.minimalpaths(adj, src, dst), f"Batched minimal paths mismatch for {src}->{dst}!"
+
+def test_minimal_paths_from_source(germany17_data):
+    """Single-source enumeration must match per-destination enumeration."""
+    G, _ = germany17_data
+
+    for src in G.nodes():
+        paths_by_dst = pyrbd_suite.minimalpaths_from_source(G, src)
+        assert set(paths_by_dst) == set(G.nodes()) - {src}
+        for dst, paths in paths_by_dst.items():
+            assert paths == pyrbd_suite.minimalpaths(G, src, dst), f"Single-source minimal paths mismatch for {src}->{dst}!"
+
+def test_iter_minimal_paths(germany17_data):
+    """Streaming enumeration must match minimalpaths, including under caps."""
+    from itertools import combinations
+    G, _ = germany17_data
+
+    for src, dst in combinations(G.nodes(), 2):
+        paths = pyrbd_suite.minimalpaths(G, src, dst)
+        assert list(pyrbd_suite.iter_minimalpaths(G, src, dst, chunk_size=7)) == paths
+        assert pyrbd_suite.count_minimalpaths(G, src, dst) == (len(paths), True)
+
+        capped = list(pyrbd_suite.iter_minimalpaths(G, src, dst, max_paths=5))
+        assert capped == paths[:5]
+
+        short = [p for p in paths if len(p) <= 4]
+        assert list(pyrbd_suite.iter_minimalpaths(G, src, dst, max_length=4)) == short
+        assert pyrbd_suite.count_minimalpaths(G, src, dst, max_length=4) == (len(short), True)
+
+def test_set_family_csr(germany17_data):
+    """CSR families must hold the same sets as lists and expose NumPy views."""
+    from itertools import combinations
+    from pyrbd_suite.analysis import cpp
+    from pyrbd_suite.graph import graph_to_adjlist, relabel_graph_A_dict
+    G, _ = germany17_data
+
+    G_r, _, _ = relabel_graph_A_dict(G, {})
+    adj = graph_to_adjlist(G_r)
+
+    for src, dst in combinations(sorted(G_r.nodes()), 2):
+        paths = cpp.sets.minimalpaths(adj, src, dst)
+        family = cpp.sets.minimalpaths(adj, src, dst, as_family=True)
+        assert len(family) == len(paths)
+        assert family.to_list() == paths
+
+        elements, offsets = family.elements, family.offsets
+        assert elements.dtype == "int32" and not elements.flags.writeable
+        assert offsets[0] == 0 and offsets[-1] == len(elements)
+        assert [elements[offsets[i]:offsets[i + 1]].tolist() for i in range(len(family))] == paths
+
+    cuts = cpp.sets.minimalcuts(adj, 0, 16, len(adj))
+    assert cpp.sets.minimalcuts(adj, 0, 16, len(adj), as_family=True).to_list() == cuts
+    assert cpp.SetFamily(cuts).to_list() == cuts
+
+def test_family_size_estimators(germany17_data):
+    """Knuth probe estimates must track the true path and cut counts."""
+    from itertools import combinations
+    from pyrbd_suite.analysis import cpp
+    from pyrbd_suite.graph import graph_to_adjlist, relabel_graph_A_dict
+    G, _ = germany17_data
+
+    G_r, _, _ = relabel_graph_A_dict(G, {})
+    adj = graph_to_adjlist(G_r)
+
+    true_paths = est_paths = true_cuts = est_cuts = 0.0
+    for src, dst in combinations(sorted(G_r.nodes()), 2):
+        paths = cpp.sets.minimalpaths(adj, src, dst, as_family=True)
+        count, _, length = cpp.sets.estimate_path_count(adj, src, dst, probes=256, seed=1)
+        true_paths += len(paths)
+        est_paths += count
+        assert count > 0 and length >= 2
+
+        true_cuts += len(cpp.sets.minimalcuts(adj, src, dst, len(adj)))
+        est_cuts += cpp.sets.estimate_cut_count(paths, probes=256, seed=1)[0]
+
+    assert est_paths == pytest.approx(true_paths, rel=0.1)
+    assert est_cuts == pytest.approx(true_cuts, rel=0.1)
+
+def test_bounded_minimal_paths(germany17_data):
+    """Hop and latency bounds must prune to exactly the paths within the bound."""
+    import math
+    from itertools import combinations
+    G, _ = germany17_data
+    pos = {n: (d["X_coordinate"], d["Y_coordinate"]) for n, d in G.nodes(data=True)}
+
+    def latency(p):
+        return sum(math.dist(pos[u], pos[v]) for u, v in zip(p, p[1:]))
+
+    for src, dst in combinations(G.nodes(), 2):
+        paths = pyrbd_suite.minimalpaths(G, src, dst)
+        for max_hops in (1, 3, 5):
+            bounded = pyrbd_suite.minimalpaths(G, src, dst, max_hops=max_hops)
+            assert bounded == [p for p in paths if len(p) - 1 <= max_hops]
+        for max_latency in (400.0, 1000.0):
+            bounded = pyrbd_suite.minimalpaths(G, src, dst, max_latency=max_latency)
+            assert bounded == [p for p in paths if latency(p) <= max_latency]
+            assert bounded == pyrbd_suite.minimalpaths(G, src, dst, max_latency=max_latency,
+                                                       positions=pos)
+
+def test_minimal_cuts_from_paths(germany17_data):
+    """Cut sets from an enumerated path family must match those from the graph."""
+    from itertools import permutations
+    from pyrbd_suite.analysis import cpp
+    from pyrbd_suite.graph import graph_to_adjlist, relabel_graph_A_dict
+    G, _ = germany17_data
+
+    G_r, _, _ = relabel_graph_A_dict(G, {})
+    adj = graph_to_adjlist(G_r)
+    methods = ["cnf_tree", "shannon", "multiplication", "combination", "combination_matrix", "dualize"]
+
+    for src, dst in permutations(sorted(G_r.nodes()), 2):
+        family = cpp.sets.minimalpaths(adj, src, dst, as_family=True)
+        for method in methods:
+            cuts = cpp.sets.minimalcuts(adj, src, dst, len(adj), method)
+            assert cpp.sets.minimalcuts_from_paths(family, src, dst, method, len(adj)) == cuts, \
+                f"{method} from paths mismatch at {src}->{dst}!"
+        assert cpp.sets.minimalcuts_from_paths(family.to_list(), src, dst) == \
+            cpp.sets.minimalcuts(adj, src, dst, len(adj))
+
+    with pytest.raises(ValueError):
+        cpp.sets.minimalcuts_from_paths(family, src, dst, "separators")
+
+def test_shared_path_family(germany17_data):
+    """Path and cut engines evaluating one pair must share its path enumeration."""
+    from pyrbd_suite import analysis
+    G, A_dict = germany17_data
+    src, dst = sorted(G.nodes())[0], sorted(G.nodes())[-1]
+
+    analysis._path_cache.clear()
+    pyrbd_suite.minimalcuts(G, src, dst)
+    assert len(analysis._path_cache) == 1
+    pyrbd_suite.minimalpaths(G, src, dst)
+    assert len(analysis._path_cache) == 1
+
+    analysis._path_cache.clear()
+    pyrbd_suite.evaluate_availability(G, A_dict, algorithm="mcs", src=src, dst=dst)
+    enumerated = len(analysis._path_cache)
+    assert enumerated > 0
+    for algorithm in ("pathset", "sdp"):
+        pyrbd_suite.evaluate_availability(G, A_dict, algorithm=algorithm, src=src, dst=dst)
+    assert len(analysis._path_cache) == enumerated